@@ -58,6 +58,8 @@ def setup_wandb_env_variables(monkeypatch: pytest.MonkeyPatch) -> None:
     # Set the _network_buffer setting to 1000 to increase the likelihood
     # of triggering flow control logic.
     monkeypatch.setenv("WANDB_X_NETWORK_BUFFER", "1000")
+    # Don't share schema introspection results between tests.
+    monkeypatch.setenv("WANDB_X_INTROSPECTION_CACHE_TTL", "0")
 
 
 @pytest.fixture(autouse=True)
@@ -6,7 +6,6 @@ from unittest import mock
 import pytest
 import tqdm
 import wandb
-import wandb.sdk.lib.redirect
 import wandb.util
 from click.testing import CliRunner
 from wandb.cli import cli
@@ -172,12 +171,8 @@ def test_very_long_output(user):
 
 @pytest.mark.skip_wandb_core(reason="wrap_emu mode not implemented in core")
 def test_no_numpy(wandb_backend_spy):
-    with mock.patch.object(
-        wandb.wandb_sdk.lib.redirect,
-        "np",
-        wandb.sdk.lib.redirect._Numpy(),
-    ):
-        # Use "wrap_emu" to make sure TerminalEmulator's usage of _Numpy works.
+    with mock.patch.dict("sys.modules", {"numpy": None}):
+        # Use "wrap_emu" to make sure the TerminalEmulator works without numpy.
         with wandb.init(settings={"console": "wrap_emu"}) as run:
             print("\x1b[31m\x1b[40m\x1b[1mHello\x01\x1b[22m\x1b[39m")  # noqa: T201
 
@@ -1,4 +1,7 @@
-from wandb.sdk.internal import tb_watcher
+import struct
+
+import pytest
+from wandb.sdk.internal import tb_watcher, tfrecord
 
 
 class TestIsTfEventsFileCreatedBy:
@@ -59,3 +62,133 @@ class TestIsTfEventsFileCreatedBy:
             tb_watcher.is_tfevents_file_created_by("me.193.tfevents", "me", 193)
             is False
         )
+
+
+def _write_events(path, events):
+    from tensorboard.summary.writer.record_writer import RecordWriter
+
+    with open(path, "ab") as f:
+        writer = RecordWriter(f)
+        for event in events:
+            writer.write(event.SerializeToString())
+
+
+def _scalar_event(step, **values):
+    from tensorboard.compat.proto import event_pb2
+
+    event = event_pb2.Event(wall_time=1.0, step=step)
+    for tag, value in values.items():
+        event.summary.value.add(tag=tag, simple_value=value)
+    return event
+
+
+class TestTFRecordReader:
+    def test_reads_records_as_they_are_completed(self, tmp_path):
+        path = str(tmp_path / "events.out.tfevents.1.me")
+        _write_events(path, [_scalar_event(0, loss=1.0), _scalar_event(1, loss=0.5)])
+        with open(path, "rb") as f:
+            data = f.read()
+        reader = tfrecord.TFRecordReader(path)
+
+        with open(path, "wb") as f:
+            f.write(data[:-3])
+        assert list(reader.records()) == [
+            _scalar_event(0, loss=1.0).SerializeToString()
+        ]
+
+        with open(path, "wb") as f:
+            f.write(data)
+        assert list(reader.records()) == [
+            _scalar_event(1, loss=0.5).SerializeToString()
+        ]
+        assert reader.offset == len(data)
+
+    def test_corrupt_record(self, tmp_path):
+        path = str(tmp_path / "events.out.tfevents.1.me")
+        _write_events(path, [_scalar_event(0, loss=1.0)])
+        with open(path, "r+b") as f:
+            f.seek(tfrecord.TFRECORD_HEADER_LEN)
+            f.write(b"\xff")
+
+        with pytest.raises(tfrecord.CorruptRecordError):
+            list(tfrecord.TFRecordReader(path).records())
+
+    def test_masked_crc32c(self):
+        assert tfrecord.crc32c(b"123456789") == 0xE3069283
+        assert tfrecord._crc32c_python(b"123456789") == 0xE3069283
+        assert tfrecord.masked_crc32c(b"") == 0xA282EAD8
+
+
+class TestScalarsToSimpleValues:
+    def test_scalar_tensors(self):
+        from tensorboard.compat.proto import summary_pb2
+        from tensorboard.compat.proto.tensor_pb2 import TensorProto
+
+        summary = summary_pb2.Summary()
+        summary.value.add(tag="a", simple_value=1.0)
+        summary.value.add(tag="b", tensor=TensorProto(dtype=1, float_val=[2.0]))
+        value = summary.value.add(
+            tag="c",
+            tensor=TensorProto(dtype=1, tensor_content=struct.pack("<f", 3.0)),
+        )
+        value.metadata.plugin_data.plugin_name = "scalars"
+
+        assert tb_watcher._scalars_to_simple_values(summary)
+        assert [v.simple_value for v in summary.value] == [1.0, 2.0, 3.0]
+
+    def test_other_values_are_left_unchanged(self):
+        from tensorboard.compat.proto import summary_pb2
+        from tensorboard.compat.proto.tensor_pb2 import TensorProto
+
+        summary = summary_pb2.Summary()
+        summary.value.add(tag="a", tensor=TensorProto(dtype=1, float_val=[2.0]))
+        value = summary.value.add(
+            tag="b", tensor=TensorProto(dtype=1, float_val=[1.0, 2.0])
+        )
+        value.tensor.tensor_shape.dim.add(size=2)
+
+        assert not tb_watcher._scalars_to_simple_values(summary)
+        assert summary.value[0].WhichOneof("value") == "tensor"
+
+
+class TestTFEventsTailer:
+    def test_reads_appended_events(self, tmp_path):
+        path = str(tmp_path / "events.out.tfevents.1.me")
+        _write_events(path, [_scalar_event(0, loss=1.0)])
+        (tmp_path / "other.txt").write_text("not events")
+        new_files = []
+        tailer = tb_watcher.TFEventsTailer(
+            str(tmp_path), lambda p: "tfevents" in p, new_files.append
+        )
+
+        assert [e.step for e in tailer.Load()] == [0]
+        assert list(tailer.Load()) == []
+
+        _write_events(path, [_scalar_event(1, loss=0.5), _scalar_event(2, loss=0.2)])
+        events = list(tailer.Load())
+
+        assert [e.step for e in events] == [1, 2]
+        assert events[1].summary.value[0].simple_value == pytest.approx(0.2)
+        assert new_files == [path]
+
+    def test_caught_up_only_at_end_of_complete_records(self, tmp_path):
+        path = str(tmp_path / "events.out.tfevents.1.me")
+        tailer = tb_watcher.TFEventsTailer(
+            str(tmp_path), lambda p: "tfevents" in p, lambda p: None
+        )
+
+        list(tailer.Load())
+        assert not tailer.caught_up
+
+        _write_events(path, [_scalar_event(0, loss=1.0)])
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[:-3])
+        list(tailer.Load())
+        assert not tailer.caught_up
+
+        with open(path, "wb") as f:
+            f.write(data)
+        list(tailer.Load())
+        assert tailer.caught_up
@@ -0,0 +1,70 @@
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from wandb.sdk.artifacts.artifact import Artifact
+from wandb.sdk.lib import digest_cache as digest_cache_module
+from wandb.sdk.lib.hashutil import md5_file_b64
+
+
+def write_old_file(path: Path, content: str, age: float = 3600) -> Path:
+    path.write_text(content)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def count_hashes():
+    with mock.patch.object(
+        digest_cache_module, "md5_file_b64", wraps=md5_file_b64
+    ) as hasher:
+        yield hasher
+
+
+def test_digest_cache_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("WANDB_X_DIGEST_CACHE", raising=False)
+    cache = digest_cache_module.get_digest_cache()
+    assert cache is digest_cache_module._no_digest_cache
+
+
+def test_add_dir_twice_hashes_once(monkeypatch, tmp_path, count_hashes):
+    monkeypatch.setenv("WANDB_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("WANDB_X_DIGEST_CACHE", "true")
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for i in range(3):
+        write_old_file(data_dir / f"file{i}.txt", str(i))
+
+    with mock.patch(
+        "wandb.sdk.artifacts.artifact.md5_file_b64", wraps=md5_file_b64
+    ) as staged_hashes:
+        first = Artifact("dataset", type="dataset")
+        first.add_dir(str(data_dir))
+        second = Artifact("dataset", type="dataset")
+        second.add_dir(str(data_dir))
+
+    assert staged_hashes.call_count + count_hashes.call_count == 3
+    assert first.digest == second.digest
+    digest_cache_module.get_digest_cache().close()
+
+
+def test_verify_rehashes_cached_files(monkeypatch, tmp_path, count_hashes):
+    monkeypatch.setenv("WANDB_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("WANDB_X_DIGEST_CACHE", "true")
+    root = tmp_path / "root"
+    root.mkdir()
+    path = write_old_file(root / "file.txt", "content")
+    artifact = Artifact("dataset", type="dataset")
+    artifact.add_file(str(path))
+    stat = os.stat(path)
+
+    # Corrupt the file without changing its size or modification time.
+    path.write_text("CONTENT")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    with mock.patch.object(Artifact, "is_draft", return_value=False):
+        with pytest.raises(ValueError, match="Digest mismatch"):
+            artifact.verify(root=str(root))
+    digest_cache_module.get_digest_cache().close()
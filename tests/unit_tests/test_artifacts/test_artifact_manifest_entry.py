@@ -2,6 +2,7 @@ import base64
 import os
 from logging import getLogger
 from pathlib import Path, PurePath
+from unittest.mock import Mock
 
 from wandb.sdk.artifacts.artifact import Artifact
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
@@ -72,3 +73,30 @@ def test_manifest_download(monkeypatch):
     short_entry.path = default_cache
     fpath = PurePath(short_entry.download(root=abspath_to_cur_dir, skip_cache=True))
     assert fpath.parts[-3:] == ("unit_tests", "test_artifacts", "default_cache")
+
+
+def test_manifest_download_hardlinks_from_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("WANDB_X_ARTIFACT_LINK_MODE", "hardlink")
+    cache_path = tmp_path / "cache" / "obj"
+    cache_path.parent.mkdir()
+    cache_path.write_text("content")
+
+    artifact = Artifact("mnist", type="dataset")
+    entry = ArtifactManifestEntry(path="data.txt", digest="digest")
+    entry._parent_artifact = artifact
+    monkeypatch.setattr(
+        artifact.manifest.storage_policy,
+        "load_file",
+        lambda x, y, **kwargs: str(cache_path),
+    )
+
+    root = tmp_path / "root"
+    dest_path = entry.download(root=str(root))
+    assert os.path.samefile(dest_path, cache_path)
+
+    # The linked file is not hashed again on the next download.
+    monkeypatch.setattr(
+        "wandb.sdk.lib.digest_cache.md5_file_b64",
+        Mock(side_effect=AssertionError("unexpected hash")),
+    )
+    assert os.path.samefile(entry.download(root=str(root)), cache_path)
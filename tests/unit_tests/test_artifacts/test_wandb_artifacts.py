@@ -1,4 +1,5 @@
 import functools
+import hashlib
 import queue
 import shutil
 import unittest.mock as mock
@@ -15,6 +16,10 @@ from wandb.sdk.artifacts.artifact_instance_cache import artifact_instance_cache
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
 from wandb.sdk.artifacts.artifact_state import ArtifactState
 from wandb.sdk.artifacts.exceptions import ArtifactNotLoggedError
+from wandb.sdk.artifacts.storage_policies._multipart import (
+    FilePart,
+    MultipartUploadState,
+)
 from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
 
 if TYPE_CHECKING:
@@ -355,12 +360,15 @@ class TestStoreFile:
         hex_digests = {1: "abc1", 2: "abc2", 3: "abc3"}
         chunk_size = 1
         policy = WandbStoragePolicy(api=api)
-        responses = []
+        responses = {}
         for idx in range(1, len(hex_digests) + 1):
             etag_response = requests.Response()
             etag_response.headers = {"ETag": hex_digests[idx]}
-            responses.append(etag_response)
-        api.upload_multipart_file_chunk_retry.side_effect = responses
+            responses[multipart_parts[idx]] = etag_response
+        # Parts are uploaded concurrently, so respond by url rather than call order.
+        api.upload_multipart_file_chunk_retry.side_effect = (
+            lambda url, *args, **kwargs: responses[url]
+        )
 
         with mock.patch("builtins.open", mock.mock_open(read_data="abc")):
             etags = policy.s3_multipart_file_upload(
@@ -372,6 +380,123 @@ class TestStoreFile:
             for etag in etags:
                 assert etag["hexMD5"] == hex_digests[etag["partNumber"]]
 
+    def test_s3_multipart_file_upload_resumes(self, api, tmp_path: Path):
+        example_file = tmp_path / "example.bin"
+        example_file.write_bytes(b"aabbccdd")
+        multipart_parts = {n: f"http://wandb-test/part={n}" for n in range(1, 5)}
+        hex_digests = _hash_parts(example_file.read_bytes(), chunk_size=2)
+
+        def upload_chunk(url, data, extra_headers):
+            response = requests.Response()
+            response.headers = {"ETag": f"etag-{data.read().decode()}"}
+            return response
+
+        api.upload_multipart_file_chunk_retry.side_effect = upload_chunk
+        state = MultipartUploadState(
+            "my-digest", 8, chunk_size=2, state_dir=str(tmp_path)
+        )
+        state.start("upload-id")
+        state.part_done(1, "etag-aa")
+        state.part_done(3, "etag-cc")
+
+        resumed = MultipartUploadState(
+            "my-digest", 8, chunk_size=2, state_dir=str(tmp_path)
+        )
+        resumed.start("upload-id")
+        policy = WandbStoragePolicy(api=api)
+        etags = policy.s3_multipart_file_upload(
+            str(example_file),
+            2,
+            hex_digests,
+            multipart_parts,
+            extra_headers={},
+            upload_state=resumed,
+        )
+
+        uploaded = {
+            call.args[0]
+            for call in api.upload_multipart_file_chunk_retry.call_args_list
+        }
+        assert uploaded == {multipart_parts[2], multipart_parts[4]}
+        assert etags == [
+            {"partNumber": 1, "hexMD5": "etag-aa"},
+            {"partNumber": 2, "hexMD5": "etag-bb"},
+            {"partNumber": 3, "hexMD5": "etag-cc"},
+            {"partNumber": 4, "hexMD5": "etag-dd"},
+        ]
+
+    def test_file_part_reads_and_rewinds(self, tmp_path: Path):
+        example_file = tmp_path / "example.bin"
+        example_file.write_bytes(b"aabbccdd")
+
+        with FilePart(str(example_file), 2, 4) as part:
+            assert part.read(3) == b"bbc"
+            assert part.read() == b"c"
+            assert part.read() == b""
+            part.seek(0)
+            assert part.read() == b"bbcc"
+
+    def test_store_file_removes_state_of_deduped_file(
+        self, api, example_file: Path, tmp_path: Path
+    ):
+        preparer = mock_preparer(
+            prepare=lambda spec: singleton_queue(
+                dummy_response_prepare(spec)._replace(upload_url=None)
+            )
+        )
+        size = example_file.stat().st_size
+        with mock.patch(
+            "wandb.sdk.artifacts.storage_policies.wandb_storage_policy."
+            "S3_MIN_MULTI_UPLOAD_SIZE",
+            size,
+        ), mock.patch(
+            "wandb.sdk.artifacts.storage_policies._multipart.get_upload_state_dir",
+            return_value=str(tmp_path / "uploads"),
+        ):
+            deduped = self._store_file(
+                WandbStoragePolicy(api=api),
+                entry_local_path=example_file,
+                preparer=preparer,
+            )
+
+        assert deduped
+        assert not list((tmp_path / "uploads").glob("*.json"))
+
+    def test_multipart_upload_state_new_upload_id(self, tmp_path: Path):
+        state = MultipartUploadState("digest", 8, chunk_size=2, state_dir=str(tmp_path))
+        state.set_hex_digests({1: "aa", 2: "bb"})
+        state.start("upload-1")
+        state.part_done(1, "etag-1")
+
+        reloaded = MultipartUploadState(
+            "digest", 8, chunk_size=2, state_dir=str(tmp_path)
+        )
+        assert reloaded.hex_digests == {1: "aa", 2: "bb"}
+        assert reloaded.etags == {1: "etag-1"}
+        reloaded.start("upload-2")
+        assert reloaded.etags == {}
+
+        other = MultipartUploadState("digest", 8, chunk_size=4, state_dir=str(tmp_path))
+        assert other.hex_digests == {}
+
+        reloaded.remove()
+        assert not Path(reloaded.path).exists()
+
+    def test_hash_parts(self, api, tmp_path: Path):
+        example_file = tmp_path / "example.bin"
+        example_file.write_bytes(b"aabbccd")
+        policy = WandbStoragePolicy(api=api)
+        assert policy._hash_parts(str(example_file), 7, 2) == _hash_parts(
+            b"aabbccd", chunk_size=2
+        )
+
+
+def _hash_parts(data: bytes, chunk_size: int):
+    return {
+        n + 1: hashlib.md5(data[i : i + chunk_size]).hexdigest()
+        for n, i in enumerate(range(0, len(data), chunk_size))
+    }
+
 
 @pytest.mark.parametrize("type", ["job", "wandb-history", "wandb-foo"])
 def test_invalid_artifact_type(type):
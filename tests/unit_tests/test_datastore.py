@@ -149,3 +149,274 @@ def test_data_write_fill(with_datastore):
         expected_records=records,
         expected_record_sizes=lengths,
     )
+
+
+@pytest.fixture()
+def fsync_calls(monkeypatch):
+    calls = []
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        calls.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(datastore.os, "fsync", fsync)
+    return calls
+
+
+def open_datastore(**kwargs):
+    try:
+        os.unlink(FNAME)
+    except FileNotFoundError:
+        pass
+    ds = datastore.DataStore(**kwargs)
+    ds.open_for_write(FNAME)
+    return ds
+
+
+def test_sync_mode_invalid(force_internal_process):
+    with pytest.raises(ValueError):
+        datastore.DataStore(sync_mode="sometimes")
+
+
+def test_sync_mode_block(force_internal_process, fsync_calls):
+    """Only records ending on a block boundary are synced."""
+    ds = open_datastore()
+    ds._write_data(b"\x01" * 100)
+    assert fsync_calls == []
+    _, end, flush = ds._write_data(b"\x02" * 32768)
+    assert len(fsync_calls) == 1
+    assert flush == end
+    ds.close()
+    os.unlink(FNAME)
+
+
+def test_sync_mode_always(force_internal_process, fsync_calls):
+    ds = open_datastore(sync_mode="always")
+    for _ in range(3):
+        _, end, flush = ds._write_data(b"\x01" * 100)
+        assert flush == end
+    assert len(fsync_calls) == 3
+    ds.close()
+    os.unlink(FNAME)
+
+
+def test_sync_mode_none(force_internal_process, fsync_calls):
+    ds = open_datastore(sync_mode="none")
+    _, end, flush = ds._write_data(b"\x01" * 32768 * 2)
+    assert flush == end
+    ds.close()
+    os.unlink(FNAME)
+    assert fsync_calls == []
+
+
+def test_sync_mode_group_bytes(force_internal_process, fsync_calls):
+    """Writes are combined into one sync per byte window."""
+    ds = open_datastore(sync_mode="group", sync_interval=3600, sync_bytes=1000)
+    offsets = [ds._write_data(b"\x01" * 93) for _ in range(25)]
+    # each record takes 100 bytes, so a sync happens every 10 records
+    assert len(fsync_calls) == 2
+    assert ds.flush_offset == offsets[19][1]
+    ds.close()
+    assert len(fsync_calls) == 3
+    os.unlink(FNAME)
+
+
+def test_sync_mode_group_interval(force_internal_process, fsync_calls, monkeypatch):
+    """Pending writes are synced once the time window expires."""
+    now = [0.0]
+    monkeypatch.setattr(datastore.time, "monotonic", lambda: now[0])
+    ds = open_datastore(sync_mode="group", sync_interval=1.0, sync_bytes=1 << 30)
+    ds._write_data(b"\x01" * 32768 * 2)
+    assert fsync_calls == []
+    assert ds.commit(force=False) == 0
+    now[0] = 1.5
+    _, end, _ = ds._write_data(b"\x01" * 10)
+    assert len(fsync_calls) == 1
+    assert ds.flush_offset == end
+    assert ds.commit(force=False) == end
+    assert len(fsync_calls) == 1
+    ds.close()
+    os.unlink(FNAME)
+
+
+def write_records(records):
+    ds = open_datastore()
+    for record in records:
+        ds.write(record)
+    ds.close()
+
+
+def make_history_record(step, size=1):
+    record = wandb_internal_pb2.Record()
+    item = record.history.item.add()
+    item.key = "x"
+    item.value_json = json.dumps("a" * size)
+    record.history.step.num = step
+    return record
+
+
+def test_mmap_scan(force_internal_process):
+    records = [make_history_record(i, size=i * 997) for i in range(100)]
+    write_records(records)
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        payloads = [bytes(data) for data in scanner.scan()]
+        assert not scanner.truncated
+    os.unlink(FNAME)
+
+    assert payloads == [record.SerializeToString() for record in records]
+
+
+def test_mmap_scan_truncated(force_internal_process):
+    records = [make_history_record(i, size=100) for i in range(10)]
+    write_records(records)
+    size = os.stat(FNAME).st_size
+    with open(FNAME, "r+b") as f:
+        f.truncate(size - 10)
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        assert len(list(scanner.scan())) == 9
+        assert scanner.truncated
+    os.unlink(FNAME)
+
+
+def test_mmap_scan_corrupt(force_internal_process):
+    write_records([make_history_record(0, size=100)])
+    with open(FNAME, "r+b") as f:
+        f.seek(20)
+        f.write(b"\xff")
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        with pytest.raises(AssertionError):
+            list(scanner.scan())
+    os.unlink(FNAME)
+
+
+def test_mmap_index(force_internal_process):
+    records = []
+    for i in range(50):
+        records.append(make_history_record(i, size=i * 1500))
+        summary = wandb_internal_pb2.Record()
+        summary.summary.update.add(key="step", value_json=str(i))
+        records.append(summary)
+    exit_record = wandb_internal_pb2.Record()
+    exit_record.exit.exit_code = 3
+    records.append(exit_record)
+    write_records(records)
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        index = scanner.build_index()
+        assert len(index.offsets["history"]) == 50
+        assert len(index.offsets["summary"]) == 50
+        assert index.end_offset == scanner.size
+
+        last_summary = wandb_internal_pb2.Record()
+        last_summary.ParseFromString(scanner.last("summary"))
+        assert last_summary.summary.update[0].value_json == "49"
+
+        last_exit = wandb_internal_pb2.Record()
+        last_exit.ParseFromString(scanner.last("exit"))
+        assert last_exit.exit.exit_code == 3
+        assert scanner.last("artifact") is None
+
+    # the sidecar index is reused
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        assert scanner.load_index().to_dict() == index.to_dict()
+
+    os.unlink(FNAME + datastore.DATASTORE_INDEX_SUFFIX)
+    os.unlink(FNAME)
+
+
+def test_mmap_last_does_not_write_index(force_internal_process):
+    write_records([make_history_record(0), make_history_record(1)])
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        last_history = wandb_internal_pb2.Record()
+        last_history.ParseFromString(scanner.last("history"))
+        assert last_history.history.step.num == 1
+        assert not os.path.exists(scanner.index_fname)
+    os.unlink(FNAME)
+
+
+def test_mmap_index_extended_after_append(force_internal_process):
+    write_records([make_history_record(i, size=100) for i in range(10)])
+    with open(FNAME, "rb") as f:
+        contents = f.read()
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        offsets = [offset for offset, _ in scanner.scan_with_offsets()]
+    with open(FNAME, "r+b") as f:
+        f.truncate(offsets[5])
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        assert scanner.build_index().offsets["history"] == offsets[:5]
+    with open(FNAME, "r+b") as f:
+        f.write(contents)
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        assert scanner.load_index() is not None
+        assert scanner.build_index().offsets["history"] == offsets
+
+    os.unlink(FNAME + datastore.DATASTORE_INDEX_SUFFIX)
+    os.unlink(FNAME)
+
+
+def test_mmap_index_rejected_after_rewrite(force_internal_process):
+    write_records([make_history_record(i, size=100) for i in range(10)])
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        scanner.build_index()
+    # rewrite the log in place with different records of the same size
+    os.unlink(FNAME)
+    write_records([make_history_record(i + 10, size=100) for i in range(10)])
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        assert scanner.load_index() is None
+        last_history = wandb_internal_pb2.Record()
+        last_history.ParseFromString(scanner.last("history"))
+        assert last_history.history.step.num == 19
+
+    os.unlink(FNAME + datastore.DATASTORE_INDEX_SUFFIX)
+    os.unlink(FNAME)
+
+
+def test_mmap_scan_invalid_padding(force_internal_process):
+    ds = open_datastore()
+    # leave 3 bytes of padding at the end of the first block
+    ds._write_data(b"\x01" * (datastore.LEVELDBLOG_BLOCK_LEN - 17))
+    ds._write_data(b"\x02")
+    ds.close()
+    with open(FNAME, "r+b") as f:
+        f.seek(datastore.LEVELDBLOG_BLOCK_LEN - 2)
+        f.write(b"\xff")
+
+    with datastore.MmapDataStoreScanner(FNAME) as scanner:
+        with pytest.raises(AssertionError, match="invalid padding"):
+            list(scanner.scan())
+    with datastore.MmapDataStoreScanner(FNAME, verify=False) as scanner:
+        assert len(list(scanner.scan())) == 2
+    os.unlink(FNAME)
+
+
+@pytest.mark.parametrize(
+    "name, value, getter, default",
+    [
+        ("WANDB_X_DATASTORE_SYNC_MODE", "bogus", "get_datastore_sync_mode", "block"),
+        ("WANDB_X_DATASTORE_SYNC_INTERVAL", "1s", "get_datastore_sync_interval", 1.0),
+        ("WANDB_X_DATASTORE_SYNC_INTERVAL", "-1", "get_datastore_sync_interval", 1.0),
+        ("WANDB_X_DATASTORE_SYNC_BYTES", "4MB", "get_datastore_sync_bytes", 4 << 20),
+    ],
+)
+def test_sync_settings_invalid_env(monkeypatch, name, value, getter, default):
+    monkeypatch.setenv(name, value)
+
+    assert getattr(wandb.env, getter)() == default
+
+
+def test_sync_settings_env(monkeypatch):
+    monkeypatch.setenv("WANDB_X_DATASTORE_SYNC_MODE", "Group")
+    monkeypatch.setenv("WANDB_X_DATASTORE_SYNC_INTERVAL", "0.5")
+    monkeypatch.setenv("WANDB_X_DATASTORE_SYNC_BYTES", "1024")
+
+    assert wandb.env.get_datastore_sync_mode() == datastore.DATASTORE_SYNC_GROUP
+    assert wandb.env.get_datastore_sync_interval() == 0.5
+    assert wandb.env.get_datastore_sync_bytes() == 1024
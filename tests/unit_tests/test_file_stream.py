@@ -1,11 +1,15 @@
+import gzip
 import itertools
+import json
 import os
 import random
 import string
 from dataclasses import dataclass
+from unittest.mock import MagicMock
 
+import requests
 from wandb import util
-from wandb.sdk.internal.file_stream import CRDedupeFilePolicy
+from wandb.sdk.internal.file_stream import CRDedupeFilePolicy, FileStreamApi
 from wandb.sdk.lib.file_stream_utils import split_files
 
 
@@ -188,3 +192,89 @@ def test_crdedupe_process_chunks():
     files["output.log"] = ret
     file_requests = list(split_files(files, max_bytes=util.MAX_LINE_BYTES))
     assert 2 == len(file_requests)
+
+
+def _file_stream_api(compression):
+    api = MagicMock()
+    api.client.transport.headers = {}
+    api.client.transport.cookies = {}
+    api.client.transport.session.proxies = {}
+    api.settings.return_value = {
+        "base_url": "https://api.wandb.test",
+        "entity": "entity",
+        "project": "project",
+    }
+    fs = FileStreamApi(api, "run_id", start_time=0, compression=compression)
+    fs._client = MagicMock()
+    return fs
+
+
+def _http_error(status_code, text=""):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode()
+    return requests.exceptions.HTTPError(response=response)
+
+
+def _payload():
+    return {"files": {"wandb-history.jsonl": {"offset": 0, "content": ["{}"] * 1000}}}
+
+
+def test_post_uncompressed():
+    fs = _file_stream_api(None)
+    fs._post(_payload())
+    assert fs._client.post.call_args.kwargs["json"] == _payload()
+
+
+def test_post_gzip():
+    fs = _file_stream_api("gzip")
+    fs._post(_payload())
+    kwargs = fs._client.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == _payload()
+
+
+def test_post_small_payload_not_compressed():
+    fs = _file_stream_api("gzip")
+    fs._post({"complete": False})
+    kwargs = fs._client.post.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert json.loads(kwargs["data"]) == {"complete": False}
+
+
+def test_post_compression_rejected_falls_back():
+    fs = _file_stream_api("gzip")
+    fs._client.post.side_effect = [_http_error(415), MagicMock()]
+    fs._post(_payload())
+    assert fs._client.post.call_count == 2
+    kwargs = fs._client.post.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert json.loads(kwargs["data"]) == _payload()
+    assert fs._compression is None
+
+
+def test_post_encoding_bad_request_falls_back():
+    fs = _file_stream_api("gzip")
+    fs._client.post.side_effect = [
+        _http_error(400, "unsupported Content-Encoding: gzip"),
+        MagicMock(),
+    ]
+    fs._post(_payload())
+    assert fs._client.post.call_count == 2
+    assert fs._compression is None
+
+
+def test_post_unrelated_error_keeps_compression():
+    fs = _file_stream_api("gzip")
+    fs._client.post.side_effect = [_http_error(400, "chunk too large")]
+    response = fs._post(_payload())
+    assert isinstance(response, requests.exceptions.HTTPError)
+    # The same payload isn't posted again uncompressed.
+    assert fs._client.post.call_count == 1
+    assert fs._compression == "gzip"
+
+
+def test_zstd_without_zstandard_uses_gzip(monkeypatch):
+    monkeypatch.setattr(util, "get_module", lambda *args, **kwargs: None)
+    fs = _file_stream_api("zstd")
+    assert fs._compression == "gzip"
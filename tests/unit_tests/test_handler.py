@@ -43,3 +43,83 @@ def test_handle_bigint(test_settings):
     assert sampled_history["ints"] == [1]
     assert len(sampled_history["floats"]) == 2
     assert len(sampled_history["bigint"]) == 0
+
+
+def test_handle_sampled_history_reservoir(test_settings, monkeypatch):
+    monkeypatch.setenv("WANDB_X_SAMPLED_HISTORY_MODE", "reservoir")
+    monkeypatch.setenv("WANDB_X_SAMPLED_HISTORY_KEYS", "skip/*=0")
+    result_q = queue.Queue()
+    settings = test_settings({})
+    hm = handler.HandleManager(
+        settings=settings_static.SettingsStatic(settings.to_proto()),
+        record_q=MagicMock(),
+        result_q=result_q,
+        stopped=MagicMock(),
+        writer_q=MagicMock(),
+        interface=MagicMock(),
+        context_keeper=MagicMock(),
+    )
+    assert isinstance(hm._sampled_history, sample.ReservoirSampleStore)
+
+    for step in range(1000):
+        hm._save_history({"ints": step, "floats": step / 2, "skip/me": step})
+
+    record = pb.Record()
+    record.request.sampled_history.CopyFrom(pb.SampledHistoryRequest())
+    hm.handle(record)
+    result = result_q.get()
+
+    history = {
+        item.key: list(item.values_float or item.values_int)
+        for item in result.response.sampled_history_response.item
+    }
+    assert set(history) == {"ints", "floats"}
+    assert len(history["ints"]) == 64
+    assert history["ints"] == sorted(history["ints"])
+    assert len(history["floats"]) == 64
+
+
+def test_handle_history_samples_numbers(test_settings):
+    settings = test_settings({})
+    hm = handler.HandleManager(
+        settings=settings_static.SettingsStatic(settings.to_proto()),
+        record_q=MagicMock(),
+        result_q=queue.Queue(),
+        stopped=MagicMock(),
+        writer_q=MagicMock(),
+        interface=MagicMock(),
+        context_keeper=MagicMock(),
+    )
+
+    record = pb.Record()
+    record.history.item.add(key="loss", value_json="0.5")
+    record.history.item.add(key="name", value_json='"text"')
+    hm.handle(record)
+
+    assert list(hm._sampled_history["loss"].get()) == [0.5]
+    assert list(hm._sampled_history["_step"].get()) == [0]
+    assert "name" not in hm._sampled_history
+
+
+def test_handle_summary_sends_updated_keys(test_settings):
+    settings = test_settings({})
+    hm = handler.HandleManager(
+        settings=settings_static.SettingsStatic(settings.to_proto()),
+        record_q=MagicMock(),
+        result_q=queue.Queue(),
+        stopped=MagicMock(),
+        writer_q=MagicMock(),
+        interface=MagicMock(),
+        context_keeper=MagicMock(),
+    )
+    hm._save_summary = MagicMock()
+    hm._consolidated_summary = {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
+
+    record = pb.Record()
+    record.summary.update.add(key="a", value_json="5")
+    record.summary.remove.add(nested_key=["b", "c"])
+    record.summary.remove.add(key="e")
+    hm.handle_summary(record)
+
+    hm._save_summary.assert_called_once_with({"a": 5, "b": {"d": 3}})
+    assert hm._consolidated_summary == {"a": 5, "b": {"d": 3}}
@@ -95,6 +95,80 @@ def test_download_write_file_fetches_iff_file_checksum_mismatched(
             assert response is None
 
 
+def _file_metadata(name: str, contents: str) -> dict:
+    return {
+        "name": name,
+        "url": f"https://example.com/{name}",
+        "md5": base64.b64encode(hashlib.md5(contents.encode()).digest()).decode(),
+        "sizeBytes": len(contents),
+    }
+
+
+def test_download_write_files(tmp_path, mock_responses):
+    contents = {f"media/images/{i}.txt": f"contents {i}" * 1000 for i in range(20)}
+    files = [_file_metadata(name, data) for name, data in contents.items()]
+    for name, data in list(contents.items())[1:]:
+        mock_responses.add(responses.GET, f"https://example.com/{name}", body=data)
+    # The first file is already current, so it isn't requested.
+    (tmp_path / "media" / "images").mkdir(parents=True)
+    (tmp_path / "media/images/0.txt").write_text(contents["media/images/0.txt"])
+    progress = []
+
+    results = internal.InternalApi().download_write_files(
+        files,
+        out_dir=str(tmp_path),
+        max_workers=4,
+        progress=lambda num_bytes, total: progress.append((num_bytes, total)),
+    )
+
+    assert [path for path, _ in results] == [
+        os.path.join(str(tmp_path), name) for name in contents
+    ]
+    assert results[0][1] is None
+    assert all(response is not None for _, response in results[1:])
+    for name, data in contents.items():
+        assert (tmp_path / name).read_text() == data
+    total = sum(len(data) for data in contents.values())
+    assert {t for _, t in progress} == {total}
+    assert sum(n for n, _ in progress) == total - len(contents["media/images/0.txt"])
+    assert not list(tmp_path.glob("media/images/*.tmp"))
+
+
+def test_download_write_files_leaves_no_partial_file(tmp_path, mock_responses):
+    files = [_file_metadata("file.txt", "contents")]
+    mock_responses.add(responses.GET, "https://example.com/file.txt", status=500)
+
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    with pytest.raises(CommError):
+        internal.InternalApi().download_write_files(files, out_dir=str(out_dir))
+
+    assert list(out_dir.iterdir()) == []
+
+
+def test_download_write_files_closes_its_session(tmp_path, mock_responses):
+    files = [_file_metadata("file.txt", "contents")]
+    mock_responses.add(responses.GET, "https://example.com/file.txt", body="contents")
+    sessions = []
+    session_cls = requests.Session
+
+    def new_session():
+        session = session_cls()
+        session.close = Mock(wraps=session.close)
+        sessions.append(session)
+        return session
+
+    api = internal.InternalApi()
+    with patch.object(requests, "Session", side_effect=new_session):
+        api.download_write_files(files, out_dir=str(tmp_path / "a"))
+        api.download_write_files(files, out_dir=str(tmp_path / "b"))
+
+    assert len(sessions) == 2
+    assert sessions[0] is not sessions[1]
+    for session in sessions:
+        session.close.assert_called_once()
+
+
 def test_internal_api_with_no_write_global_config_dir(tmp_path):
     with patch.dict("os.environ", WANDB_CONFIG_DIR=str(tmp_path)):
         os.chmod(tmp_path, 0o444)
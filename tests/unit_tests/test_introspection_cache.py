@@ -0,0 +1,90 @@
+from unittest import mock
+
+import pytest
+from wandb.sdk.internal import internal_api
+from wandb.sdk.internal.introspection_cache import IntrospectionCache
+
+QUERY = """
+    query ProbeServerSettings {
+        ServerSettingsType: __type(name: "ServerSettings") { fields { name } }
+    }
+"""
+RESULT = {"ServerSettingsType": {"fields": [{"name": "sdkMessages"}]}}
+
+
+def test_results_are_shared_through_disk(tmp_path):
+    IntrospectionCache(tmp_path / "cache.json", ttl=60).put(QUERY, RESULT)
+
+    cache = IntrospectionCache(tmp_path / "cache.json", ttl=60)
+
+    assert cache.get(QUERY) == RESULT
+    # Whitespace doesn't change the key.
+    assert cache.get(" ".join(QUERY.split())) == RESULT
+
+
+def test_results_from_other_processes_are_kept(tmp_path):
+    first = IntrospectionCache(tmp_path / "cache.json", ttl=60)
+    second = IntrospectionCache(tmp_path / "cache.json", ttl=60)
+    first.get(QUERY)
+
+    second.put("query A { a }", {"a": 1})
+    first.put(QUERY, RESULT)
+
+    cache = IntrospectionCache(tmp_path / "cache.json", ttl=60)
+    assert cache.get("query A { a }") == {"a": 1}
+    assert cache.get(QUERY) == RESULT
+
+
+def test_results_expire(tmp_path, monkeypatch):
+    IntrospectionCache(tmp_path / "cache.json", ttl=60).put(QUERY, RESULT)
+
+    now = internal_api.introspection_cache.time.time()
+    monkeypatch.setattr(internal_api.introspection_cache.time, "time", lambda: now + 61)
+
+    assert IntrospectionCache(tmp_path / "cache.json", ttl=60).get(QUERY) is None
+
+
+def test_server_version_change_drops_results(tmp_path):
+    cache = IntrospectionCache(tmp_path / "cache.json", ttl=60)
+    cache.set_version("0.60.0")
+    cache.put(QUERY, RESULT)
+
+    cache.set_version("0.60.0")
+    assert cache.get(QUERY) == RESULT
+
+    cache.set_version("0.61.0")
+    assert cache.get(QUERY) is None
+    assert IntrospectionCache(tmp_path / "cache.json", ttl=60).get(QUERY) is None
+
+
+def test_disabled_with_zero_ttl(tmp_path):
+    cache = IntrospectionCache(tmp_path / "cache.json", ttl=0)
+    cache.put(QUERY, RESULT)
+
+    assert cache.get(QUERY) is None
+    assert not (tmp_path / "cache.json").exists()
+
+
+@pytest.fixture
+def make_api(tmp_path, monkeypatch):
+    monkeypatch.setenv("WANDB_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("WANDB_X_INTROSPECTION_CACHE_TTL", "60")
+
+    def make_api():
+        api = internal_api.Api()
+        api.gql = mock.Mock(return_value=RESULT)
+        return api
+
+    return make_api
+
+
+def test_internal_api_reuses_introspection_across_instances(make_api):
+    first = make_api()
+    first.server_settings_introspection()
+    first.gql.assert_called_once()
+
+    second = make_api()
+    second.server_settings_introspection()
+
+    second.gql.assert_not_called()
+    assert second._server_settings_type == ["sdkMessages"]
@@ -0,0 +1,88 @@
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from wandb.sdk.lib import digest_cache as digest_cache_module
+from wandb.sdk.lib.digest_cache import DigestCache
+from wandb.sdk.lib.hashutil import md5_file_b64
+
+
+@pytest.fixture
+def digest_cache(tmp_path: Path) -> DigestCache:
+    cache = DigestCache(tmp_path / "digests.sqlite")
+    yield cache
+    cache.close()
+
+
+def write_old_file(path: Path, content: str, age: float = 3600) -> Path:
+    path.write_text(content)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def count_hashes():
+    with mock.patch.object(
+        digest_cache_module, "md5_file_b64", wraps=md5_file_b64
+    ) as hasher:
+        yield hasher
+
+
+def test_md5_file_b64_hashes_once(digest_cache, tmp_path, count_hashes):
+    path = write_old_file(tmp_path / "file.txt", "content")
+
+    assert digest_cache.md5_file_b64(path) == md5_file_b64(path)
+    assert digest_cache.md5_file_b64(path) == md5_file_b64(path)
+    assert count_hashes.call_count == 1
+
+
+def test_changed_file_is_rehashed(digest_cache, tmp_path, count_hashes):
+    path = write_old_file(tmp_path / "file.txt", "content")
+    digest_cache.md5_file_b64(path)
+
+    write_old_file(path, "changed", age=1800)
+
+    assert digest_cache.md5_file_b64(path) == md5_file_b64(path)
+    assert count_hashes.call_count == 2
+
+
+def test_recently_modified_file_is_not_cached(digest_cache, tmp_path, count_hashes):
+    path = tmp_path / "file.txt"
+    path.write_text("content")
+
+    digest_cache.md5_file_b64(path)
+    digest_cache.md5_file_b64(path)
+    assert count_hashes.call_count == 2
+
+
+def test_corrupt_database_is_recreated(tmp_path, count_hashes):
+    db_path = tmp_path / "digests.sqlite"
+    db_path.write_bytes(b"not a database" * 100)
+    path = write_old_file(tmp_path / "file.txt", "content")
+
+    cache = DigestCache(db_path)
+    assert cache.md5_file_b64(path) == md5_file_b64(path)
+    assert cache.md5_file_b64(path) == md5_file_b64(path)
+    assert count_hashes.call_count == 1
+    cache.close()
+
+
+def test_evict_keeps_newest(tmp_path):
+    cache = DigestCache(tmp_path / "digests.sqlite", max_entries=2)
+    paths = [write_old_file(tmp_path / f"file{i}.txt", str(i)) for i in range(5)]
+    for path in paths:
+        cache.put(path, md5_file_b64(path))
+
+    cache.evict()
+
+    assert [cache.get(path) is not None for path in paths] == [
+        False,
+        False,
+        False,
+        True,
+        True,
+    ]
+    cache.close()
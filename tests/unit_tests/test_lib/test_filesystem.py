@@ -17,6 +17,7 @@ from wandb.sdk.lib import filesystem
 from wandb.sdk.lib.filesystem import (
     check_exists,
     copy_or_overwrite_changed,
+    link_or_copy,
     mkdir_allow_fallback,
     mkdir_exists_ok,
     reflink,
@@ -402,6 +403,94 @@ def test_safe_copy_with_links(tmp_path: Path, src_link, dest_link):
     assert target_path.read_text("utf-8") == source_content
 
 
+@pytest.mark.parametrize("mode", ["hardlink", "symlink"])
+def test_link_or_copy_links(tmp_path, mode):
+    source_path = tmp_path / "cache" / "obj"
+    source_path.parent.mkdir()
+    source_path.write_text("content")
+    target_path = tmp_path / "dest" / "file.txt"
+    target_path.parent.mkdir()
+    target_path.write_text("stale")
+
+    link_or_copy(source_path, target_path, mode=mode)
+
+    assert target_path.read_text() == "content"
+    assert os.path.samefile(source_path, target_path)
+    assert filesystem.is_link(target_path)
+    assert target_path.is_symlink() == (mode == "symlink")
+    # Linking again is a no-op.
+    link_or_copy(source_path, target_path, mode=mode)
+    assert not list(target_path.parent.glob("*.tmp"))
+
+
+def test_link_or_copy_falls_back_to_copy(tmp_path):
+    source_path = tmp_path / "source.txt"
+    source_path.write_text("content")
+    target_path = tmp_path / "target.txt"
+    other_path = tmp_path / "other.txt"
+    other_path.write_text("other")
+    # The target is a link to another file, which must not be overwritten.
+    os.link(other_path, target_path)
+
+    with patch.object(
+        filesystem, "_link", side_effect=OSError(errno.EXDEV, "cross-device")
+    ):
+        link_or_copy(source_path, target_path, mode="hardlink")
+
+    assert target_path.read_text() == "content"
+    assert other_path.read_text() == "other"
+    assert not filesystem.is_link(target_path)
+
+
+def test_link_or_copy_reflink_or_copy(tmp_path):
+    source_path = tmp_path / "source.txt"
+    source_path.write_text("content")
+    target_path = tmp_path / "target.txt"
+
+    # Reflinks aren't supported on every filesystem, but a copy always works.
+    link_or_copy(source_path, target_path, mode="reflink")
+
+    assert target_path.read_text() == "content"
+    assert not os.path.samefile(source_path, target_path)
+
+
+def test_link_or_copy_auto_falls_back_to_hardlink(tmp_path):
+    source_path = tmp_path / "source.txt"
+    source_path.write_text("content")
+    target_path = tmp_path / "target.txt"
+
+    with patch.object(
+        filesystem, "reflink", side_effect=OSError(errno.EOPNOTSUPP, "no reflinks")
+    ):
+        link_or_copy(source_path, target_path, mode="auto")
+
+    assert target_path.read_text() == "content"
+    assert os.path.samefile(source_path, target_path)
+
+
+@pytest.mark.parametrize("link", ["hardlink", "symlink"])
+def test_link_or_copy_copy_mode_replaces_link(tmp_path, link):
+    old_path = tmp_path / "cache" / "old"
+    old_path.parent.mkdir()
+    old_path.write_text("old")
+    source_path = tmp_path / "cache" / "new"
+    source_path.write_text("new")
+    target_path = tmp_path / "target.txt"
+    # An earlier download linked the target to the cache entry of old contents.
+    link_or_copy(old_path, target_path, mode=link)
+
+    link_or_copy(source_path, target_path, mode="copy")
+
+    assert target_path.read_text() == "new"
+    assert old_path.read_text() == "old"
+    assert not filesystem.is_link(target_path)
+
+
+def test_link_or_copy_invalid_mode(tmp_path):
+    with pytest.raises(ValueError, match="Unknown link mode"):
+        link_or_copy(tmp_path / "a", tmp_path / "b", mode="teleport")
+
+
 @pytest.mark.xfail(reason="Fails on file systems that don't support reflinks")
 def test_reflink_success(tmp_path):
     target_path = tmp_path / "target.txt"
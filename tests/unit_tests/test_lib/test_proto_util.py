@@ -0,0 +1,46 @@
+import json
+
+import pytest
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.lib import proto_util
+
+
+def _history(items):
+    history = pb.HistoryRecord()
+    for key, value in items:
+        item = history.item.add()
+        if isinstance(key, tuple):
+            item.nested_key.extend(key)
+        else:
+            item.key = key
+        item.value_json = json.dumps(value)
+    return history
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [("a", 1), ("b", 2.5), ("_step", 3)],
+        [('quote"key', "value"), ("unicode/é", [1, 2]), ("d", {"x": None})],
+    ],
+)
+def test_json_from_proto_list(items):
+    history = _history(items)
+
+    history_json = proto_util.json_from_proto_list(history.item)
+
+    assert json.loads(history_json) == proto_util.dict_from_proto_list(history.item)
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [("a", 1), ("a", 2)],
+        [(("a", "b"), 1)],
+    ],
+)
+def test_json_from_proto_list_fallback(items):
+    history = _history(items)
+
+    assert proto_util.json_from_proto_list(history.item) is None
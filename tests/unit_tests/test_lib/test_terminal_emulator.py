@@ -0,0 +1,71 @@
+import os
+import queue
+
+from wandb.sdk.lib import redirect
+from wandb.sdk.lib.redirect import TerminalEmulator
+
+
+def test_styles_are_rendered_at_run_boundaries():
+    emulator = TerminalEmulator()
+    emulator.write("\x1b[31m\x1b[40m\x1b[1mHello\x1b[0m world\n")
+
+    assert emulator.read() == (
+        "\x1b[31m\x1b[40m\x1b[1mHello\x1b[39m\x1b[49m\x1b[22m world" + os.linesep
+    )
+
+
+def test_overwriting_splits_and_merges_style_runs():
+    emulator = TerminalEmulator()
+    emulator.write("abcdef")
+    line = emulator.buffer[0]
+    assert len(line.starts) == 1
+
+    emulator.write("\r\x1b[2C\x1b[31mcd")
+    assert line.starts == [0, 2, 4]
+
+    emulator.write("\r\x1b[2C\x1b[39mcd")
+    assert line.starts == [0]
+    assert emulator.display() == [list("abcdef")]
+
+
+def test_progress_bar_rewrites_last_line():
+    emulator = TerminalEmulator()
+    emulator.write("epoch 0\n 10%|#  |\r")
+    assert emulator.read() == f"epoch 0{os.linesep} 10%|#  |{os.linesep}"
+
+    emulator.write(" 50%|## |\r")
+    assert emulator.read() == f"\r 50%|## |{os.linesep}"
+
+    emulator.write(" 50%|## |\r")
+    assert emulator.read() == ""
+
+
+def test_erase_line_keeps_colored_blanks():
+    emulator = TerminalEmulator()
+    emulator.write("abc\x1b[41m  \x1b[49mdef\r\x1b[6C\x1b[K")
+
+    assert emulator.display() == [list("abc  d")]
+
+    emulator.write("\r\x1b[3C\x1b[K")
+    assert emulator.display() == [list("abc")]
+
+
+def test_read_keeps_last_lines(monkeypatch):
+    monkeypatch.setattr(TerminalEmulator, "_MAX_LINES", 3)
+    emulator = TerminalEmulator()
+    emulator.write("".join(f"line {i}\n" for i in range(5)))
+    emulator.read()
+
+    assert emulator.display() == [list(f"line {i}") for i in (2, 3, 4)]
+    emulator.write("line 5\n")
+    assert emulator.read() == f"line 5{os.linesep}"
+
+
+def test_queued_writes_batches_until_stopped():
+    q = queue.Queue()
+    for data in ("a", "b", "c"):
+        q.put(data)
+    q.put(None)
+    q.put("d")
+
+    assert list(redirect._queued_writes(q)) == [["a", "b", "c"]]
@@ -0,0 +1,72 @@
+import os
+
+import numpy as np
+import pytest
+import wandb
+from wandb.sdk.data_types import image
+
+
+@pytest.fixture
+def media_dedup(monkeypatch):
+    monkeypatch.setenv("WANDB_X_MEDIA_DEDUP", "true")
+
+
+def test_bind_identical_images_reuses_file(media_dedup, mock_run):
+    run = mock_run(settings=wandb.Settings(mode="offline"))
+    pixels = np.random.randint(0, 255, size=(32, 32, 3), dtype=np.uint8)
+
+    first = wandb.Image(pixels)
+    first.bind_to_run(run, "validation", 0)
+    second = wandb.Image(pixels)
+    second.bind_to_run(run, "validation", 1)
+    other = wandb.Image(255 - pixels)
+    other.bind_to_run(run, "validation", 2)
+
+    assert second._path == first._path
+    assert other._path != first._path
+    assert len(os.listdir(os.path.join(run.dir, "media", "images"))) == 2
+    assert run._media_index.bytes_saved == second._size
+
+
+def test_log_reports_media_bytes_saved(media_dedup, mock_run, record_q):
+    run = mock_run(settings=wandb.Settings(mode="offline"))
+    pixels = np.random.randint(0, 255, size=(32, 32, 3), dtype=np.uint8)
+
+    run.log({"legend": wandb.Image(pixels)})
+    run.log({"legend": wandb.Image(pixels)})
+
+    summaries = []
+    while not record_q.empty():
+        record = record_q.get()
+        if record.HasField("summary"):
+            summaries.extend(
+                (item.key, item.value_json) for item in record.summary.update
+            )
+    assert summaries == [("_media_bytes_saved", str(run._media_index.bytes_saved))]
+
+
+def test_media_dedup_is_off_by_default(mock_run):
+    run = mock_run(settings=wandb.Settings(mode="offline"))
+    pixels = np.random.randint(0, 255, size=(32, 32, 3), dtype=np.uint8)
+
+    first = wandb.Image(pixels)
+    first.bind_to_run(run, "validation", 0)
+    second = wandb.Image(pixels)
+    second.bind_to_run(run, "validation", 1)
+
+    assert run._media_index is None
+    assert second._path != first._path
+
+
+def test_media_dedup_needs_image_filenames(media_dedup, mock_run, monkeypatch):
+    monkeypatch.setattr(image, "_server_accepts_image_filenames", lambda: False)
+    run = mock_run(settings=wandb.Settings(mode="offline"))
+    pixels = np.random.randint(0, 255, size=(32, 32, 3), dtype=np.uint8)
+
+    first = wandb.Image(pixels)
+    first.bind_to_run(run, "validation", 0)
+    second = wandb.Image(pixels)
+    second.bind_to_run(run, "validation", 1)
+
+    assert second._path != first._path
+    assert run._media_index.bytes_saved == 0
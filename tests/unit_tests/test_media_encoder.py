@@ -0,0 +1,155 @@
+import concurrent.futures
+import json
+import threading
+
+import numpy as np
+import pytest
+import wandb
+from wandb.sdk.data_types._media_encoder import MediaEncoder, PendingHistory
+
+
+@pytest.fixture
+def async_encoding(monkeypatch):
+    monkeypatch.setenv("WANDB_X_MEDIA_ENCODING_WORKERS", "2")
+
+
+def test_image_is_encoded_in_background(async_encoding):
+    pixels = np.random.randint(0, 255, size=(64, 64, 3), dtype=np.uint8)
+    expected = wandb.Image(pixels.copy())
+    expected.file_is_set()
+
+    image = wandb.Image(pixels)
+    # The caller may reuse its buffer right away.
+    pixels[:] = 0
+
+    assert image._encoding is not None
+    assert image.file_is_set()
+    assert image._sha256 == expected._sha256
+    assert (image._width, image._height) == (64, 64)
+
+
+def test_image_sequence_uses_size_of_freed_images(async_encoding, mock_run):
+    run = mock_run(settings={"mode": "offline"})
+    images = [wandb.Image(np.zeros((16, 24, 3), dtype=np.uint8)) for _ in range(3)]
+    for i, image in enumerate(images):
+        image.bind_to_run(run, "images", 0, id_=i)
+    # The background encode dropped the pixels once the file was written.
+    assert all(image._image is None for image in images)
+
+    meta = wandb.Image.seq_to_json(images, run, "images", 0)
+
+    assert (meta["width"], meta["height"]) == (24, 16)
+    assert all(image._image is None for image in images)
+
+
+def test_encoding_error_is_raised_on_use(async_encoding):
+    image = wandb.Image(np.zeros((8, 8)))
+    future = concurrent.futures.Future()
+    future.set_exception(OSError("disk full"))
+    image._encoding = future
+
+    with pytest.raises(OSError, match="disk full"):
+        image.file_is_set()
+
+
+def test_media_encoder_limits_pending_encodings():
+    encoder = MediaEncoder(max_workers=1, max_pending=1)
+    release = threading.Event()
+    encoder.submit(release.wait)
+    submitted = threading.Event()
+
+    def submit():
+        encoder.submit(lambda: None)
+        submitted.set()
+
+    threading.Thread(target=submit).start()
+
+    assert not submitted.wait(0.1)
+    release.set()
+    assert submitted.wait(5)
+
+
+class FakeMedia(wandb.Image):
+    def __init__(self, encoding):
+        super().__init__(np.zeros((8, 8)))
+        self._encoding = encoding
+
+
+def test_pending_history_publishes_rows_in_order():
+    published = []
+    history = PendingHistory(lambda data, **kwargs: published.append(data), 4)
+    encoding = concurrent.futures.Future()
+
+    history.publish({"a": 1})
+    history.publish({"img": [FakeMedia(encoding)]})
+    history.publish({"a": 2})
+
+    assert published == [{"a": 1}]
+    encoding.set_result(None)
+    history.close()
+    assert [row.get("a") for row in published] == [1, None, 2]
+
+
+def test_pending_history_drops_rows_with_failed_media(mock_wandb_log):
+    published = []
+
+    def publish(data, **kwargs):
+        # Serializing a row waits for its media.
+        if "img" in data:
+            data["img"]._wait_encoded()
+        published.append(data)
+
+    history = PendingHistory(publish, 4)
+    encoding = concurrent.futures.Future()
+
+    history.publish({"img": FakeMedia(encoding)})
+    history.publish({"a": 1})
+    encoding.set_exception(OSError("disk full"))
+    history.close()
+
+    assert published == [{"a": 1}]
+    assert mock_wandb_log.errored("failed to encode media: disk full")
+
+
+def test_run_log_publishes_after_encoding(async_encoding, mock_run, record_q):
+    run = mock_run(settings={"mode": "offline"})
+    pixels = np.random.randint(0, 255, size=(32, 32, 3), dtype=np.uint8)
+
+    run.log({"img": wandb.Image(pixels), "loss": 1.0})
+    run.log({"loss": 0.5})
+    run._pending_history.flush()
+
+    rows = []
+    while not record_q.empty():
+        record = record_q.get()
+        if record.request.HasField("partial_history"):
+            items = record.request.partial_history.item
+            rows.append({item.key: json.loads(item.value_json) for item in items})
+    assert [row["loss"] for row in rows] == [1.0, 0.5]
+    assert rows[0]["img"]["_type"] == "image-file"
+    assert rows[0]["_timestamp"] <= rows[1]["_timestamp"]
+
+
+def test_run_log_serializes_rows_queued_behind_media(
+    async_encoding, mock_run, record_q
+):
+    run = mock_run(settings={"mode": "offline"})
+    image = wandb.Image(np.zeros((8, 8, 3), dtype=np.uint8))
+    image._encoding.result()
+    gate = concurrent.futures.Future()
+    image._encoding = gate
+    weights = np.array([1.0, 2.0])
+
+    run.log({"img": image})
+    run.log({"w": weights})
+    weights[:] = 99.0
+    gate.set_result(None)
+    run._pending_history.flush()
+
+    rows = []
+    while not record_q.empty():
+        record = record_q.get()
+        if record.request.HasField("partial_history"):
+            items = record.request.partial_history.item
+            rows.append({item.key: json.loads(item.value_json) for item in items})
+    assert rows[1]["w"] == [1.0, 2.0]
@@ -0,0 +1,99 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+from wandb.apis.paginator import Paginator
+
+
+class NumberPaginator(Paginator):
+    """Pages through the numbers 0..total-1."""
+
+    def __init__(self, total, per_page=10, fail_at=None):
+        self.total = total
+        self.fail_at = fail_at
+        self.fetched = threading.Semaphore(0)
+        client = Mock()
+        client.execute.side_effect = self._execute
+        super().__init__(client, {}, per_page=per_page)
+
+    def _execute(self, query, variable_values):
+        start = variable_values["cursor"] or 0
+        if start == self.fail_at:
+            raise ValueError("page failed")
+        end = min(start + variable_values["perPage"], self.total)
+        self.fetched.release()
+        return {"numbers": list(range(start, end)), "next": end}
+
+    @property
+    def length(self):
+        return self.total
+
+    @property
+    def more(self):
+        return self.last_response is None or self.last_response["next"] < self.total
+
+    @property
+    def cursor(self):
+        return self.last_response["next"] if self.last_response else None
+
+    def convert_objects(self):
+        return self.last_response["numbers"]
+
+
+def test_stream_yields_all_objects():
+    paginator = NumberPaginator(95)
+    assert list(paginator.stream(prefetch=2)) == list(range(95))
+    assert paginator.objects == []
+    assert paginator.client.execute.call_count == 10
+
+
+def test_stream_matches_iteration():
+    assert list(NumberPaginator(25).stream()) == list(NumberPaginator(25))
+
+
+def test_stream_prefetches_next_page():
+    paginator = NumberPaginator(30)
+    stream = paginator.stream(prefetch=1)
+    assert next(stream) == 0
+    # The second page is fetched while the first one is being consumed.
+    assert paginator.fetched.acquire(timeout=5)
+    assert paginator.fetched.acquire(timeout=5)
+    stream.close()
+
+
+def test_stream_raises_page_errors():
+    paginator = NumberPaginator(30, fail_at=20)
+    stream = paginator.stream()
+    assert [next(stream) for _ in range(20)] == list(range(20))
+    with pytest.raises(ValueError, match="page failed"):
+        next(stream)
+
+
+def test_stream_starts_with_loaded_objects():
+    paginator = NumberPaginator(25)
+    assert paginator[3] == 3
+    assert list(paginator.stream()) == list(range(25))
+
+
+def test_stream_leaves_paginator_cursor():
+    paginator = NumberPaginator(30)
+    assert paginator[3] == 3
+    stream = paginator.stream()
+    assert [next(stream) for _ in range(15)] == list(range(15))
+    stream.close()
+
+    assert list(paginator) == list(range(30))
+    assert paginator[25] == 25
+
+
+def test_stream_stops_fetching_when_closed():
+    paginator = NumberPaginator(1000)
+    stream = paginator.stream(prefetch=1)
+    assert next(stream) == 0
+    stream.close()
+
+    # The prefetch thread has finished, and it didn't page the paginator.
+    calls = paginator.client.execute.call_count
+    assert calls <= 3
+    assert paginator.last_response is None
+    assert paginator.client.execute.call_count == calls
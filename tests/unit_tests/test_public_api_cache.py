@@ -0,0 +1,148 @@
+import json
+import os
+import re
+from unittest import mock
+
+import pytest
+from wandb.apis.public import api_cache
+from wandb.apis.public.api_cache import PublicApiCache
+from wandb.apis.public.runs import Run
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PublicApiCache(tmp_path / "public-api", max_bytes=10 * 1024 * 1024)
+
+
+def test_json_round_trip(cache):
+    key = cache.key("run", "url", "entity", "project", "id")
+
+    assert cache.get_json(key) is None
+    cache.put_json(key, {"project": {"run": {"state": "finished"}}})
+    assert cache.get_json(key) == {"project": {"run": {"state": "finished"}}}
+
+    cache.delete(key)
+    assert cache.get_json(key) is None
+
+
+def test_rows_round_trip(cache):
+    pytest.importorskip("pyarrow")
+    key = cache.key("history")
+    rows = [json.dumps({"_step": 0, "img": {"_type": "image-file"}}), "{}"]
+
+    cache.put_rows(key, rows)
+
+    assert cache.get_rows(key) == rows
+
+
+def test_corrupt_entry_is_discarded(cache):
+    key = cache.key("run")
+    cache.put_json(key, {})
+    path = cache._path(key, ".json")
+    path.write_text("{not json")
+
+    assert cache.get_json(key) is None
+    assert not path.exists()
+
+
+def test_evicts_least_recently_used(cache):
+    keys = [cache.key(i) for i in range(4)]
+    for i, key in enumerate(keys):
+        cache.put_json(key, "x" * 1000)
+        os.utime(cache._path(key, ".json"), (i, i))
+    cache.get_json(keys[0])
+
+    cache.max_bytes = 4000
+    cache.put_json(cache.key("new"), "x" * 1000)
+
+    assert cache.get_json(keys[0]) is not None
+    assert cache.get_json(keys[1]) is None
+    assert cache.get_json(keys[2]) is None
+    assert cache.get_json(keys[3]) is not None
+
+
+def run_response(state):
+    return {
+        "project": {
+            "internalId": "project-id",
+            "run": {
+                "id": "storage-id",
+                "name": "run",
+                "displayName": "run",
+                "sweepName": None,
+                "state": state,
+                "config": "{}",
+                "summaryMetrics": "{}",
+                "systemMetrics": "{}",
+                "heartbeatAt": "2024-01-01T00:00:00",
+                "historyKeys": {"lastStep": 2},
+            },
+        }
+    }
+
+
+@pytest.fixture
+def client():
+    client = mock.MagicMock()
+    client.responses = {
+        "ProbeProjectInput": {"ProjectType": {"fields": []}},
+        "RunFullHistory": {
+            "project": {"run": {"history": ['{"_step": 0}', '{"_step": 1}']}}
+        },
+    }
+
+    def execute(query, variable_values=None):
+        name = re.search(r"query (\w+)", query.loc.source.body).group(1)
+        return client.responses[name]
+
+    client.execute.side_effect = execute
+    return client
+
+
+@pytest.fixture
+def enable_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("WANDB_X_PUBLIC_API_CACHE", "true")
+    monkeypatch.setenv("WANDB_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(api_cache, "_public_api_cache", None)
+
+
+def test_finished_run_is_cached(client, enable_cache):
+    client.responses["Run"] = run_response("finished")
+    Run(client, "entity", "project", "run")
+    calls = client.execute.call_count
+
+    run = Run(client, "entity", "project", "run")
+
+    assert client.execute.call_count == calls
+    assert run.state == "finished"
+
+
+def test_running_run_is_not_cached(client, enable_cache):
+    client.responses["Run"] = run_response("running")
+    Run(client, "entity", "project", "run")
+    calls = client.execute.call_count
+
+    Run(client, "entity", "project", "run")
+
+    assert client.execute.call_count > calls
+
+
+def test_history_is_cached(client, enable_cache):
+    pytest.importorskip("pyarrow")
+    client.responses["Run"] = run_response("running")
+    run = Run(client, "entity", "project", "run")
+
+    assert run.history(pandas=False) == [{"_step": 0}, {"_step": 1}]
+    calls = client.execute.call_count
+    assert run.history(pandas=False) == [{"_step": 0}, {"_step": 1}]
+    assert client.execute.call_count == calls
+
+    # A new heartbeat means there may be new history.
+    run._attrs["heartbeatAt"] = "2024-01-01T00:01:00"
+    run.history(pandas=False)
+    assert client.execute.call_count == calls + 1
+
+
+def test_cache_disabled_by_default(client, monkeypatch):
+    monkeypatch.delenv("WANDB_X_PUBLIC_API_CACHE", raising=False)
+    assert api_cache.get_public_api_cache() is None
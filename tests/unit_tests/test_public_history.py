@@ -0,0 +1,132 @@
+import json
+import threading
+from unittest import mock
+
+import pytest
+from wandb.apis.public.api_cache import PublicApiCache
+from wandb.apis.public.history import HistoryScan, SampledHistoryScan
+
+
+class FakeHistoryClient:
+    """Serves the history of a run logged at `steps`, sampling full pages."""
+
+    def __init__(self, steps):
+        self.steps = sorted(steps)
+        self.ranges = []
+        self.lock = threading.Lock()
+
+    def rows(self, min_step, max_step, samples):
+        rows = [s for s in self.steps if min_step <= s < max_step]
+        if len(rows) > samples:
+            rows = [rows[i * len(rows) // samples] for i in range(samples)]
+        return [{"_step": s, "loss": s / 2} for s in rows]
+
+    def execute(self, query, variable_values):
+        if "spec" in variable_values:
+            spec = json.loads(variable_values["spec"])
+            min_step, max_step = spec["minStep"], spec["maxStep"]
+            rows = self.rows(min_step, max_step, spec["samples"])
+            history = {"sampledHistory": [rows]}
+        else:
+            min_step = variable_values["minStep"]
+            max_step = variable_values["maxStep"]
+            rows = self.rows(min_step, max_step, variable_values["pageSize"])
+            history = {"history": [json.dumps(row) for row in rows]}
+        with self.lock:
+            self.ranges.append((min_step, max_step))
+        return {"project": {"run": history}}
+
+
+@pytest.fixture
+def run():
+    return mock.Mock(entity="entity", project="project", id="run")
+
+
+@pytest.mark.parametrize("grow_ranges", [False, True])
+@pytest.mark.parametrize("max_workers", [1, 4])
+@pytest.mark.parametrize(
+    "steps",
+    [
+        range(0, 5000),
+        range(0, 200_000, 997),
+        [*range(0, 300), *range(50_000, 53_000), 99_999],
+    ],
+    ids=["dense", "sparse", "mixed"],
+)
+def test_history_scan_yields_every_row_in_order(run, steps, max_workers, grow_ranges):
+    client = FakeHistoryClient(steps)
+    scan = HistoryScan(
+        client,
+        run,
+        0,
+        max(steps) + 1,
+        page_size=100,
+        max_workers=max_workers,
+        grow_ranges=grow_ranges,
+    )
+
+    assert [row["_step"] for row in scan] == list(steps)
+    assert len(set(client.ranges)) == len(client.ranges)
+
+
+def test_history_scan_grows_ranges_for_sparse_runs(run):
+    client = FakeHistoryClient(range(0, 1_000_000, 1000))
+
+    scan = HistoryScan(client, run, 0, 1_000_000, page_size=100, grow_ranges=True)
+    rows = list(scan)
+
+    assert len(rows) == 1000
+    # Fixed windows of 100 steps would take 10,000 requests.
+    assert len(client.ranges) < 50
+
+
+def test_history_scan_ranges_are_page_size_wide_by_default(run):
+    # A bucketed sampler can return fewer than `samples` rows, so a wide range
+    # that was sampled isn't always recognizable by a full page.
+    client = FakeHistoryClient(
+        [*range(0, 1_000_000, 10_000), *range(1_000_000, 1_001_000)]
+    )
+
+    rows = list(HistoryScan(client, run, 0, 1_001_000, page_size=100, max_workers=4))
+
+    assert len(rows) == 1100
+    assert all(max_step - min_step <= 100 for min_step, max_step in client.ranges)
+
+
+def test_history_scan_raw_batches(run):
+    client = FakeHistoryClient(range(250))
+    scan = HistoryScan(client, run, 0, 250, page_size=100, max_workers=2)
+
+    batches = list(scan.batches(raw=True))
+
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    assert json.loads(batches[0][0]) == {"_step": 0, "loss": 0.0}
+
+
+def test_sampled_history_scan(run):
+    client = FakeHistoryClient(range(0, 10_000, 3))
+    scan = SampledHistoryScan(
+        client, run, ["loss"], 0, 10_000, page_size=100, max_workers=3
+    )
+
+    assert [row["_step"] for row in scan] == list(range(0, 10_000, 3))
+
+
+@pytest.mark.parametrize("scan_cls", [HistoryScan, SampledHistoryScan])
+def test_history_scan_reads_completed_scans_from_cache(run, tmp_path, scan_cls):
+    pytest.importorskip("pyarrow")
+    cache = PublicApiCache(tmp_path, max_bytes=2**20)
+    client = FakeHistoryClient(range(250))
+
+    def scan():
+        args = (["loss"],) if scan_cls is SampledHistoryScan else ()
+        return scan_cls(
+            client, run, *args, 0, 250, page_size=100, cache=cache, cache_key="k"
+        )
+
+    first = list(scan())
+    num_requests = len(client.ranges)
+
+    assert list(scan()) == first
+    assert [len(batch) for batch in scan().batches(raw=True)] == [100, 100, 50]
+    assert len(client.ranges) == num_requests
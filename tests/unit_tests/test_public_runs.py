@@ -0,0 +1,333 @@
+import json
+import re
+from unittest import mock
+
+import pytest
+from wandb.apis.public import sweeps
+from wandb.apis.public.runs import Run, Runs
+from wandb.errors import CommError
+
+
+def run_node(name, **fields):
+    node = {
+        "id": f"id-{name}",
+        "name": name,
+        "displayName": f"display-{name}",
+        "sweepName": None,
+        "state": "finished",
+    }
+    node.update(fields)
+    return node
+
+
+def runs_response(*nodes):
+    return {
+        "project": {
+            "internalId": "project-id",
+            "runCount": len(nodes),
+            "readOnly": False,
+            "runs": {
+                "edges": [{"node": node, "cursor": node["name"]} for node in nodes],
+                "pageInfo": {"endCursor": None, "hasNextPage": False},
+            },
+        }
+    }
+
+
+def full_run_response(name):
+    return {
+        "project": {
+            "internalId": "project-id",
+            "run": run_node(
+                name,
+                config=json.dumps({"lr": {"value": 0.1}}),
+                summaryMetrics=json.dumps({"loss": 0.5, "acc": 0.9}),
+                systemMetrics="{}",
+                tags=["a"],
+            ),
+        }
+    }
+
+
+def query_name(query):
+    return re.search(r"query (\w+)", query.loc.source.body).group(1)
+
+
+@pytest.fixture
+def client():
+    client = mock.MagicMock()
+    client.execute.side_effect = lambda query, variable_values=None: (
+        client.responses[query_name(query)]
+    )
+    client.responses = {
+        "ProbeRunSummaryMetricsArgs": {
+            "RunType": {
+                "fields": [
+                    {"name": "summaryMetrics", "args": [{"name": "keys"}]},
+                ]
+            }
+        },
+    }
+    return client
+
+
+def query_body(client, name):
+    for call in client.execute.call_args_list:
+        if query_name(call.args[0]) == name:
+            return call.args[0].loc.source.body, call.kwargs.get("variable_values")
+    raise AssertionError(f"{name} was not queried")
+
+
+def test_runs_projection_query(client):
+    client.responses["Runs"] = runs_response(
+        run_node("a", summaryMetrics=json.dumps({"loss": 0.5}))
+    )
+    runs = Runs(client, "entity", "project", fields=["tags"], summary_keys=["loss"])
+
+    run = runs[0]
+
+    body, variables = query_body(client, "Runs")
+    fragment = body[body.index("fragment RunFragment") :]
+    assert "summaryMetrics(keys: $summaryKeys)" in fragment
+    assert "tags" in fragment
+    assert "config" not in fragment
+    assert "systemMetrics" not in fragment
+    assert variables["summaryKeys"] == ["loss"]
+    assert run.summary_metrics == {"loss": 0.5}
+    assert run.state == "finished"
+
+
+def test_runs_projection_lazy_loads_fields(client):
+    client.responses["Runs"] = runs_response(run_node("a"))
+    client.responses["Run"] = full_run_response("a")
+    client.responses["ProbeProjectInput"] = {"ProjectType": {"fields": []}}
+    runs = Runs(client, "entity", "project", fields=["state"])
+
+    run = runs[0]
+    assert client.execute.call_count == 1
+
+    assert run.config == {"lr": 0.1}
+    assert run.summary_metrics == {"loss": 0.5, "acc": 0.9}
+    assert run.tags == ["a"]
+    query_body(client, "Run")
+
+
+def test_runs_projection_lazy_load_keeps_local_changes(client):
+    client.responses["Runs"] = runs_response(
+        run_node("a", summaryMetrics=json.dumps({"loss": 0.5}))
+    )
+    client.responses["Run"] = full_run_response("a")
+    client.responses["ProbeProjectInput"] = {"ProjectType": {"fields": []}}
+    run = Runs(client, "entity", "project", summary_keys=["loss"])[0]
+
+    run.name = "renamed"
+    assert run.config == {"lr": 0.1}
+    assert run.summary_metrics == {"loss": 0.5, "acc": 0.9}
+
+    assert run.name == "renamed"
+    body, _ = query_body(client, "Run")
+    fragment = body[body.index("fragment RunFragment") :]
+    assert "config" in fragment
+    assert "displayName" not in fragment
+
+
+def test_runs_projection_without_server_support(client):
+    client.responses["ProbeRunSummaryMetricsArgs"] = {
+        "RunType": {"fields": [{"name": "summaryMetrics", "args": []}]}
+    }
+    client.responses["Runs"] = runs_response(
+        run_node("a", summaryMetrics=json.dumps({"loss": 0.5, "acc": 0.9}))
+    )
+    runs = Runs(client, "entity", "project", summary_keys=["loss"])
+
+    run = runs[0]
+
+    body, variables = query_body(client, "Runs")
+    assert "summaryMetrics\n" in body
+    assert "summaryKeys" not in variables
+    assert run.summary_metrics == {"loss": 0.5, "acc": 0.9}
+
+
+def test_runs_projection_probes_server_once_per_client(client):
+    client.responses["Runs"] = runs_response(run_node("a"))
+
+    Runs(client, "entity", "project", summary_keys=["loss"])
+    Runs(client, "entity", "project", summary_keys=["acc"])
+
+    probes = [
+        call
+        for call in client.execute.call_args_list
+        if query_name(call.args[0]) == "ProbeRunSummaryMetricsArgs"
+    ]
+    assert len(probes) == 1
+
+
+def test_runs_projection_force_load_clears_lazy_fields(client):
+    client.responses["Runs"] = runs_response(
+        run_node("a", summaryMetrics=json.dumps({"loss": 0.5}))
+    )
+    client.responses["Run"] = full_run_response("a")
+    client.responses["ProbeProjectInput"] = {"ProjectType": {"fields": []}}
+    run = Runs(client, "entity", "project", summary_keys=["loss"])[0]
+
+    run.load(force=True)
+    calls = client.execute.call_count
+
+    assert run.config == {"lr": 0.1}
+    assert run.summary_metrics == {"loss": 0.5, "acc": 0.9}
+    assert client.execute.call_count == calls
+
+
+def test_runs_projection_unknown_field(client):
+    with pytest.raises(ValueError, match="Unknown run field 'bogus'"):
+        Runs(client, "entity", "project", fields=["bogus"])
+
+
+def test_runs_default_query_is_unchanged(client):
+    assert "summaryKeys" not in Runs.QUERY.loc.source.body
+    client.responses["Runs"] = runs_response(
+        run_node("a", config="{}", summaryMetrics="{}", systemMetrics="{}")
+    )
+    run = Runs(client, "entity", "project")[0]
+    assert run.config == {}
+    assert run._lazy_fields == set()
+
+
+def sweeps_response(*names):
+    return {
+        "project": {
+            f"sweep{i}": {
+                "id": f"id-{name}",
+                "name": name,
+                "state": "FINISHED",
+                "runCountExpected": None,
+                "bestLoss": None,
+                "config": "{}",
+            }
+            for i, name in enumerate(names)
+            if name is not None
+        }
+    }
+
+
+def test_runs_resolve_sweeps_in_one_query(client):
+    client.responses["Runs"] = runs_response(
+        run_node("a", sweepName="s1"),
+        run_node("b", sweepName="s2"),
+        run_node("c", sweepName="s1"),
+        run_node("d", sweepName="missing"),
+    )
+    # Sweep names are queried in sorted order.
+    client.responses["Sweeps"] = sweeps_response(None, "s1", "s2")
+
+    runs = list(Runs(client, "entity", "project"))
+
+    names = [query_name(call.args[0]) for call in client.execute.call_args_list]
+    assert names.count("Sweeps") == 1
+    _, variables = query_body(client, "Sweeps")
+    assert variables == {
+        "entity": "entity",
+        "project": "project",
+        "name0": "missing",
+        "name1": "s1",
+        "name2": "s2",
+    }
+    assert runs[0].sweep is runs[2].sweep
+    assert runs[0].sweep.id == "s1"
+    assert runs[1].sweep.state == "FINISHED"
+    assert runs[3].sweep is None
+
+
+def test_runs_share_sweeps_until_ttl(client, monkeypatch):
+    client.responses["Runs"] = runs_response(run_node("a", sweepName="s1"))
+    client.responses["Sweeps"] = sweeps_response("s1")
+
+    def sweep_queries():
+        return [
+            call
+            for call in client.execute.call_args_list
+            if query_name(call.args[0]) == "Sweeps"
+        ]
+
+    list(Runs(client, "entity", "project"))
+    list(Runs(client, "entity", "project", filters={"state": "finished"}))
+    assert len(sweep_queries()) == 1
+
+    cache = sweeps.get_sweep_cache(client)
+    monkeypatch.setattr(cache, "ttl", 0)
+    list(Runs(client, "entity", "project"))
+    assert len(sweep_queries()) == 2
+
+
+def test_runs_without_sweeps(client):
+    client.responses["Runs"] = runs_response(run_node("a", sweepName="s1"))
+
+    run = Runs(client, "entity", "project", include_sweeps=False)[0]
+
+    assert run.sweep is None
+    assert client.execute.call_count == 1
+
+
+@pytest.fixture
+def history_runs(client, monkeypatch):
+    client.responses["Runs"] = runs_response(*(run_node(f"r{i}") for i in range(5)))
+    calls = []
+
+    def history(run, samples, keys, x_axis, pandas, stream):
+        calls.append(run.id)
+        if run.id == "r2":
+            return []
+        return [{"_step": step, "loss": float(step)} for step in range(3)]
+
+    monkeypatch.setattr(Run, "history", history)
+    runs = Runs(client, "entity", "project")
+    runs.history_calls = calls
+    return runs
+
+
+def test_histories_default_in_run_order(history_runs):
+    received = []
+
+    histories = history_runs.histories(
+        max_workers=3, callback=lambda run, rows: received.append(run.id)
+    )
+
+    assert [row["run_id"] for row in histories] == [
+        run_id for run_id in ("r0", "r1", "r3", "r4") for _ in range(3)
+    ]
+    assert received == ["r0", "r1", "r3", "r4"]
+    assert sorted(history_runs.history_calls) == ["r0", "r1", "r2", "r3", "r4"]
+
+
+def test_histories_arrow(history_runs):
+    pa = pytest.importorskip("pyarrow")
+    tables = []
+
+    table = history_runs.histories(
+        format="arrow", callback=lambda run, table: tables.append(table)
+    )
+
+    assert isinstance(table, pa.Table)
+    assert table.column_names == ["_step", "loss", "run_id"]
+    assert table.num_rows == 12
+    assert table.column("run_id").to_pylist()[::3] == ["r0", "r1", "r3", "r4"]
+    assert [t.num_rows for t in tables] == [3, 3, 3, 3]
+
+
+def test_histories_retries_within_budget(history_runs, monkeypatch):
+    failures = {"r1": 2}
+    history = Run.history
+
+    def flaky_history(run, **kwargs):
+        if failures.get(run.id):
+            failures[run.id] -= 1
+            raise ValueError("network error")
+        return history(run, **kwargs)
+
+    monkeypatch.setattr(Run, "history", flaky_history)
+
+    assert len(history_runs.histories(max_retries=2)) == 12
+
+    failures["r1"] = 2
+    with pytest.raises(CommError, match="network error"):
+        history_runs.histories(max_retries=1)
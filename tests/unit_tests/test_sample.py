@@ -1,5 +1,7 @@
 """sample tests."""
 
+import random
+
 import wandb
 
 sample = wandb.wandb_sdk.internal.sample
@@ -36,3 +38,58 @@ def test_all():
         for n in range(1000):
             sampled = doit(n, samples=s)
             check(n, sampled, samples=s)
+
+
+def test_reservoir_keeps_order_and_size():
+    s = sample.ReservoirSampleAccumulator(samples=16, rng=random.Random(0))
+    for n in range(1000):
+        s.add(n)
+    sampled = s.get()
+    assert len(sampled) == 16
+    assert list(sampled) == sorted(sampled)
+    assert all(isinstance(v, int) for v in sampled)
+
+
+def test_reservoir_returns_all_values_below_size():
+    s = sample.ReservoirSampleAccumulator(samples=16)
+    for v in (1, 2.5, 3):
+        s.add(v)
+    assert s.get() == (1.0, 2.5, 3.0)
+
+
+def test_reservoir_keeps_large_ints_exact():
+    s = sample.ReservoirSampleAccumulator(samples=16)
+    for v in (2**53 + 1, 2**63 - 1):
+        s.add(v)
+    assert s.get() == (2**53 + 1, 2**63 - 1)
+
+
+def test_reservoir_skips_values_beyond_float_range():
+    s = sample.ReservoirSampleAccumulator(samples=16)
+    for v in (1, 2**64, 10**400, 2.5):
+        s.add(v)
+    assert s.get() == (1.0, float(2**64), 2.5)
+
+
+def test_reservoir_store_key_samples():
+    store = sample.ReservoirSampleStore(
+        samples=8, key_samples={"layer_*": 0, "loss": 32}, seed=0
+    )
+    for n in range(100):
+        store["loss"].add(n)
+        store["acc"].add(n)
+        store["layer_1"].add(n)
+    sampled = dict(store.items())
+    assert set(sampled) == {"loss", "acc"}
+    assert len(sampled["loss"].get()) == 32
+    assert len(sampled["acc"].get()) == 8
+
+
+def test_reservoir_store_max_bytes():
+    item_bytes = sample.ReservoirSampleAccumulator.ITEM_BYTES
+    store = sample.ReservoirSampleStore(samples=4, max_bytes=10 * 4 * item_bytes)
+    for k in range(100):
+        store[f"key_{k}"].add(k)
+    assert len(store) == 10
+    assert store.num_skipped == 90
+    assert store.reserved_bytes == 10 * 4 * item_bytes
@@ -1,4 +1,5 @@
 import glob
+import json
 from unittest.mock import MagicMock
 
 import pytest
@@ -60,3 +61,72 @@ def test_send_file_with_glob_characters_is_escaped(tmp_path, file_path):
     assert dir_watcher.update_policy.call_count == 1
     assert dir_watcher.update_policy.call_args[0][0] == glob.escape(file_path)
     assert str(dir_watcher.update_policy.call_args[0][1]) == "now"
+
+
+def _summary_record(summary):
+    record = pb.Record()
+    for key, value in summary.items():
+        record.summary.update.add(key=key, value_json=json.dumps(value))
+    return record
+
+
+def test_summary_save_debounced(tmp_path, test_settings):
+    settings = test_settings({"x_files_dir": str(tmp_path)})
+    sender = SendManager(
+        settings=SettingsStatic(settings.to_proto()),
+        record_q=MagicMock(),
+        result_q=MagicMock(),
+        interface=MagicMock(),
+        context_keeper=MagicMock(),
+    )
+    summary_file = tmp_path / "wandb-summary.json"
+
+    # the first update is written right away
+    sender.send_summary(_summary_record({"a": 1, "b": {"c": 2}}))
+    assert json.loads(summary_file.read_text()) == {"a": 1, "b": {"c": 2}}
+
+    # later updates within the debounce window are coalesced
+    sender.send_summary(_summary_record({"a": 2}))
+    sender.send_summary(_summary_record({"d": "x"}))
+    assert json.loads(summary_file.read_text()) == {"a": 1, "b": {"c": 2}}
+    assert sender._summary_dirty_keys == {"a", "d"}
+
+    sender.debounce(final=True)
+    assert json.loads(summary_file.read_text()) == {"a": 2, "b": {"c": 2}, "d": "x"}
+    assert not sender._summary_dirty_keys
+    assert not (tmp_path / "wandb-summary.json.tmp").exists()
+
+
+def test_summary_unchanged_keys_not_dirty(tmp_path, test_settings):
+    settings = test_settings({"x_files_dir": str(tmp_path)})
+    sender = SendManager(
+        settings=SettingsStatic(settings.to_proto()),
+        record_q=MagicMock(),
+        result_q=MagicMock(),
+        interface=MagicMock(),
+        context_keeper=MagicMock(),
+    )
+
+    sender.send_summary(_summary_record({"a": 1, "b": 2}))
+    sender.send_summary(_summary_record({"a": 1, "b": 3}))
+    assert sender._summary_dirty_keys == {"b"}
+
+
+def test_flush_job_uses_consolidated_summary(tmp_path, test_settings):
+    settings = test_settings({"x_files_dir": str(tmp_path)})
+    sender = SendManager(
+        settings=SettingsStatic(settings.to_proto()),
+        record_q=MagicMock(),
+        result_q=MagicMock(),
+        interface=MagicMock(),
+        context_keeper=MagicMock(),
+    )
+    sender._job_builder = MagicMock(disable=False)
+    sender._job_builder.build.return_value = None
+    sender._metadata_summary["runtime"] = 3
+
+    sender.send_summary(_summary_record({"a": 1, "b": 2}))
+    sender.send_summary(_summary_record({"b": 3}))
+    sender._flush_job()
+
+    sender._job_builder.set_summary.assert_called_once_with({"a": 1, "b": 3})
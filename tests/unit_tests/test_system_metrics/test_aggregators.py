@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from wandb.sdk.internal.system.assets import aggregators
+from wandb.sdk.internal.system.assets.aggregators import RingBuffer, aggregate_columns
+from wandb.sdk.internal.system.assets.cpu import CpuPercent
+
+
+def test_ring_buffer_keeps_most_recent_samples():
+    buffer = RingBuffer(capacity=3)
+    for value in range(5):
+        buffer.append(value)
+
+    assert len(buffer) == 3
+    assert [buffer[i] for i in range(3)] == [2.0, 3.0, 4.0]
+    assert buffer[-1] == 4.0
+    assert buffer.last() == [4.0]
+    assert buffer.mean() == [3.0]
+    assert (buffer.min(), buffer.max()) == ([2.0], [4.0])
+
+    buffer.clear()
+    assert not buffer
+
+
+def test_ring_buffer_rows():
+    buffer = RingBuffer(capacity=4)
+    buffer.append([1, 10])
+    buffer.append([3, 30])
+
+    assert buffer[0] == [1.0, 10.0]
+    assert buffer.mean() == [2.0, 20.0]
+
+    # A different number of devices starts over.
+    buffer.append([5, 50, 500])
+    assert len(buffer) == 1
+    assert buffer.mean() == [5.0, 50.0, 500.0]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_ring_buffer_statistics_match_numpy(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(aggregators, "_numpy", lambda: None)
+    monkeypatch.setattr(aggregators, "_NUMPY_MIN_SIZE", 0)
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(0, 100, size=(20, 16))
+    buffer = RingBuffer(capacity=15)
+    for row in samples:
+        buffer.append(row.tolist())
+
+    kept = samples[-15:]
+    assert buffer.mean() == pytest.approx(kept.mean(axis=0))
+    assert buffer.min() == pytest.approx(kept.min(axis=0))
+    assert buffer.max() == pytest.approx(kept.max(axis=0))
+    for q in (0, 50, 95, 100):
+        assert buffer.percentile(q) == pytest.approx(np.percentile(kept, q, axis=0))
+
+
+def test_aggregate_columns_with_percentiles(monkeypatch):
+    monkeypatch.setenv("WANDB_X_STATS_SAMPLES_TO_AGGREGATE", "8")
+    monkeypatch.setenv("WANDB_X_STATS_PERCENTILES", "50,95")
+    buffer = aggregators.new_buffer()
+    # The percentiles are read once, when the buffer is created.
+    monkeypatch.setenv("WANDB_X_STATS_PERCENTILES", "")
+    for value in range(1, 6):
+        buffer.append([value, value * 2])
+
+    assert aggregate_columns(buffer) == [
+        {"": 3.0, ".p50": 3.0, ".p95": 4.8},
+        {"": 6.0, ".p50": 6.0, ".p95": 9.6},
+    ]
+
+
+def test_invalid_percentiles_are_ignored(monkeypatch):
+    monkeypatch.setenv("WANDB_X_STATS_PERCENTILES", "bogus, 50, 150, -1, nan")
+    buffer = aggregators.new_buffer()
+    buffer.append(1.0)
+
+    assert buffer.percentiles == (50.0,)
+    assert aggregate_columns(buffer) == [{"": 1.0, ".p50": 1.0}]
+
+
+def test_cpu_percent_per_core(monkeypatch):
+    monkeypatch.setenv("WANDB_X_STATS_SAMPLES_TO_AGGREGATE", "4")
+    monkeypatch.setenv("WANDB_X_STATS_PERCENTILES", "95")
+    cpu_percent = CpuPercent()
+    samples = [[float(i + core) for core in range(256)] for i in range(4)]
+    with monkeypatch.context() as m:
+        m.setattr(
+            "wandb.sdk.internal.system.assets.cpu.psutil.cpu_percent",
+            lambda interval, percpu: samples.pop(0),
+        )
+        for _ in range(4):
+            cpu_percent.sample()
+
+    stats = cpu_percent.aggregate()
+
+    assert len(stats) == 2 * 256
+    assert stats["cpu.255.cpu_percent"] == 256.5
+    assert stats["cpu.255.cpu_percent.p95"] == 257.85
+
+
+def test_invalid_samples_to_aggregate_uses_default(monkeypatch):
+    monkeypatch.setenv("WANDB_X_STATS_SAMPLES_TO_AGGREGATE", "abc")
+
+    assert aggregators.new_buffer().capacity == 1
@@ -1,3 +1,4 @@
+import collections
 import threading
 import time
 from typing import Tuple
@@ -104,3 +105,55 @@ def test_gpu(test_settings):
         assert not interface.metrics_queue.empty()
 
     assert gpu.probe() == {}
+
+
+class CountingMockPynvml(MockPynvml):
+    def __init__(self, device_count: int) -> None:
+        self.device_count = device_count
+        self.calls = collections.Counter()
+
+    def __getattribute__(self, name: str):
+        if name.startswith("nvmlDevice"):
+            self.calls[name] += 1
+        return super().__getattribute__(name)
+
+    def nvmlDeviceGetCount(self) -> int:  # noqa: N802
+        return self.device_count
+
+
+def test_gpu_metrics_share_device_queries(test_settings):
+    mock_pynvml = CountingMockPynvml(device_count=4)
+    settings = SettingsStatic(test_settings().to_proto())
+
+    gpu = GPU(
+        interface=AssetInterface(),
+        settings=settings,
+        shutdown_event=threading.Event(),
+    )
+
+    with mock.patch.object(
+        wandb.sdk.internal.system.assets.gpu,
+        "pynvml",
+        mock_pynvml,
+    ), mock.patch.object(
+        wandb.sdk.internal.system.assets.gpu,
+        "gpu_in_use_by_this_process",
+        lambda *_: True,
+    ):
+        gpu.metrics_monitor.sample()
+        stats = {}
+        for metric in gpu.metrics:
+            stats.update(metric.aggregate())
+
+    # Each device is queried once per tick, however many metrics read it.
+    assert mock_pynvml.calls == {
+        "nvmlDeviceGetCount": 1,
+        "nvmlDeviceGetHandleByIndex": 4,
+        "nvmlDeviceGetUtilizationRates": 4,
+        "nvmlDeviceGetMemoryInfo": 4,
+        "nvmlDeviceGetTemperature": 4,
+        "nvmlDeviceGetPowerUsage": 4,
+        "nvmlDeviceGetEnforcedPowerLimit": 4,
+    }
+    assert stats["gpu.3.memoryAllocated"] == round(24 / 42 * 100, 2)
+    assert stats["gpu.process.3.powerWatts"] == round(40.5 / 1000, 2)
@@ -8,11 +8,13 @@ import pytest
 import requests
 import wandb
 from wandb.sdk.internal.settings_static import SettingsStatic
-from wandb.sdk.internal.system.assets import OpenMetrics
-from wandb.sdk.internal.system.assets.interfaces import Asset
+from wandb.sdk.internal.system.assets import OpenMetrics, open_metrics
+from wandb.sdk.internal.system.assets.interfaces import Asset, MetricsScheduler
 from wandb.sdk.internal.system.assets.open_metrics import (
+    OpenMetricsMetric,
+    _compile_filters,
+    _matches_filters,
     _nested_dict_to_tuple,
-    _should_capture_metric,
     _tuple_to_nested_dict,
 )
 from wandb.sdk.internal.system.system_monitor import AssetInterface
@@ -236,15 +238,18 @@ def test_metric_filters(
     filters, endpoint_name, metric_name, metric_labels, should_capture
 ):
     assert (
-        _should_capture_metric(
-            endpoint_name,
-            metric_name,
-            tuple(metric_labels.items()),
-            _nested_dict_to_tuple(filters),
+        _matches_filters(
+            _compile_filters(_nested_dict_to_tuple(filters)),
+            f"{endpoint_name}.{metric_name}",
+            metric_labels,
         )
         is should_capture
     )
 
+    metric = OpenMetricsMetric(endpoint_name, "url", filters)
+    key = metric._series_key(metric_name, tuple(metric_labels.items()))
+    assert (key is not None) is should_capture
+
 
 @pytest.mark.parametrize(
     "filters,result",
@@ -266,3 +271,109 @@ def test_metric_filters(
 def test_metric_filters_nested_dict_to_tuple(filters, result):
     assert _nested_dict_to_tuple(filters) == result
     assert filters == _tuple_to_nested_dict(result)
+
+
+def test_endpoints_are_scraped_concurrently(test_settings):
+    def slow_get(*args, **kwargs):
+        time.sleep(0.5)
+        return mocked_requests_get()
+
+    interface = AssetInterface()
+    settings = SettingsStatic(test_settings().to_proto())
+    shutdown_event = threading.Event()
+    scheduler = MetricsScheduler(1, shutdown_event)
+
+    with mock.patch.object(
+        wandb.sdk.internal.system.assets.open_metrics.requests.Session,
+        "get",
+        slow_get,
+    ):
+        endpoints = [
+            OpenMetrics(interface, settings, shutdown_event, f"node{i}", "url")
+            for i in range(4)
+        ]
+        for endpoint in endpoints:
+            endpoint.metrics_monitor.scheduler = scheduler
+            endpoint.start()
+
+        start = time.monotonic()
+        scheduler.tick()
+        elapsed = time.monotonic() - start
+
+        shutdown_event.set()
+        for endpoint in endpoints:
+            endpoint.finish()
+
+    assert elapsed < 1.5
+    stats = {}
+    while not interface.metrics_queue.empty():
+        stats.update(interface.metrics_queue.get())
+    for i in range(4):
+        assert f"openmetrics.node{i}.DCGM_FI_DEV_GPU_TEMP.1" in stats
+
+
+@pytest.mark.parametrize("timeout", ["x", "0", "-1", "nan"])
+def test_invalid_timeout_uses_default(monkeypatch, timeout):
+    monkeypatch.setenv("WANDB_X_STATS_OPEN_METRICS_TIMEOUT", timeout)
+
+    metric = OpenMetricsMetric("node", "url", None)
+
+    assert metric.timeout == open_metrics._REQUEST_TIMEOUT
+
+
+def test_hanging_endpoint_times_out(monkeypatch):
+    monkeypatch.setenv("WANDB_X_STATS_OPEN_METRICS_TIMEOUT", "0.1")
+    release = threading.Event()
+    calls = []
+
+    def hanging_get(*args, **kwargs):
+        calls.append(kwargs["timeout"])
+        release.wait()
+        return mocked_requests_get()
+
+    metric = OpenMetricsMetric("node", "url", None)
+    metric.setup()
+    try:
+        with mock.patch.object(
+            wandb.sdk.internal.system.assets.open_metrics.requests.Session,
+            "get",
+            hanging_get,
+        ):
+            for _ in range(2):
+                with pytest.raises(TimeoutError):
+                    metric.sample()
+            # The scrape that is still running isn't queued again.
+            assert calls == [0.1]
+
+            release.set()
+            time.sleep(0.1)
+            metric.sample()
+            assert "DCGM_FI_DEV_GPU_TEMP.0" in metric.samples[0]
+    finally:
+        metric.teardown()
+
+
+def test_series_are_resolved_once(monkeypatch):
+    matches = []
+    matches_filters = open_metrics._matches_filters
+
+    def counting_matches_filters(filters, full_name, labels):
+        matches.append(full_name)
+        return matches_filters(filters, full_name, labels)
+
+    monkeypatch.setattr(open_metrics, "_matches_filters", counting_matches_filters)
+    metric = OpenMetricsMetric("node", "url", {".*GPU_TEMP": {"gpu": "1"}})
+    metric.setup()
+    try:
+        with mock.patch.object(
+            wandb.sdk.internal.system.assets.open_metrics.requests.Session,
+            "get",
+            mocked_requests_get,
+        ):
+            measurements = [metric.parse_open_metrics_endpoint() for _ in range(3)]
+    finally:
+        metric.teardown()
+
+    # two samples of each of three metrics
+    assert len(matches) == 6
+    assert [list(m) for m in measurements] == [["DCGM_FI_DEV_GPU_TEMP.0"]] * 3
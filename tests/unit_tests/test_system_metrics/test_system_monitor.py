@@ -16,7 +16,7 @@ from wandb.sdk.internal.system.assets import (
     Trainium,
 )
 from wandb.sdk.internal.system.assets.asset_registry import asset_registry
-from wandb.sdk.internal.system.assets.interfaces import MetricsMonitor
+from wandb.sdk.internal.system.assets.interfaces import MetricsMonitor, MetricsScheduler
 from wandb.sdk.internal.system.system_monitor import AssetInterface
 
 if TYPE_CHECKING:
@@ -163,3 +163,55 @@ def test_metrics_monitor(capsys, test_settings):
         assert metric_record == {mock_metric.name: 42}
 
     assert len(mock_metric.samples) == 0
+
+
+class ThreadRecordingMetric(MockMetric):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.samples = deque()
+        self.threads = set()
+
+    def sample(self) -> None:
+        self.threads.add(threading.current_thread().name)
+        super().sample()
+
+
+def test_metrics_scheduler(test_settings):
+    # test that a single thread samples the metrics of all monitors
+    interface = AssetInterface()
+    settings = SettingsStatic(
+        test_settings(
+            dict(
+                _stats_sample_rate_seconds=0.1,
+                _stats_samples_to_average=2,
+            )
+        ).to_proto()
+    )
+    shutdown_event = threading.Event()
+    scheduler = MetricsScheduler(0.1, shutdown_event)
+
+    metrics = [
+        ThreadRecordingMetric(name="mock_metric_1", value=42),
+        ThreadRecordingMetric(name="mock_metric_2", value=24),
+    ]
+    for metric in metrics:
+        metrics_monitor = MetricsMonitor(
+            metric.name, [metric], interface, settings, shutdown_event
+        )
+        metrics_monitor.scheduler = scheduler
+        metrics_monitor.start()
+        assert metrics_monitor._process is None
+
+    scheduler.start()
+    time.sleep(1)
+    shutdown_event.set()
+    scheduler.join()
+
+    records = []
+    while not interface.metrics_queue.empty():
+        records.append(interface.metrics_queue.get())
+    assert {"mock_metric_1": 42} in records
+    assert {"mock_metric_2": 24} in records
+    for metric in metrics:
+        assert metric.threads == {"MetricsSampler"}
+        assert len(metric.samples) == 0
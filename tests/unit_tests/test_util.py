@@ -1,5 +1,6 @@
 import datetime
 import enum
+import json
 import os
 import platform
 import random
@@ -809,3 +810,60 @@ def test_json_dump_uncompressed_with_numpy_datatypes():
     iostr = io.StringIO()
     util.json_dump_uncompressed(data, iostr)
     assert iostr.getvalue() == '{"a": [1, 2.0, 3]}'
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        1,
+        1.5,
+        float("nan"),
+        "text",
+        True,
+        None,
+        np.float64(0.1),
+        np.float64("nan"),
+        np.float32(0.1),
+        np.float32("nan"),
+        np.int64(5),
+        np.bool_(True),
+        np.datetime64("2020-01-01"),
+        np.str_("text"),
+        np.array(1.0),
+        np.zeros(3),
+        np.arange(100),
+        [np.int64(1), 2],
+        {"a": np.float32(1.0)},
+    ],
+)
+def test_json_dumps_safer_history_fast_path(value):
+    expected = json.dumps(value, cls=util.WandBHistoryJSONEncoder)
+    assert util.json_dumps_safer_history(value) == expected
+
+
+def test_history_scalar_encoder_cached_by_type():
+    assert util.history_scalar_encoder(np.int16(1)) is not None
+    assert np.int16 in util._history_scalar_encoders
+    assert util.history_scalar_encoder(np.zeros(3)) is None
+    assert util._history_scalar_encoders[np.ndarray] is None
+    assert util.history_scalar_encoder(np.datetime64("2020-01-01")) is None
+
+
+def test_val_to_json_converts_non_numeric_numpy_scalars():
+    from wandb.sdk.data_types.utils import val_to_json
+
+    value = np.datetime64("2020-01-01")
+    converted = val_to_json(None, "key", value, namespace=0)
+
+    assert util.json_dumps_safer_history(converted) == '"2020-01-01"'
+
+
+def test_pytorch_json_fast_path():
+    pytest.importorskip("torch")
+    import torch
+
+    assert util.json_dumps_safer_history(torch.tensor(1.5)) == "1.5"
+    # tensors with dimensions go through the full encoder
+    assert util.json_dumps_safer_history(torch.tensor([1.5])) == "1.5"
+    assert util.is_history_scalar(torch.tensor(1.5))
+    assert not util.is_history_scalar(torch.tensor([1.5]))
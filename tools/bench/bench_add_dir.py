@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Benchmark Artifact.add_dir on a large tree, run twice.
+
+The second run reuses digests from the persistent digest cache:
+
+    WANDB_X_DIGEST_CACHE=true ./bench_add_dir.py --num-files 100000 --file-size 4096
+    ./bench_add_dir.py --num-files 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from wandb.sdk.artifacts.artifact import Artifact
+
+
+def make_tree(root: str, num_files: int, file_size: int, files_per_dir: int) -> None:
+    # Files are backdated, since digests of just modified files aren't cached.
+    mtime = time.time() - 3600
+    for i in range(num_files):
+        dirname = os.path.join(root, f"dir_{i // files_per_dir:05d}")
+        if i % files_per_dir == 0:
+            os.makedirs(dirname)
+        path = os.path.join(dirname, f"file_{i:07d}.bin")
+        with open(path, "wb") as f:
+            f.write(os.urandom(file_size))
+        os.utime(path, (mtime, mtime))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", default=None, help="directory to create the tree in")
+    parser.add_argument("--num-files", type=int, default=100000)
+    parser.add_argument("--file-size", type=int, default=4096)
+    parser.add_argument("--files-per-dir", type=int, default=1000)
+    parser.add_argument(
+        "--policy", default="immutable", choices=["mutable", "immutable"]
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmpdir:
+        tree = os.path.join(tmpdir, "tree")
+        os.makedirs(tree)
+        # Keep the digest cache of this benchmark separate from the user's.
+        os.environ["WANDB_CACHE_DIR"] = os.path.join(tmpdir, "cache")
+        make_tree(tree, args.num_files, args.file_size, args.files_per_dir)
+
+        print(f"{'run':<6} {'seconds':>8} {'files/sec':>10}")
+        for run in ("first", "second"):
+            start = time.perf_counter()
+            Artifact("bench", type="dataset").add_dir(tree, policy=args.policy)
+            elapsed = time.perf_counter() - start
+            print(f"{run:<6} {elapsed:>8.1f} {args.num_files / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Benchmark transaction log write throughput for each datastore sync mode.
+
+Run once against a tmpfs directory and once against a slow disk, e.g.:
+
+    ./bench_datastore.py --dir /dev/shm
+    ./bench_datastore.py --dir /mnt/nfs/scratch
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import wandb
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import datastore
+
+
+def make_record(record_size: int) -> pb.Record:
+    record = pb.Record()
+    item = record.history.item.add()
+    item.key = "payload"
+    item.value_json = "x" * record_size
+    return record
+
+
+def run_one(args, sync_mode: str) -> float:
+    record = make_record(args.record_size)
+    ds = datastore.DataStore(
+        sync_mode=sync_mode,
+        sync_interval=args.sync_interval,
+        sync_bytes=args.sync_bytes,
+    )
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmpdir:
+        ds.open_for_write(os.path.join(tmpdir, "bench.wandb"))
+        start = time.perf_counter()
+        for _ in range(args.num_records):
+            ds.write(record)
+        ds.close()
+        elapsed = time.perf_counter() - start
+    return args.num_records / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", default=None, help="directory to write into")
+    parser.add_argument("--num-records", type=int, default=20000)
+    parser.add_argument("--record-size", type=int, default=40000)
+    parser.add_argument("--sync-interval", type=float, default=1.0)
+    parser.add_argument("--sync-bytes", type=int, default=4 * 1024 * 1024)
+    parser.add_argument(
+        "--modes", nargs="+", default=list(datastore.DATASTORE_SYNC_MODES)
+    )
+    args = parser.parse_args()
+
+    # DataStore refuses to run outside of the internal process
+    wandb._IS_INTERNAL_PROCESS = True
+
+    rates = {sync_mode: run_one(args, sync_mode) for sync_mode in args.modes}
+    baseline = rates.get(datastore.DATASTORE_SYNC_BLOCK)
+
+    print(f"{'mode':<8} {'records/sec':>12} {'vs block':>9}")
+    for sync_mode, rate in rates.items():
+        speedup = f"{rate / baseline:.2f}x" if baseline else "-"
+        print(f"{sync_mode:<8} {rate:>12.0f} {speedup:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Benchmark file_stream request compression against a local mock server.
+
+Pushes a synthetic history through FileStreamApi._send and reports the
+bytes received by the server and end-to-end throughput for each
+compression mode:
+
+    ./bench_file_stream.py --num-rows 1000000
+"""
+
+import argparse
+import gzip
+import http.server
+import json
+import threading
+import time
+from unittest import mock
+
+from wandb.sdk.internal import file_stream
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    bytes_received = 0
+
+    def do_POST(self):  # noqa: N802
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        _Handler.bytes_received += len(body)
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "zstd":
+            import zstandard
+
+            body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        json.loads(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+def make_rows(num_rows: int, num_keys: int):
+    for step in range(num_rows):
+        row = {f"loss/layer_{i}": 1.0 / (step + i + 1) for i in range(num_keys)}
+        row["_step"] = step
+        row["_runtime"] = step * 0.1
+        row["_timestamp"] = 1700000000 + step * 0.1
+        yield json.dumps(row)
+
+
+def run_one(args, base_url: str, compression: str):
+    api = mock.MagicMock()
+    api.client.transport.headers = {}
+    api.client.transport.cookies = {}
+    api.client.transport.session.proxies = {}
+    api.client.transport.session.auth = None
+    api.settings.return_value = {
+        "base_url": base_url,
+        "entity": "entity",
+        "project": "project",
+    }
+    fs = file_stream.FileStreamApi(
+        api, "run", start_time=time.time(), compression=compression
+    )
+    fs._init_endpoint()
+    fs.set_file_policy("wandb-history.jsonl", file_stream.JsonlFilePolicy())
+
+    _Handler.bytes_received = 0
+    start = time.perf_counter()
+    chunks = []
+    for line in make_rows(args.num_rows, args.num_keys):
+        chunks.append(file_stream.Chunk("wandb-history.jsonl", line))
+        if len(chunks) == args.batch_rows:
+            fs._send(chunks)
+            chunks = []
+    if chunks:
+        fs._send(chunks)
+    elapsed = time.perf_counter() - start
+    return _Handler.bytes_received, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-rows", type=int, default=1000000)
+    parser.add_argument("--num-keys", type=int, default=10)
+    parser.add_argument("--batch-rows", type=int, default=10000)
+    parser.add_argument("--modes", nargs="+", default=["none", "gzip", "zstd"])
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'mode':<6} {'MiB on wire':>12} {'seconds':>8} {'rows/sec':>10}")
+    for compression in args.modes:
+        num_bytes, elapsed = run_one(args, base_url, compression)
+        print(
+            f"{compression:<6} {num_bytes / 2**20:>12.1f} {elapsed:>8.1f}"
+            f" {args.num_rows / elapsed:>10.0f}"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
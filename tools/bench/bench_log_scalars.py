@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""Microbenchmark wandb.log calls/sec with numpy/torch scalars in offline mode.
+
+Logs `--num-steps` rows of `--num-keys` scalars each and reports the calls per
+second:
+
+    ./bench_log_scalars.py --num-steps 20000 --num-keys 12
+"""
+
+import argparse
+import time
+
+import numpy as np
+import wandb
+
+
+def make_values(num_keys: int, use_torch: bool):
+    values = [np.float32(0.5), np.float64(0.25), np.int64(3)]
+    if use_torch:
+        import torch
+
+        values.append(torch.tensor(0.125))
+    return {f"metric_{i}": values[i % len(values)] for i in range(num_keys)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-steps", type=int, default=20000)
+    parser.add_argument("--num-keys", type=int, default=12)
+    parser.add_argument("--torch", action="store_true", help="include torch scalars")
+    args = parser.parse_args()
+
+    data = make_values(args.num_keys, args.torch)
+    with wandb.init(mode="offline") as run:
+        start = time.perf_counter()
+        for _ in range(args.num_steps):
+            run.log(dict(data))
+        elapsed = time.perf_counter() - start
+
+    print(f"{args.num_steps / elapsed:.0f} wandb.log calls/sec")
+
+
+if __name__ == "__main__":
+    main()
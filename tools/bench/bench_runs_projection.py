@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""Benchmark field projection in Api.runs against a local mock server.
+
+The server answers the runs query with synthetic runs that carry a large
+config, summary and system metrics, leaving out whatever the query doesn't
+select. Reports the bytes received and wall time for listing all runs with
+the full fragment and with a projection:
+
+    ./bench_runs_projection.py --num-runs 5000 --num-keys 500
+"""
+
+import argparse
+import http.server
+import json
+import re
+import threading
+import time
+
+import wandb
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    bytes_sent = 0
+    num_runs = 0
+    num_keys = 0
+    page_size = 0
+
+    def do_POST(self):  # noqa: N802
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        query = request["query"]
+        name = re.search(r"query (\w+)", query).group(1)
+        if name == "ProbeRunSummaryMetricsArgs":
+            data = {
+                "RunType": {
+                    "fields": [{"name": "summaryMetrics", "args": [{"name": "keys"}]}]
+                }
+            }
+        elif name == "Runs":
+            data = self.runs(query, request.get("variables") or {})
+        else:
+            data = {}
+        body = json.dumps({"data": data}).encode()
+        _Handler.bytes_sent += len(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def runs(self, query, variables):
+        fragment = query[query.index("fragment RunFragment") :]
+        selected = set(re.findall(r"^\s+(\w+)", fragment, re.MULTILINE))
+        summary_keys = variables.get("summaryKeys")
+        start = int(variables.get("cursor") or 0)
+        end = min(start + int(variables.get("perPage") or 50), self.num_runs)
+        metrics = {f"metric_{i}": i * 0.5 for i in range(self.num_keys)}
+        edges = []
+        for i in range(start, end):
+            node = {
+                "id": f"id-{i}",
+                "name": f"run-{i}",
+                "displayName": f"run {i}",
+                "sweepName": None,
+                "state": "finished",
+                "tags": ["bench"],
+                "createdAt": "2024-01-01T00:00:00",
+                "heartbeatAt": "2024-01-01T00:00:00",
+                "config": json.dumps(
+                    {f"param_{k}": {"value": k} for k in range(self.num_keys)}
+                ),
+                "summaryMetrics": json.dumps(
+                    {k: metrics[k] for k in summary_keys if k in metrics}
+                    if summary_keys is not None
+                    else metrics
+                ),
+                "systemMetrics": json.dumps(
+                    {f"system.gpu.{k}": k for k in range(self.num_keys)}
+                ),
+            }
+            edges.append(
+                {
+                    "node": {k: v for k, v in node.items() if k in selected},
+                    "cursor": str(i + 1),
+                }
+            )
+        return {
+            "project": {
+                "internalId": "project",
+                "runCount": self.num_runs,
+                "readOnly": False,
+                "runs": {
+                    "edges": edges,
+                    "pageInfo": {
+                        "endCursor": str(end),
+                        "hasNextPage": end < self.num_runs,
+                    },
+                },
+            }
+        }
+
+    def log_message(self, *args):
+        pass
+
+
+def run_one(api, args, **kwargs):
+    _Handler.bytes_sent = 0
+    start = time.perf_counter()
+    runs = api.runs("entity/project", per_page=args.per_page, **kwargs)
+    total = 0.0
+    for run in runs:
+        total += run.summary_metrics.get("metric_0", 0)
+    elapsed = time.perf_counter() - start
+    return _Handler.bytes_sent, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-runs", type=int, default=5000)
+    parser.add_argument("--num-keys", type=int, default=500)
+    parser.add_argument("--per-page", type=int, default=100)
+    args = parser.parse_args()
+
+    _Handler.num_runs = args.num_runs
+    _Handler.num_keys = args.num_keys
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    api = wandb.Api(
+        api_key="x" * 40,
+        overrides={"base_url": f"http://127.0.0.1:{server.server_address[1]}"},
+    )
+
+    modes = {
+        "full": {},
+        "projected": {"fields": ["state"], "summary_keys": ["metric_0"]},
+    }
+    print(f"{'mode':<10} {'MiB on wire':>12} {'seconds':>8} {'runs/sec':>10}")
+    for mode, kwargs in modes.items():
+        num_bytes, elapsed = run_one(api, args, **kwargs)
+        print(
+            f"{mode:<10} {num_bytes / 2**20:>12.1f} {elapsed:>8.2f}"
+            f" {args.num_runs / elapsed:>10.0f}"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
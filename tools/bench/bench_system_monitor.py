@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Benchmark the CPU time the system monitor spends sampling GPU metrics.
+
+Samples the GPU metrics of a node with a stubbed NVML library, once with every
+metric querying the devices itself and once with the metrics sharing one
+snapshot of the device queries per tick. NVML calls are modeled with a busy
+wait of `--call-cost-us` microseconds. Reports the NVML calls and CPU time per
+tick of each:
+
+    ./bench_system_monitor.py --num-gpus 8 --num-ticks 2000
+"""
+
+import argparse
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import wandb
+from wandb.sdk.internal.settings_static import SettingsStatic
+from wandb.sdk.internal.system.assets import gpu
+from wandb.sdk.internal.system.assets.interfaces import MetricsMonitor, Snapshot
+from wandb.sdk.internal.system.system_monitor import AssetInterface
+
+
+class StubPynvml:
+    NVMLError = Exception
+    NVML_TEMPERATURE_GPU = 0
+
+    def __init__(self, num_gpus, call_cost):
+        self.num_gpus = num_gpus
+        self.call_cost = call_cost
+        self.calls = 0
+
+    def _call(self, value):
+        self.calls += 1
+        end = time.perf_counter() + self.call_cost
+        while time.perf_counter() < end:
+            pass
+        return value
+
+    def nvmlDeviceGetCount(self):  # noqa: N802
+        return self._call(self.num_gpus)
+
+    def nvmlDeviceGetHandleByIndex(self, index):  # noqa: N802
+        return self._call(index)
+
+    def nvmlDeviceGetUtilizationRates(self, handle):  # noqa: N802
+        return self._call(SimpleNamespace(gpu=50.0, memory=25.0))
+
+    def nvmlDeviceGetMemoryInfo(self, handle):  # noqa: N802
+        return self._call(SimpleNamespace(used=2**33, total=2**34))
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):  # noqa: N802
+        return self._call(60.0)
+
+    def nvmlDeviceGetPowerUsage(self, handle):  # noqa: N802
+        return self._call(250_000)
+
+    def nvmlDeviceGetEnforcedPowerLimit(self, handle):  # noqa: N802
+        return self._call(400_000)
+
+
+def make_monitor(settings, snapshot):
+    metric_classes = (
+        gpu.GPUMemoryAllocated,
+        gpu.GPUMemoryAllocatedBytes,
+        gpu.GPUMemoryUtilization,
+        gpu.GPUUtilization,
+        gpu.GPUTemperature,
+        gpu.GPUPowerUsageWatts,
+        gpu.GPUPowerUsagePercent,
+    )
+    metrics = [cls(settings.x_stats_pid, snapshot) for cls in metric_classes]
+    return MetricsMonitor(
+        "gpu", metrics, AssetInterface(), settings, threading.Event(), snapshot
+    )
+
+
+def run_one(monitor, pynvml, num_ticks):
+    pynvml.calls = 0
+    start = time.thread_time()
+    for _ in range(num_ticks):
+        monitor.sample()
+        for metric in monitor.metrics:
+            metric.clear()
+    elapsed = time.thread_time() - start
+    return pynvml.calls / num_ticks, elapsed / num_ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-gpus", type=int, default=8)
+    parser.add_argument("--num-ticks", type=int, default=2000)
+    parser.add_argument("--call-cost-us", type=float, default=5.0)
+    args = parser.parse_args()
+
+    settings = SettingsStatic(wandb.Settings(x_stats_pid=0).to_proto())
+    pynvml = StubPynvml(args.num_gpus, args.call_cost_us / 1e6)
+    modes = {
+        "per-metric": Snapshot(cache=False),
+        "snapshot": Snapshot(),
+    }
+    print(f"{'mode':<12} {'NVML calls/tick':>16} {'CPU us/tick':>12}")
+    with mock.patch.object(gpu, "pynvml", pynvml):
+        for mode, snapshot in modes.items():
+            monitor = make_monitor(settings, snapshot)
+            calls, cpu_time = run_one(monitor, pynvml, args.num_ticks)
+            print(f"{mode:<12} {calls:>16.0f} {cpu_time * 1e6:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Benchmark reading tfevents files into history as `wandb sync` does.
+
+Writes a tfevents file of `--num-steps` steps with `--num-scalars` scalar
+summaries each, then reads it with `TBWatcher` into a local queue the way
+`wandb sync --sync-tensorboard` does, without uploading anything.
+
+Reports two timings. "read" ends when the last history row is queued, and is
+what to compare between revisions. "total" ends when the watcher finishes,
+so it also includes any shutdown grace period, which depends on how the
+watcher decides that the files are complete:
+
+    ./bench_tb_sync.py --num-steps 100000 --num-scalars 10
+
+Run it on a checkout of an earlier revision to compare.
+"""
+
+import argparse
+import os
+import queue
+import socket
+import tempfile
+import time
+
+import wandb
+from tensorboard.compat.proto import event_pb2
+from tensorboard.summary.writer.record_writer import RecordWriter
+from wandb.proto import wandb_internal_pb2
+from wandb.sdk.interface.interface_queue import InterfaceQueue
+from wandb.sdk.internal import tb_watcher
+from wandb.sdk.internal.settings_static import SettingsStatic
+
+try:
+    from wandb.sdk.internal import tfrecord
+except ImportError:  # revisions that read files with tensorboard
+    tfrecord = None
+
+
+class HistoryQueue(queue.Queue):
+    """A record queue that remembers when the last history row was put."""
+
+    last_history_time = 0.0
+
+    def put(self, item, *args, **kwargs):
+        super().put(item, *args, **kwargs)
+        if item.WhichOneof("record_type") == "history":
+            self.last_history_time = time.perf_counter()
+
+
+def write_events(logdir, num_steps, num_scalars):
+    path = os.path.join(
+        logdir, f"events.out.tfevents.{int(time.time())}.{socket.gethostname()}"
+    )
+    with open(path, "wb") as f:
+        writer = RecordWriter(f)
+        event = event_pb2.Event(wall_time=time.time(), file_version="brain.Event:2")
+        writer.write(event.SerializeToString())
+        for step in range(num_steps):
+            event = event_pb2.Event(wall_time=time.time(), step=step)
+            for i in range(num_scalars):
+                event.summary.value.add(tag=f"metric_{i}", simple_value=step / (i + 1))
+            writer.write(event.SerializeToString())
+    # Files are backdated, as the files of a finished run would be.
+    mtime = time.time() - 3600
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-steps", type=int, default=100000)
+    parser.add_argument("--num-scalars", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logdir = os.path.join(tmpdir, "logs")
+        os.makedirs(logdir)
+        path = write_events(logdir, args.num_steps, args.num_scalars)
+        size = os.path.getsize(path)
+
+        settings = wandb.Settings(root_dir=tmpdir, run_id="bench", x_start_time=0)
+        os.makedirs(settings.files_dir)
+        run_proto = wandb_internal_pb2.RunRecord(run_id="bench")
+        record_q = HistoryQueue()
+
+        start = time.perf_counter()
+        watcher = tb_watcher.TBWatcher(
+            SettingsStatic(settings.to_proto()),
+            run_proto,
+            InterfaceQueue(record_q),
+            True,
+        )
+        watcher.add(logdir, False, tmpdir)
+        watcher.finish()
+        elapsed = time.perf_counter() - start
+        read_elapsed = record_q.last_history_time - start
+
+        rows = 0
+        while not record_q.empty():
+            if record_q.get().WhichOneof("record_type") == "history":
+                rows += 1
+
+    print(f"tfevents file: {size / 2**20:.1f} MiB")
+    if tfrecord is not None:
+        crc = "python" if tfrecord.crc32c is tfrecord._crc32c_python else "native"
+        print(f"crc32c: {crc}")
+    print(f"{'':>6} {'seconds':>8} {'rows':>8} {'rows/sec':>10}")
+    for name, seconds in (("read", read_elapsed), ("total", elapsed)):
+        print(f"{name:>6} {seconds:>8.2f} {rows:>8} {rows / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
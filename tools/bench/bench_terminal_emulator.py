@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark the terminal emulator used to capture console output.
+
+Records a transcript of tqdm progress bars interleaved with colored log lines,
+then feeds it to `TerminalEmulator` one write at a time, reading the screen
+every `--read-every` writes like the console callback does. Reports the time
+spent and the characters processed per second. Pass `--baseline` to also run
+the emulator of another git revision on the same transcript:
+
+    ./bench_terminal_emulator.py --num-epochs 20 --baseline HEAD~1
+"""
+
+import argparse
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import tqdm
+from wandb.sdk.lib import redirect
+
+
+class RecordingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, s):
+        self.writes.append(s)
+        return len(s)
+
+
+def make_transcript(num_epochs, num_steps):
+    stream = RecordingStream()
+    for epoch in range(num_epochs):
+        for _ in tqdm.tqdm(
+            range(num_steps),
+            desc=f"epoch {epoch}",
+            file=stream,
+            mininterval=0,
+            miniters=1,
+            ncols=100,
+        ):
+            pass
+        stream.write(
+            f"\x1b[32mINFO\x1b[0m epoch {epoch}: "
+            f"\x1b[1mloss=0.{epoch:04d}\x1b[22m accuracy=0.9{epoch:03d}\n"
+        )
+    return stream.writes
+
+
+def load_emulator(rev):
+    source = subprocess.check_output(
+        ["git", "show", f"{rev}:wandb/sdk/lib/redirect.py"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    with tempfile.NamedTemporaryFile("wb", suffix=".py", delete=False) as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location("redirect_baseline", f.name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    os.unlink(f.name)
+    return module.TerminalEmulator
+
+
+def run_one(emulator_cls, writes, read_every):
+    emulator = emulator_cls()
+    output = []
+    start = time.perf_counter()
+    for i, data in enumerate(writes, 1):
+        emulator.write(data)
+        if i % read_every == 0:
+            output.append(emulator.read())
+    output.append(emulator.read())
+    return time.perf_counter() - start, "".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-epochs", type=int, default=20)
+    parser.add_argument("--num-steps", type=int, default=1000)
+    parser.add_argument("--read-every", type=int, default=100)
+    parser.add_argument("--baseline", help="git revision to compare against")
+    args = parser.parse_args()
+
+    writes = make_transcript(args.num_epochs, args.num_steps)
+    num_chars = sum(map(len, writes))
+    print(f"transcript: {len(writes)} writes, {num_chars} characters", file=sys.stderr)
+
+    emulators = {"current": redirect.TerminalEmulator}
+    if args.baseline:
+        emulators[args.baseline] = load_emulator(args.baseline)
+
+    print(f"{'emulator':<12} {'seconds':>8} {'chars/sec':>12}")
+    outputs = {}
+    for name, emulator_cls in emulators.items():
+        elapsed, outputs[name] = run_one(emulator_cls, writes, args.read_every)
+        print(f"{name:<12} {elapsed:>8.2f} {num_chars / elapsed:>12.0f}")
+    if len(set(outputs.values())) > 1:
+        print("warning: the emulators produced different output", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
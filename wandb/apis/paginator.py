@@ -1,9 +1,15 @@
-from typing import TYPE_CHECKING, Any, MutableMapping, Optional
+import copy
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Iterator, List, MutableMapping, Optional
 
 if TYPE_CHECKING:
     from wandb_gql import Client
 
 
+_END_OF_PAGES = object()
+
+
 class Paginator:
     QUERY = None
 
@@ -52,16 +58,83 @@ class Paginator:
     def update_variables(self):
         self.variables.update({"perPage": self.per_page, "cursor": self.cursor})
 
-    def _load_page(self):
+    def _fetch_page(self) -> Optional[List[Any]]:
         if not self.more:
-            return False
+            return None
         self.update_variables()
         self.last_response = self.client.execute(
             self.QUERY, variable_values=self.variables
         )
-        self.objects.extend(self.convert_objects())
+        return list(self.convert_objects())
+
+    def _load_page(self):
+        objects = self._fetch_page()
+        if objects is None:
+            return False
+        self.objects.extend(objects)
         return True
 
+    def stream(self, prefetch: int = 1) -> Iterator[Any]:
+        """Iterate over all objects, fetching pages ahead on a background thread.
+
+        Up to `prefetch` pages are requested while the caller handles the
+        current one. Unlike iterating the paginator itself, pages fetched by
+        the stream are not kept in `objects`, so memory use stays bounded no
+        matter how many objects there are.
+
+        The stream pages with its own copy of the cursor, so the paginator
+        itself is left as it was, and iterating or indexing it afterwards
+        doesn't skip the streamed pages.
+
+        Args:
+            prefetch: The number of pages to fetch ahead of the caller.
+        """
+        yield from list(self.objects)
+
+        pager = copy.copy(self)
+        pager.variables = dict(self.variables)
+        pager.objects = []
+        pages: queue.Queue = queue.Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch_pages() -> None:
+            try:
+                while not stop.is_set():
+                    objects = pager._fetch_page()
+                    if objects is None:
+                        break
+                    put(objects)
+            except Exception as e:
+                put(e)
+            else:
+                put(_END_OF_PAGES)
+
+        thread = threading.Thread(
+            target=fetch_pages, name="PaginatorPrefetch", daemon=True
+        )
+        thread.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is _END_OF_PAGES:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                yield from page
+                # Don't hold on to a consumed page while waiting for the next.
+                del page
+        finally:
+            stop.set()
+            thread.join()
+
     def __getitem__(self, index):
         loaded = True
         stop = index.stop if isinstance(index, slice) else index
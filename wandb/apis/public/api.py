@@ -908,6 +908,8 @@ class Api:
         order: str = "+created_at",
         per_page: int = 50,
         include_sweeps: bool = True,
+        fields: Optional[List[str]] = None,
+        summary_keys: Optional[List[str]] = None,
     ):
         """Return a set of runs from a project that match the filters provided.
 
@@ -1003,6 +1005,15 @@ class Api:
             api.runs(path="my_entity/my_project", order="+summary_metrics.loss")
             ```
 
+            Only fetch the state and the loss and accuracy summary metrics of each run
+            ```
+            api.runs(
+                path="my_entity/my_project",
+                fields=["state"],
+                summary_keys=["loss", "accuracy"],
+            )
+            ```
+
         Args:
             path: (str) path to project, should be in the form: "entity/project"
             filters: (dict) queries for specific runs using the MongoDB query language.
@@ -1015,6 +1026,11 @@ class Api:
                 The default order is run.created_at from oldest to newest.
             per_page: (int) Sets the page size for query pagination.
             include_sweeps: (bool) Whether to include the sweep runs in the results.
+            fields: (list) Run fields to fetch, e.g. `["state", "created_at", "tags"]`.
+                The id, name and state of a run are always fetched. Other fields are
+                loaded from the server when they are first accessed. By default all
+                fields are fetched.
+            summary_keys: (list) Only fetch these keys of each run's summary metrics.
 
         Returns:
             A `Runs` object, which is an iterable collection of `Run` objects.
@@ -1022,6 +1038,8 @@ class Api:
         entity, project = self._parse_project_path(path)
         filters = filters or {}
         key = (path or "") + str(filters) + str(order)
+        if fields is not None or summary_keys is not None:
+            key += str(fields) + str(summary_keys)
         if not self._runs.get(key):
             self._runs[key] = public.Runs(
                 self.client,
@@ -1031,6 +1049,8 @@ class Api:
                 order=order,
                 per_page=per_page,
                 include_sweeps=include_sweeps,
+                fields=fields,
+                summary_keys=summary_keys,
             )
         return self._runs[key]
 
@@ -0,0 +1,189 @@
+"""Public API: local cache of run metadata and history."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from wandb import env, util
+from wandb.sdk.lib.paths import StrPath
+
+logger = logging.getLogger(__name__)
+
+# Only scans that fit in this fraction of the cache are stored.
+_MAX_ENTRY_FRACTION = 4
+
+
+def client_url(client) -> str:
+    """Returns the GraphQL endpoint of a public API client."""
+    transport = getattr(getattr(client, "_client", None), "transport", None)
+    return str(getattr(transport, "url", ""))
+
+
+class PublicApiCache:
+    """Caches public API responses on disk.
+
+    Each entry is a file named by the SHA-256 of its key. Metadata is stored as
+    JSON and history rows as a single JSON-encoded string column of a parquet
+    file, which keeps every row exactly as the server returned it. History is
+    only cached when pyarrow is installed.
+
+    Reading an entry marks it as recently used. When the cache grows beyond
+    `max_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: StrPath, max_bytes: int) -> None:
+        self._cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}{suffix}"
+
+    def _open(self, path: Path) -> Optional[Path]:
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def _discard(self, path: Path) -> None:
+        logger.warning(f"Removing corrupt public API cache entry {path}")
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _write(self, path: Path, write) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write(tmp_path)
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except Exception as e:
+            logger.warning(f"Failed to write public API cache entry: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size += size
+        if self._total_size() > self.max_bytes:
+            self.evict()
+
+    def get_json(self, key: str) -> Optional[Any]:
+        path = self._open(self._path(key, ".json"))
+        if path is None:
+            return None
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            self._discard(path)
+            return None
+
+    def put_json(self, key: str, value: Any) -> None:
+        def write(path: Path) -> None:
+            with open(path, "w") as f:
+                json.dump(value, f)
+
+        self._write(self._path(key, ".json"), write)
+
+    def get_rows(self, key: str) -> Optional[List[str]]:
+        """Returns the JSON-encoded history rows stored under `key`."""
+        pq = util.get_module("pyarrow.parquet")
+        if pq is None:
+            return None
+        path = self._open(self._path(key, ".parquet"))
+        if path is None:
+            return None
+        try:
+            return pq.read_table(path, columns=["row"]).column("row").to_pylist()
+        except (OSError, ValueError, KeyError):
+            self._discard(path)
+            return None
+
+    def put_rows(self, key: str, rows: List[str]) -> None:
+        pq = util.get_module("pyarrow.parquet")
+        if pq is None:
+            return
+        import pyarrow as pa
+
+        def write(path: Path) -> None:
+            table = pa.table({"row": pa.array(rows, pa.string())})
+            pq.write_table(table, path, compression="zstd")
+
+        self._write(self._path(key, ".parquet"), write)
+
+    def fits(self, num_bytes: int) -> bool:
+        """Returns True if an entry of `num_bytes` may be stored."""
+        return num_bytes <= self.max_bytes // _MAX_ENTRY_FRACTION
+
+    def delete(self, key: str) -> None:
+        for suffix in (".json", ".parquet"):
+            try:
+                os.remove(self._path(key, suffix))
+            except OSError:
+                pass
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self._cache_dir.glob("*/*"):
+            if path.suffix not in (".json", ".parquet"):
+                continue
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                pass
+        return entries
+
+    def _total_size(self) -> int:
+        with self._lock:
+            if self._size is None:
+                self._size = sum(st.st_size for _, st in self._entries())
+            return self._size
+
+    def evict(self) -> None:
+        """Remove the least recently used entries beyond 90% of `max_bytes`."""
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+            size = sum(st.st_size for _, st in entries)
+            target = self.max_bytes * 9 // 10
+            for path, st in entries:
+                if size <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                size -= st.st_size
+            self._size = size
+
+
+_public_api_cache: Optional[PublicApiCache] = None
+
+
+def get_public_api_cache() -> Optional[PublicApiCache]:
+    """Returns the public API cache, or None if it isn't enabled."""
+    global _public_api_cache
+    if not env.get_public_api_cache_enabled():
+        return None
+    cache_dir = env.get_cache_dir() / "public-api"
+    max_bytes = env.get_public_api_cache_max_bytes()
+    if _public_api_cache is None or _public_api_cache._cache_dir != cache_dir:
+        _public_api_cache = PublicApiCache(cache_dir, max_bytes)
+    _public_api_cache.max_bytes = max_bytes
+    return _public_api_cache
@@ -1,6 +1,10 @@
 """Public API: history."""
 
+import abc
+import collections
+import concurrent.futures
 import json
+from typing import Any, Deque, Iterator, List, Optional, Tuple
 
 import requests
 from wandb_gql import gql
@@ -10,74 +14,209 @@ from wandb import util
 from wandb.apis.normalize import normalize_exceptions
 from wandb.sdk.lib import retry
 
+# Step ranges grow by at most this factor from one range to the next.
+_MAX_WINDOW_GROWTH = 4
 
-class HistoryScan:
-    QUERY = gql(
-        """
-        query HistoryPage($entity: String!, $project: String!, $run: String!, $minStep: Int64!, $maxStep: Int64!, $pageSize: Int!) {
-            project(name: $project, entityName: $entity) {
-                run(name: $run) {
-                    history(minStep: $minStep, maxStep: $maxStep, samples: $pageSize)
-                }
-            }
-        }
-        """
-    )
 
-    def __init__(self, client, run, min_step, max_step, page_size=1000):
+class _StepRangeScan(abc.ABC):
+    """Iterates over the history rows of a run by fetching step ranges.
+
+    Ranges are `page_size` steps wide, so they hold at most `page_size` rows.
+    Up to `max_workers` ranges are fetched concurrently, and rows are always
+    returned in step order.
+
+    With `grow_ranges`, ranges are instead resized to hold about half a page
+    of rows, so sparse runs need fewer requests, and a wider range that comes
+    back with a full page is split in two and fetched again. The server
+    samples ranges with more than `page_size` rows down to at most
+    `page_size` rows, so this can skip the rows of a range that is much
+    denser than the one before it.
+
+    With a `cache`, the rows of a completed scan are stored under `cache_key`
+    and later scans read them from there.
+    """
+
+    def __init__(
+        self,
+        client,
+        run,
+        min_step,
+        max_step,
+        page_size=1000,
+        max_workers=1,
+        cache=None,
+        cache_key=None,
+        grow_ranges=False,
+    ):
         self.client = client
         self.run = run
         self.page_size = page_size
         self.min_step = min_step
         self.max_step = max_step
-        self.page_offset = min_step  # minStep for next page
+        self.max_workers = max(1, max_workers)
+        self.grow_ranges = grow_ranges
         self.scan_offset = 0  # index within current page of rows
         self.rows = []  # current page of rows
+        self._batches = None
+        self._cache = cache
+        self._cache_key = cache_key
 
     def __iter__(self):
-        self.page_offset = self.min_step
         self.scan_offset = 0
         self.rows = []
+        self._batches = self._iter_batches(raw=False)
         return self
 
     def __next__(self):
+        if self._batches is None:
+            self._batches = self._iter_batches(raw=False)
         while True:
             if self.scan_offset < len(self.rows):
                 row = self.rows[self.scan_offset]
                 self.scan_offset += 1
                 return row
-            if self.page_offset >= self.max_step:
-                raise StopIteration()
-            self._load_next()
+            self.rows = next(self._batches)
+            self.scan_offset = 0
 
     next = __next__
 
+    def batches(self, raw: bool = False) -> Iterator[List[Any]]:
+        """Yield the rows of the scan in batches, in step order.
+
+        Args:
+            raw: (bool) Yield rows as returned by the server, without
+                decoding them.
+        """
+        return self._iter_batches(raw=raw)
+
+    def _iter_batches(self, raw: bool) -> Iterator[List[Any]]:
+        if self._cache is None:
+            yield from self._fetch_batches(raw)
+            return
+
+        cached_rows = self._cache.get_rows(self._cache_key)
+        if cached_rows is not None:
+            for start in range(0, len(cached_rows), self.page_size):
+                batch = cached_rows[start : start + self.page_size]
+                yield self._from_json_rows(batch, raw)
+            return
+
+        json_rows: Optional[List[str]] = []
+        num_bytes = 0
+        for rows in self._fetch_batches(raw=True):
+            if json_rows is not None:
+                batch = self._to_json_rows(rows)
+                num_bytes += sum(len(row) for row in batch)
+                if self._cache.fits(num_bytes):
+                    json_rows.extend(batch)
+                else:
+                    json_rows = None
+            yield rows if raw else self._decode(rows)
+        if json_rows is not None:
+            self._cache.put_rows(self._cache_key, json_rows)
+
+    def _fetch_batches(self, raw: bool) -> Iterator[List[Any]]:
+        window = self.page_size
+        next_step = self.min_step
+        pending: Deque[Tuple[int, int, concurrent.futures.Future]] = collections.deque()
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="HistoryScan"
+        ) as executor:
+
+            def submit(min_step: int, max_step: int):
+                future = executor.submit(self._fetch, min_step, max_step)
+                return min_step, max_step, future
+
+            try:
+                while True:
+                    while len(pending) < self.max_workers and next_step < self.max_step:
+                        max_step = min(next_step + window, self.max_step)
+                        pending.append(submit(next_step, max_step))
+                        next_step = max_step
+                    if not pending:
+                        return
+
+                    min_step, max_step, future = pending.popleft()
+                    rows = future.result()
+                    width = max_step - min_step
+                    if len(rows) >= self.page_size and width > self.page_size:
+                        middle = min_step + width // 2
+                        pending.appendleft(submit(middle, max_step))
+                        pending.appendleft(submit(min_step, middle))
+                        window = max(self.page_size, width // 2)
+                        continue
+
+                    if self.grow_ranges:
+                        if rows:
+                            target = width * self.page_size // (2 * len(rows))
+                        else:
+                            target = width * _MAX_WINDOW_GROWTH
+                        window = max(
+                            self.page_size, min(target, width * _MAX_WINDOW_GROWTH)
+                        )
+                    if rows:
+                        yield rows if raw else self._decode(rows)
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+
+    @abc.abstractmethod
+    def _fetch(self, min_step: int, max_step: int) -> List[Any]:
+        """Returns the rows of `[min_step, max_step)`, at most `page_size`."""
+
+    def _decode(self, rows: List[Any]) -> List[Any]:
+        return rows
+
+    def _to_json_rows(self, rows: List[Any]) -> List[str]:
+        return [json.dumps(row) for row in rows]
+
+    def _from_json_rows(self, rows: List[str], raw: bool) -> List[Any]:
+        return [json.loads(row) for row in rows]
+
+
+class HistoryScan(_StepRangeScan):
+    QUERY = gql(
+        """
+        query HistoryPage($entity: String!, $project: String!, $run: String!, $minStep: Int64!, $maxStep: Int64!, $pageSize: Int!) {
+            project(name: $project, entityName: $entity) {
+                run(name: $run) {
+                    history(minStep: $minStep, maxStep: $maxStep, samples: $pageSize)
+                }
+            }
+        }
+        """
+    )
+
     @normalize_exceptions
     @retry.retriable(
         check_retry_fn=util.no_retry_auth,
         retryable_exceptions=(RetryError, requests.RequestException),
     )
-    def _load_next(self):
-        max_step = self.page_offset + self.page_size
-        if max_step > self.max_step:
-            max_step = self.max_step
+    def _fetch(self, min_step: int, max_step: int) -> List[str]:
         variables = {
             "entity": self.run.entity,
             "project": self.run.project,
             "run": self.run.id,
-            "minStep": int(self.page_offset),
+            "minStep": int(min_step),
             "maxStep": int(max_step),
             "pageSize": int(self.page_size),
         }
 
         res = self.client.execute(self.QUERY, variable_values=variables)
-        res = res["project"]["run"]["history"]
-        self.rows = [json.loads(row) for row in res]
-        self.page_offset += self.page_size
-        self.scan_offset = 0
+        return res["project"]["run"]["history"]
+
+    def _decode(self, rows: List[str]) -> List[dict]:
+        return [json.loads(row) for row in rows]
+
+    def _to_json_rows(self, rows: List[str]) -> List[str]:
+        return rows
 
+    def _from_json_rows(self, rows: List[str], raw: bool) -> List[Any]:
+        return rows if raw else self._decode(rows)
 
-class SampledHistoryScan:
+
+class SampledHistoryScan(_StepRangeScan):
     QUERY = gql(
         """
         query SampledHistoryPage($entity: String!, $project: String!, $run: String!, $spec: JSONString!) {
@@ -90,44 +229,38 @@ class SampledHistoryScan:
         """
     )
 
-    def __init__(self, client, run, keys, min_step, max_step, page_size=1000):
-        self.client = client
-        self.run = run
+    def __init__(
+        self,
+        client,
+        run,
+        keys,
+        min_step,
+        max_step,
+        page_size=1000,
+        max_workers=1,
+        cache=None,
+        cache_key=None,
+        grow_ranges=False,
+    ):
+        super().__init__(
+            client,
+            run,
+            min_step,
+            max_step,
+            page_size,
+            max_workers,
+            cache,
+            cache_key,
+            grow_ranges,
+        )
         self.keys = keys
-        self.page_size = page_size
-        self.min_step = min_step
-        self.max_step = max_step
-        self.page_offset = min_step  # minStep for next page
-        self.scan_offset = 0  # index within current page of rows
-        self.rows = []  # current page of rows
-
-    def __iter__(self):
-        self.page_offset = self.min_step
-        self.scan_offset = 0
-        self.rows = []
-        return self
-
-    def __next__(self):
-        while True:
-            if self.scan_offset < len(self.rows):
-                row = self.rows[self.scan_offset]
-                self.scan_offset += 1
-                return row
-            if self.page_offset >= self.max_step:
-                raise StopIteration()
-            self._load_next()
-
-    next = __next__
 
     @normalize_exceptions
     @retry.retriable(
         check_retry_fn=util.no_retry_auth,
         retryable_exceptions=(RetryError, requests.RequestException),
     )
-    def _load_next(self):
-        max_step = self.page_offset + self.page_size
-        if max_step > self.max_step:
-            max_step = self.max_step
+    def _fetch(self, min_step: int, max_step: int) -> List[dict]:
         variables = {
             "entity": self.run.entity,
             "project": self.run.project,
@@ -135,7 +268,7 @@ class SampledHistoryScan:
             "spec": json.dumps(
                 {
                     "keys": self.keys,
-                    "minStep": int(self.page_offset),
+                    "minStep": int(min_step),
                     "maxStep": int(max_step),
                     "samples": int(self.page_size),
                 }
@@ -144,6 +277,4 @@ class SampledHistoryScan:
 
         res = self.client.execute(self.QUERY, variable_values=variables)
         res = res["project"]["run"]["sampledHistory"]
-        self.rows = res[0]
-        self.page_offset += self.page_size
-        self.scan_offset = 0
+        return res[0]
@@ -1,19 +1,28 @@
 """Public API: runs."""
 
+import collections
+import concurrent.futures
 import json
 import os
 import tempfile
+import threading
 import time
 import urllib
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Collection,
+    Deque,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
     Optional,
+    Tuple,
 )
 
 from wandb_gql import gql
@@ -25,7 +34,9 @@ from wandb.apis.attrs import Attrs
 from wandb.apis.internal import Api as InternalApi
 from wandb.apis.normalize import normalize_exceptions
 from wandb.apis.paginator import Paginator
+from wandb.apis.public import api_cache
 from wandb.apis.public.const import RETRY_TIMEDELTA
+from wandb.sdk.internal import introspection_cache
 from wandb.sdk.lib import ipython, json_util, runid
 from wandb.sdk.lib.paths import LogicalPath
 
@@ -60,6 +71,146 @@ RUN_FRAGMENT = """fragment RunFragment on Run {
     historyKeys
 }"""
 
+# Fields of RunFragment that are always fetched, even with a projection.
+_RUN_FRAGMENT_REQUIRED_FIELDS = ("id", "name", "displayName", "sweepName", "state")
+# Selections of each RunFragment field, in fragment order.
+_RUN_FRAGMENT_FIELDS = {
+    field: field
+    for field in (
+        "id tags name displayName sweepName state config group jobType commit"
+        " readOnly createdAt heartbeatAt description notes systemMetrics"
+        " summaryMetrics historyLineCount user historyKeys"
+    ).split()
+}
+_RUN_FRAGMENT_FIELDS["user"] = """user {
+        name
+        username
+    }"""
+
+_RUNS_QUERY = """
+query Runs($project: String!, $entity: String!, $cursor: String, $perPage: Int = 50, $order: String, $filters: JSONString{variables}) {{
+    project(name: $project, entityName: $entity) {{
+        internalId
+        runCount(filters: $filters)
+        readOnly
+        runs(filters: $filters, after: $cursor, first: $perPage, order: $order) {{
+            edges {{
+                node {{
+                    ...RunFragment
+                }}
+                cursor
+            }}
+            pageInfo {{
+                endCursor
+                hasNextPage
+            }}
+        }}
+    }}
+}}
+{fragment}
+"""
+
+
+_PROBE_RUN_SUMMARY_METRICS_ARGS = """
+query ProbeRunSummaryMetricsArgs {
+    RunType: __type(name: "Run") {
+        fields {
+            name
+            args {
+                name
+            }
+        }
+    }
+}
+"""
+
+# Whether each client's server supports Run.summaryMetrics(keys: ...).
+_summary_keys_support: "weakref.WeakKeyDictionary[Any, bool]" = (
+    weakref.WeakKeyDictionary()
+)
+_summary_keys_support_lock = threading.Lock()
+
+
+def _projected_run_fragment(fields: Collection[str], summary_keys: bool = False) -> str:
+    """Build a RunFragment that only selects `fields`.
+
+    If `summary_keys` is set, summaryMetrics is restricted to the keys given
+    by the `$summaryKeys` query variable.
+    """
+    selected = []
+    for field in _RUN_FRAGMENT_FIELDS:
+        if field not in fields:
+            continue
+        if field == "summaryMetrics" and summary_keys:
+            selected.append("summaryMetrics(keys: $summaryKeys)")
+        else:
+            selected.append(_RUN_FRAGMENT_FIELDS[field])
+    return "fragment RunFragment on Run {{\n    {}\n}}".format("\n    ".join(selected))
+
+
+def _run_fragment_field(name: str) -> str:
+    """Map a `Run` attribute name, e.g. `summary_metrics`, to a RunFragment field."""
+    if name in _RUN_FRAGMENT_FIELDS:
+        return name
+    camel = "".join(part.title() for part in name.split("_"))
+    camel = camel[0].lower() + camel[1:]
+    if camel not in _RUN_FRAGMENT_FIELDS:
+        raise ValueError(
+            "Unknown run field {!r}, expected one of {}".format(
+                name, ", ".join(_RUN_FRAGMENT_FIELDS)
+            )
+        )
+    return camel
+
+
+def _history_chunk(format: str, module: Any, run_id: str, history_data: List[dict]):
+    """Convert the history of one run to `format`, adding a run_id column."""
+    if format == "pandas":
+        df = module.DataFrame.from_records(history_data)
+        df["run_id"] = run_id
+        return df
+    if format == "polars":
+        df = module.from_records(history_data)
+        return df.with_columns(module.lit(run_id).alias("run_id"))
+    if format == "arrow":
+        table = module.Table.from_pylist(history_data)
+        return table.append_column(
+            "run_id", module.array([run_id] * table.num_rows, module.string())
+        )
+    for entry in history_data:
+        entry["run_id"] = run_id
+    return history_data
+
+
+def _concat_histories(format: str, module: Any, histories: List[Any]):
+    """Concatenate the histories of several runs, with sorted columns."""
+    if format == "pandas":
+        if not histories:
+            return module.DataFrame()
+        combined_df = module.concat(histories)
+        combined_df.reset_index(drop=True, inplace=True)
+        # sort columns for consistency
+        return combined_df[(sorted(combined_df.columns))]
+    if format == "polars":
+        if not histories:
+            return module.DataFrame()
+        combined_df = module.concat(histories, how="vertical")
+        # sort columns for consistency
+        return combined_df.select(sorted(combined_df.columns))
+    if format == "arrow":
+        if not histories:
+            return module.table({})
+        try:
+            combined_table = module.concat_tables(
+                histories, promote_options="permissive"
+            )
+        except TypeError:
+            # pyarrow < 14
+            combined_table = module.concat_tables(histories, promote=True)
+        # sort columns for consistency
+        return combined_table.select(sorted(combined_table.column_names))
+    return [entry for history_data in histories for entry in history_data]
+
 
 class Runs(Paginator):
     """An iterable collection of runs associated with a project and optional filter.
@@ -67,30 +218,7 @@ class Runs(Paginator):
     This is generally used indirectly via the `Api`.runs method.
     """
 
-    QUERY = gql(
-        """
-        query Runs($project: String!, $entity: String!, $cursor: String, $perPage: Int = 50, $order: String, $filters: JSONString) {{
-            project(name: $project, entityName: $entity) {{
-                internalId
-                runCount(filters: $filters)
-                readOnly
-                runs(filters: $filters, after: $cursor, first: $perPage, order: $order) {{
-                    edges {{
-                        node {{
-                            ...RunFragment
-                        }}
-                        cursor
-                    }}
-                    pageInfo {{
-                        endCursor
-                        hasNextPage
-                    }}
-                }}
-            }}
-        }}
-        {}
-        """.format(RUN_FRAGMENT)
-    )
+    QUERY = gql(_RUNS_QUERY.format(variables="", fragment=RUN_FRAGMENT))
 
     def __init__(
         self,
@@ -101,6 +229,8 @@ class Runs(Paginator):
         order: Optional[str] = None,
         per_page: int = 50,
         include_sweeps: bool = True,
+        fields: Optional[Collection[str]] = None,
+        summary_keys: Optional[Collection[str]] = None,
     ):
         self.entity = entity
         self.project = project
@@ -117,6 +247,61 @@ class Runs(Paginator):
         }
         super().__init__(client, variables, per_page)
 
+        self._lazy_fields: Optional[List[str]] = None
+        self._summary_keys: Optional[List[str]] = None
+        if fields is not None or summary_keys is not None:
+            self._set_projection(fields, summary_keys)
+
+    def _set_projection(
+        self,
+        fields: Optional[Collection[str]],
+        summary_keys: Optional[Collection[str]],
+    ) -> None:
+        """Only query the given run fields, loading the others on access."""
+        selected = set(_RUN_FRAGMENT_REQUIRED_FIELDS)
+        selected.update(_run_fragment_field(field) for field in fields or ())
+        variables = ""
+        if summary_keys is not None:
+            selected.add("summaryMetrics")
+            if self._server_supports_summary_keys():
+                self._summary_keys = list(summary_keys)
+                self.variables["summaryKeys"] = self._summary_keys
+                variables = ", $summaryKeys: [String!]"
+
+        self._lazy_fields = [f for f in _RUN_FRAGMENT_FIELDS if f not in selected]
+        fragment = _projected_run_fragment(
+            selected, summary_keys=self._summary_keys is not None
+        )
+        self.QUERY = gql(_RUNS_QUERY.format(variables=variables, fragment=fragment))
+
+    def _server_supports_summary_keys(self) -> bool:
+        """Returns True if Run.summaryMetrics can be restricted to a list of keys.
+
+        The result is remembered per client, and shared with other processes
+        through the introspection cache.
+        """
+        with _summary_keys_support_lock:
+            supported = _summary_keys_support.get(self.client)
+        if supported is not None:
+            return supported
+
+        cache = introspection_cache.get_introspection_cache(
+            api_cache.client_url(self.client)
+        )
+        res = cache.get(_PROBE_RUN_SUMMARY_METRICS_ARGS)
+        if res is None:
+            res = self.client.execute(gql(_PROBE_RUN_SUMMARY_METRICS_ARGS))
+            if isinstance(res, dict):
+                cache.put(_PROBE_RUN_SUMMARY_METRICS_ARGS, res)
+
+        supported = False
+        for field in (res.get("RunType") or {}).get("fields") or []:
+            if field["name"] == "summaryMetrics":
+                supported = "keys" in [arg["name"] for arg in field.get("args") or []]
+        with _summary_keys_support_lock:
+            _summary_keys_support[self.client] = supported
+        return supported
+
     @property
     def length(self):
         if self.last_response:
@@ -142,7 +327,14 @@ class Runs(Paginator):
         objs = []
         if self.last_response is None or self.last_response.get("project") is None:
             raise ValueError("Could not find project {}".format(self.project))
-        for run_response in self.last_response["project"]["runs"]["edges"]:
+        edges = self.last_response["project"]["runs"]["edges"]
+        if self._include_sweeps:
+            self._resolve_sweeps(
+                edge["node"]["sweepName"]
+                for edge in edges
+                if edge["node"].get("sweepName")
+            )
+        for run_response in edges:
             run = Run(
                 self.client,
                 self.entity,
@@ -150,124 +342,154 @@ class Runs(Paginator):
                 run_response["node"]["name"],
                 run_response["node"],
                 include_sweeps=self._include_sweeps,
+                lazy_fields=self._lazy_fields,
+                summary_keys=self._summary_keys,
             )
             objs.append(run)
 
             if self._include_sweeps and run.sweep_name:
-                if run.sweep_name in self._sweeps:
-                    sweep = self._sweeps[run.sweep_name]
-                else:
-                    sweep = public.Sweep.get(
-                        self.client,
-                        self.entity,
-                        self.project,
-                        run.sweep_name,
-                        withRuns=False,
-                    )
-                    self._sweeps[run.sweep_name] = sweep
-
+                sweep = self._sweeps.get(run.sweep_name)
                 if sweep is None:
                     continue
                 run.sweep = sweep
 
         return objs
 
+    def _resolve_sweeps(self, sweep_names: Iterable[str]) -> None:
+        """Fetch the sweeps of a page that weren't seen before, in one query."""
+        missing = {name for name in sweep_names if name not in self._sweeps}
+        if not missing:
+            return
+        cache = public.sweeps.get_sweep_cache(self.client)
+        cached = cache.get(self.entity, self.project, missing)
+        self._sweeps.update(cached)
+        missing.difference_update(cached)
+        if not missing:
+            return
+        fetched = public.Sweep.get_many(
+            self.client, self.entity, self.project, sorted(missing)
+        )
+        cache.put(self.entity, self.project, fetched)
+        self._sweeps.update(fetched)
+
     @normalize_exceptions
     def histories(
         self,
         samples: int = 500,
         keys: Optional[List[str]] = None,
         x_axis: str = "_step",
-        format: Literal["default", "pandas", "polars"] = "default",
+        format: Literal["default", "pandas", "polars", "arrow"] = "default",
         stream: Literal["default", "system"] = "default",
+        max_workers: int = 8,
+        max_retries: int = 10,
+        callback: Optional[Callable[["Run", Any], None]] = None,
     ):
         """Return sampled history metrics for all runs that fit the filters conditions.
 
+        The histories of up to `max_workers` runs are fetched concurrently.
+
         Args:
             samples : (int, optional) The number of samples to return per run
             keys : (list[str], optional) Only return metrics for specific keys
             x_axis : (str, optional) Use this metric as the xAxis defaults to _step
-            format : (Literal, optional) Format to return data in, options are "default", "pandas", "polars"
+            format : (Literal, optional) Format to return data in, options are "default", "pandas", "polars", "arrow"
             stream : (Literal, optional) "default" for metrics, "system" for machine metrics
+            max_workers : (int, optional) The number of runs to fetch concurrently
+            max_retries : (int, optional) The number of failed fetches to retry
+                across all runs before giving up
+            callback : (Callable, optional) Called in run order with each run and
+                its history, in the requested format, as soon as it is available
         Returns:
             pandas.DataFrame: If format="pandas", returns a `pandas.DataFrame` of history metrics.
             polars.DataFrame: If format="polars", returns a `polars.DataFrame` of history metrics.
+            pyarrow.Table: If format="arrow", returns a `pyarrow.Table` of history metrics.
             list of dicts: If format="default", returns a list of dicts containing history metrics with a run_id key.
         """
-        if format not in ("default", "pandas", "polars"):
+        if format not in ("default", "pandas", "polars", "arrow"):
             raise ValueError(
-                f"Invalid format: {format}. Must be one of 'default', 'pandas', 'polars'"
+                f"Invalid format: {format}. Must be one of 'default', 'pandas', 'polars', 'arrow'"
             )
 
-        histories = []
-
-        if format == "default":
-            for run in self:
-                history_data = run.history(
-                    samples=samples,
-                    keys=keys,
-                    x_axis=x_axis,
-                    pandas=False,
-                    stream=stream,
-                )
-                if not history_data:
-                    continue
-                for entry in history_data:
-                    entry["run_id"] = run.id
-                histories.extend(history_data)
-
-            return histories
+        def fetch(run: "Run") -> List[Dict[str, Any]]:
+            return run.history(
+                samples=samples,
+                keys=keys,
+                x_axis=x_axis,
+                pandas=False,
+                stream=stream,
+            )
 
         if format == "pandas":
-            pd = util.get_module(
+            module = util.get_module(
                 "pandas", required="Exporting pandas DataFrame requires pandas"
             )
-            for run in self:
-                history_data = run.history(
-                    samples=samples,
-                    keys=keys,
-                    x_axis=x_axis,
-                    pandas=False,
-                    stream=stream,
-                )
-                if not history_data:
-                    continue
-                df = pd.DataFrame.from_records(history_data)
-                df["run_id"] = run.id
-                histories.append(df)
-            if not histories:
-                return pd.DataFrame()
-            combined_df = pd.concat(histories)
-            combined_df.reset_index(drop=True, inplace=True)
-            # sort columns for consistency
-            combined_df = combined_df[(sorted(combined_df.columns))]
-
-            return combined_df
-
-        if format == "polars":
-            pl = util.get_module(
+        elif format == "polars":
+            module = util.get_module(
                 "polars", required="Exporting polars DataFrame requires polars"
             )
-            for run in self:
-                history_data = run.history(
-                    samples=samples,
-                    keys=keys,
-                    x_axis=x_axis,
-                    pandas=False,
-                    stream=stream,
-                )
-                if not history_data:
-                    continue
-                df = pl.from_records(history_data)
-                df = df.with_columns(pl.lit(run.id).alias("run_id"))
-                histories.append(df)
-            if not histories:
-                return pl.DataFrame()
-            combined_df = pl.concat(histories, how="vertical")
-            # sort columns for consistency
-            combined_df = combined_df.select(sorted(combined_df.columns))
+        elif format == "arrow":
+            module = util.get_module(
+                "pyarrow", required="Exporting an Arrow table requires pyarrow"
+            )
+        else:
+            module = None
+
+        histories = []
+        for run, history_data in self._iter_histories(fetch, max_workers, max_retries):
+            if not history_data:
+                continue
+            history = _history_chunk(format, module, run.id, history_data)
+            if callback is not None:
+                callback(run, history)
+            histories.append(history)
+
+        return _concat_histories(format, module, histories)
+
+    def _iter_histories(
+        self,
+        fetch: Callable[["Run"], Any],
+        max_workers: int,
+        max_retries: int,
+    ) -> Iterator[Tuple["Run", Any]]:
+        """Yield `(run, fetch(run))` for each run, in order.
+
+        Up to `max_workers` runs are fetched concurrently, and no more than
+        twice that many are in flight. A failed fetch is retried as long as
+        the `max_retries` shared by all runs last.
+        """
+        max_workers = max(1, max_workers)
+        retries_left = max_retries
+        runs = iter(self)
+        pending: Deque[Tuple[Run, concurrent.futures.Future]] = collections.deque()
 
-            return combined_df
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="RunsHistories"
+        ) as executor:
+
+            def submit_next() -> None:
+                run = next(runs, None)
+                if run is not None:
+                    pending.append((run, executor.submit(fetch, run)))
+
+            try:
+                for _ in range(2 * max_workers):
+                    submit_next()
+                while pending:
+                    run, future = pending.popleft()
+                    try:
+                        result = future.result()
+                    except Exception:
+                        if retries_left <= 0:
+                            raise
+                        retries_left -= 1
+                        wandb.termwarn(f"Retrying history of run {run.id}")
+                        pending.appendleft((run, executor.submit(fetch, run)))
+                        continue
+                    submit_next()
+                    yield run, result
+            finally:
+                for _, future in pending:
+                    future.cancel()
 
     def __repr__(self):
         return f"<Runs {self.entity}/{self.project}>"
@@ -307,14 +529,22 @@ class Run(Attrs):
         run_id: str,
         attrs: Optional[Mapping] = None,
         include_sweeps: bool = True,
+        lazy_fields: Optional[Collection[str]] = None,
+        summary_keys: Optional[Collection[str]] = None,
     ):
         """Initialize a Run object.
 
         Run is always initialized by calling api.runs() where api is an instance of
         wandb.Api.
+
+        `lazy_fields` are RunFragment fields missing from `attrs`; the first
+        access to one of them loads the full run. If `summary_keys` is set,
+        `summary_metrics` only contains those keys.
         """
         _attrs = attrs or {}
         super().__init__(dict(_attrs))
+        self._lazy_fields = set(lazy_fields or ())
+        self._summary_keys = summary_keys
         self.client = client
         self._entity = entity
         self.project = project
@@ -417,6 +647,35 @@ class Run(Attrs):
         )
 
     def load(self, force=False):
+        if force or not self._attrs:
+            self._load_attrs()
+        return self._parse_attrs()
+
+    def _load_attrs(self) -> None:
+        cache = api_cache.get_public_api_cache()
+        response = cache.get_json(self._cache_key("run")) if cache else None
+        if response is None:
+            response = self._fetch_attrs()
+            if cache is not None and response["project"]["run"]["state"] == "finished":
+                cache.put_json(self._cache_key("run"), response)
+        self._attrs = response["project"]["run"]
+        # The full fragment was loaded, so nothing is left to load lazily.
+        self._lazy_fields = set()
+        self._summary_keys = None
+        self._state = self._attrs["state"]
+        self._project_internal_id = response["project"].get("internalId", None)
+        if self._include_sweeps and self.sweep_name and not self.sweep:
+            # There may be a lot of runs. Don't bother pulling them all
+            # just for the sake of this one.
+            self.sweep = public.Sweep.get(
+                self.client,
+                self.entity,
+                self.project,
+                self.sweep_name,
+                withRuns=False,
+            )
+
+    def _fetch_attrs(self, fragment: str = RUN_FRAGMENT) -> Dict[str, Any]:
         query = gql(
             """
         query Run($project: String!, $entity: String!, $name: String!) {{
@@ -431,62 +690,118 @@ class Run(Attrs):
         """.format(
                 # Only query internalId if the server supports it
                 "internalId" if self._server_provides_internal_id_for_project() else "",
-                RUN_FRAGMENT,
+                fragment,
             )
         )
-        if force or not self._attrs:
-            response = self._exec(query)
-            if (
-                response is None
-                or response.get("project") is None
-                or response["project"].get("run") is None
-            ):
-                raise ValueError("Could not find run {}".format(self))
-            self._attrs = response["project"]["run"]
-            self._state = self._attrs["state"]
-            self._project_internal_id = response["project"].get("internalId", None)
-            if self._include_sweeps and self.sweep_name and not self.sweep:
-                # There may be a lot of runs. Don't bother pulling them all
-                # just for the sake of this one.
-                self.sweep = public.Sweep.get(
-                    self.client,
-                    self.entity,
-                    self.project,
-                    self.sweep_name,
-                    withRuns=False,
-                )
+        response = self._exec(query)
+        if (
+            response is None
+            or response.get("project") is None
+            or response["project"].get("run") is None
+        ):
+            raise ValueError("Could not find run {}".format(self))
+        return response
+
+    def _cache_key(self, kind: str, *parts: Any) -> str:
+        """Returns the key of this run's `kind` entry in the public API cache."""
+        return api_cache.PublicApiCache.key(
+            kind,
+            api_cache.client_url(self.client),
+            self.entity,
+            self.project,
+            self.id,
+            *parts,
+        )
 
-        try:
-            self._attrs["summaryMetrics"] = (
-                json.loads(self._attrs["summaryMetrics"])
-                if self._attrs.get("summaryMetrics")
+    def _history_cache_version(self, last_step: Optional[int] = None) -> Any:
+        """Returns the part of a history cache key that changes with the history.
+
+        The history of a finished run is final. Running runs are keyed by their
+        last step and heartbeat.
+        """
+        if self.state == "finished":
+            return "finished"
+        if last_step is None:
+            last_step = (getattr(self, "historyKeys", None) or {}).get("lastStep")
+        return [last_step, getattr(self, "heartbeatAt", None)]
+
+    def _invalidate_cache(self) -> None:
+        cache = api_cache.get_public_api_cache()
+        if cache is not None:
+            cache.delete(self._cache_key("run"))
+
+    def _parse_attrs(self, fields: Optional[Collection[str]] = None):
+        """Parse the JSON fields of `_attrs`.
+
+        Only `fields` are parsed if given, otherwise all fields that were loaded.
+        """
+
+        def should_parse(field: str) -> bool:
+            if fields is not None:
+                return field in fields
+            return field not in self._lazy_fields
+
+        if should_parse("summaryMetrics"):
+            try:
+                self._attrs["summaryMetrics"] = (
+                    json.loads(self._attrs["summaryMetrics"])
+                    if self._attrs.get("summaryMetrics")
+                    else {}
+                )
+            except json.decoder.JSONDecodeError:
+                # ignore invalid utf-8 or control characters
+                self._attrs["summaryMetrics"] = json.loads(
+                    self._attrs["summaryMetrics"],
+                    strict=False,
+                )
+        if should_parse("systemMetrics"):
+            self._attrs["systemMetrics"] = (
+                json.loads(self._attrs["systemMetrics"])
+                if self._attrs.get("systemMetrics")
                 else {}
             )
-        except json.decoder.JSONDecodeError:
-            # ignore invalid utf-8 or control characters
-            self._attrs["summaryMetrics"] = json.loads(
-                self._attrs["summaryMetrics"],
-                strict=False,
-            )
-        self._attrs["systemMetrics"] = (
-            json.loads(self._attrs["systemMetrics"])
-            if self._attrs.get("systemMetrics")
-            else {}
-        )
-        if self._attrs.get("user"):
+        if self._attrs.get("user") and (fields is None or "user" in fields):
             self.user = public.User(self.client, self._attrs["user"])
-        config_user, config_raw = {}, {}
-        for key, value in json.loads(self._attrs.get("config") or "{}").items():
-            config = config_raw if key in WANDB_INTERNAL_KEYS else config_user
-            if isinstance(value, dict) and "value" in value:
-                config[key] = value["value"]
-            else:
-                config[key] = value
-        config_raw.update(config_user)
-        self._attrs["config"] = config_user
-        self._attrs["rawconfig"] = config_raw
+        if should_parse("config"):
+            config_user, config_raw = {}, {}
+            for key, value in json.loads(self._attrs.get("config") or "{}").items():
+                config = config_raw if key in WANDB_INTERNAL_KEYS else config_user
+                if isinstance(value, dict) and "value" in value:
+                    config[key] = value["value"]
+                else:
+                    config[key] = value
+            config_raw.update(config_user)
+            self._attrs["config"] = config_user
+            self._attrs["rawconfig"] = config_raw
         return self._attrs
 
+    def _load_lazy_fields(self) -> None:
+        """Load the fields that were left out of a projected `Api.runs` query.
+
+        Fields that were already loaded are kept, including local changes to
+        them.
+        """
+        fields = set(self._lazy_fields)
+        if self._summary_keys is not None:
+            fields.add("summaryMetrics")
+        if fields:
+            response = self._fetch_attrs(_projected_run_fragment(fields))
+            run = response["project"]["run"]
+            for field in fields:
+                self._attrs[field] = run.get(field)
+        self._lazy_fields = set()
+        self._summary_keys = None
+        self._parse_attrs(fields)
+
+    def __getattr__(self, name):
+        lazy_fields = self.__dict__.get("_lazy_fields")
+        if lazy_fields:
+            field = "config" if name == "rawconfig" else self.snake_to_camel(name)
+            if field in lazy_fields or name in lazy_fields:
+                self._load_lazy_fields()
+                return getattr(self, name)
+        return super().__getattr__(name)
+
     @normalize_exceptions
     def wait_until_finished(self):
         query = gql(
@@ -535,6 +850,7 @@ class Run(Attrs):
             groupName=self.group,
             jobType=self.job_type,
         )
+        self._invalidate_cache()
         self.summary.update()
 
     @normalize_exceptions
@@ -566,6 +882,7 @@ class Run(Attrs):
                 "deleteArtifacts": delete_artifacts,
             },
         )
+        self._invalidate_cache()
 
     def save(self):
         self.update()
@@ -695,10 +1012,24 @@ class Run(Attrs):
         if keys and stream != "default":
             wandb.termerror("stream must be default when specifying keys")
             return []
+
+        cache = api_cache.get_public_api_cache()
+        if cache is not None:
+            cache_key = self._cache_key(
+                "history", self._history_cache_version(), keys, x_axis, samples, stream
+            )
+            cached_lines = cache.get_rows(cache_key)
+        else:
+            cached_lines = None
+
+        if cached_lines is not None:
+            lines = [json.loads(line) for line in cached_lines]
         elif keys:
             lines = self._sampled_history(keys=keys, x_axis=x_axis, samples=samples)
         else:
             lines = self._full_history(samples=samples, stream=stream)
+        if cache is not None and cached_lines is None:
+            cache.put_rows(cache_key, [json.dumps(line) for line in lines])
         if pandas:
             pd = util.get_module("pandas")
             if pd:
@@ -708,7 +1039,15 @@ class Run(Attrs):
         return lines
 
     @normalize_exceptions
-    def scan_history(self, keys=None, page_size=1000, min_step=None, max_step=None):
+    def scan_history(
+        self,
+        keys=None,
+        page_size=1000,
+        min_step=None,
+        max_step=None,
+        max_workers=4,
+        grow_ranges=False,
+    ):
         """Returns an iterable collection of all history records for a run.
 
         Example:
@@ -720,11 +1059,21 @@ class Run(Attrs):
             losses = [row["Loss"] for row in history]
             ```
 
+            Process the undecoded rows of a run in batches
+            ```python
+            for rows in run.scan_history().batches(raw=True):
+                ...
+            ```
+
         Args:
             keys ([str], optional): only fetch these keys, and only fetch rows that have all of keys defined.
             page_size (int, optional): size of pages to fetch from the api.
             min_step (int, optional): the minimum number of pages to scan at a time.
             max_step (int, optional): the maximum number of pages to scan at a time.
+            max_workers (int, optional): the number of step ranges to fetch concurrently.
+            grow_ranges (bool, optional): fetch wider step ranges for sparse parts of the
+                history. Faster for runs that log rarely, but can skip rows of a range that
+                is much denser than the one before it.
 
         Returns:
             An iterable collection over history records (dict).
@@ -736,7 +1085,13 @@ class Run(Attrs):
             wandb.termerror("keys argument must be a list of strings")
             return []
 
-        last_step = self.lastHistoryStep
+        cache = api_cache.get_public_api_cache()
+        if cache is not None and self.state == "finished":
+            # The last step of a finished run doesn't change.
+            history_keys = getattr(self, "historyKeys", None) or {}
+            last_step = history_keys.get("lastStep", -1)
+        else:
+            last_step = self.lastHistoryStep
         # set defaults for min/max step
         if min_step is None:
             min_step = 0
@@ -745,6 +1100,16 @@ class Run(Attrs):
         # if the max step is past the actual last step, clamp it down
         if max_step > last_step:
             max_step = last_step + 1
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(
+                "scan_history",
+                self._history_cache_version(last_step),
+                keys,
+                min_step,
+                max_step,
+                grow_ranges,
+            )
         if keys is None:
             return public.HistoryScan(
                 run=self,
@@ -752,6 +1117,10 @@ class Run(Attrs):
                 page_size=page_size,
                 min_step=min_step,
                 max_step=max_step,
+                max_workers=max_workers,
+                cache=cache,
+                cache_key=cache_key,
+                grow_ranges=grow_ranges,
             )
         else:
             return public.SampledHistoryScan(
@@ -761,6 +1130,10 @@ class Run(Attrs):
                 page_size=page_size,
                 min_step=min_step,
                 max_step=max_step,
+                max_workers=max_workers,
+                cache=cache,
+                cache_key=cache_key,
+                grow_ranges=grow_ranges,
             )
 
     @normalize_exceptions
@@ -932,6 +1305,9 @@ class Run(Attrs):
 
     @property
     def summary(self):
+        if self._summary_keys is not None:
+            # The summary may be updated, so it needs all keys.
+            self._load_lazy_fields()
         if self._summary is None:
             from wandb.old.summary import HTTPSummary
 
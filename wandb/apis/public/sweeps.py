@@ -1,12 +1,15 @@
 """Public API: sweeps."""
 
+import threading
+import time
 import urllib
-from typing import Optional
+import weakref
+from typing import Any, Collection, Dict, Optional, Tuple
 
 from wandb_gql import gql
 
 import wandb
-from wandb import util
+from wandb import env, util
 from wandb.apis import public
 from wandb.apis.attrs import Attrs
 from wandb.sdk.lib import ipython
@@ -26,6 +29,91 @@ SWEEP_FRAGMENT = """fragment SweepFragment on Sweep {
 }
 """
 
+_SWEEP_FIELDS = """
+            id
+            name
+            state
+            runCountExpected
+            bestLoss
+            config
+"""
+_LEGACY_SWEEP_FIELDS = _SWEEP_FIELDS.replace("runCountExpected\n", "")
+
+_SWEEPS_QUERY = """
+query Sweeps($project: String, $entity: String{variables}) {{
+    project(name: $project, entityName: $entity) {{
+{sweeps}
+    }}
+}}
+"""
+
+# Upper bound on the sweeps fetched by a single aliased query.
+_SWEEPS_PER_QUERY = 100
+
+
+def _sweeps_query(count: int, fields: str):
+    variables = "".join(f", $name{i}: String!" for i in range(count))
+    sweeps = "\n".join(
+        f"        sweep{i}: sweep(sweepName: $name{i}) {{{fields}        }}"
+        for i in range(count)
+    )
+    return gql(_SWEEPS_QUERY.format(variables=variables, sweeps=sweeps))
+
+
+class _SweepCache:
+    """Sweeps resolved by `Runs`, kept for `ttl` seconds.
+
+    One cache is shared by all `Runs` of the same client, so sweeps are not
+    fetched again for every page or every `Api.runs` call.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._sweeps: Dict[Tuple[str, str, str], Tuple[float, Optional["Sweep"]]] = {}
+
+    def get(
+        self, entity: str, project: str, sids: Collection[str]
+    ) -> Dict[str, Optional["Sweep"]]:
+        """Returns the sweeps in `sids` that are cached and haven't expired."""
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for sid in sids:
+                entry = self._sweeps.get((entity, project, sid))
+                if entry is None:
+                    continue
+                if now - entry[0] >= self.ttl:
+                    del self._sweeps[(entity, project, sid)]
+                    continue
+                found[sid] = entry[1]
+        return found
+
+    def put(
+        self, entity: str, project: str, sweeps: Dict[str, Optional["Sweep"]]
+    ) -> None:
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for sid, sweep in sweeps.items():
+                self._sweeps[(entity, project, sid)] = (now, sweep)
+
+
+_sweep_caches: "weakref.WeakKeyDictionary[Any, _SweepCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_sweep_caches_lock = threading.Lock()
+
+
+def get_sweep_cache(client) -> _SweepCache:
+    """Returns the sweep cache of a client."""
+    with _sweep_caches_lock:
+        cache = _sweep_caches.get(client)
+        if cache is None:
+            cache = _sweep_caches[client] = _SweepCache(env.get_sweep_cache_ttl())
+        return cache
+
 
 class Sweep(Attrs):
     """A set of runs associated with a sweep.
@@ -208,8 +296,53 @@ class Sweep(Attrs):
         ):
             return None
 
-        sweep_response = response["project"]["sweep"]
-        sweep = cls(client, entity, project, sid, attrs=sweep_response)
+        return cls._from_attrs(
+            client, entity, project, sid, response["project"]["sweep"], order=order
+        )
+
+    @classmethod
+    def get_many(
+        cls,
+        client,
+        entity: str,
+        project: str,
+        sids: Collection[str],
+    ) -> Dict[str, Optional["Sweep"]]:
+        """Fetch several sweeps of a project, without their runs being loaded.
+
+        The sweeps are fetched with one aliased query per `_SWEEPS_PER_QUERY`
+        sweeps. Sweeps that don't exist map to None.
+        """
+        sids = list(dict.fromkeys(sids))
+        sweeps: Dict[str, Optional[Sweep]] = {}
+        for start in range(0, len(sids), _SWEEPS_PER_QUERY):
+            chunk = sids[start : start + _SWEEPS_PER_QUERY]
+            variables = {"entity": entity, "project": project}
+            variables.update({f"name{i}": sid for i, sid in enumerate(chunk)})
+            try:
+                response = client.execute(
+                    _sweeps_query(len(chunk), _SWEEP_FIELDS),
+                    variable_values=variables,
+                )
+            except Exception:
+                # Don't handle exception, rely on legacy query
+                response = client.execute(
+                    _sweeps_query(len(chunk), _LEGACY_SWEEP_FIELDS),
+                    variable_values=variables,
+                )
+            project_response = (response or {}).get("project") or {}
+            for i, sid in enumerate(chunk):
+                attrs = project_response.get(f"sweep{i}")
+                sweeps[sid] = (
+                    cls._from_attrs(client, entity, project, sid, attrs)
+                    if attrs
+                    else None
+                )
+        return sweeps
+
+    @classmethod
+    def _from_attrs(cls, client, entity, project, sid, attrs, order=None) -> "Sweep":
+        sweep = cls(client, entity, project, sid, attrs=attrs)
         sweep.runs = public.Runs(
             client,
             entity,
@@ -218,7 +351,6 @@ class Sweep(Attrs):
             per_page=10,
             filters={"$and": [{"sweep": sweep.id}]},
         )
-
         return sweep
 
     def to_html(self, height=420, hidden=False):
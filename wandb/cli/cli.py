@@ -2483,25 +2483,20 @@ def pull(run, project, entity):
         raise ClickException("Run has no files")
     click.echo(f"Downloading: {click.style(project, bold=True)}/{run}")
 
-    for name in urls:
-        if api.file_current(name, urls[name]["md5"]):
-            click.echo("File {} is up to date".format(name))
+    files = list(urls.values())
+    with click.progressbar(
+        length=sum(int(file.get("sizeBytes") or 0) for file in files),
+        label="Files",
+        fill_char=click.style("&", fg="green"),
+    ) as bar:
+        results = api.download_write_files(
+            files, out_dir=".", progress=lambda num_bytes, _: bar.update(num_bytes)
+        )
+    for file, (_, response) in zip(files, results):
+        if response is None:
+            click.echo("File {} is up to date".format(file["name"]))
         else:
-            length, response = api.download_file(urls[name]["url"])
-            # TODO: I had to add this because some versions in CI broke click.progressbar
-            sys.stdout.write("File {}\r".format(name))
-            dirname = os.path.dirname(name)
-            if dirname != "":
-                filesystem.mkdir_exists_ok(dirname)
-            with click.progressbar(
-                length=length,
-                label="File {}".format(name),
-                fill_char=click.style("&", fg="green"),
-            ) as bar:
-                with open(name, "wb") as f:
-                    for data in response.iter_content(chunk_size=4096):
-                        f.write(data)
-                        bar.update(len(data))
+            click.echo("File {}".format(file["name"]))
 
 
 @cli.command(
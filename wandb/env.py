@@ -10,13 +10,19 @@ cases.
 from __future__ import annotations
 
 import json
+import logging
+import math
 import os
 import sys
 from pathlib import Path
-from typing import MutableMapping
+from typing import Callable, MutableMapping, TypeVar
 
 import platformdirs
 
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
 CONFIG_PATHS = "WANDB_CONFIG_PATHS"
 SWEEP_PARAM_PATH = "WANDB_SWEEP_PARAM_PATH"
 SHOW_RUN = "WANDB_SHOW_RUN"
@@ -88,6 +94,27 @@ LAUNCH_QUEUE_NAME = "WANDB_LAUNCH_QUEUE_NAME"
 LAUNCH_QUEUE_ENTITY = "WANDB_LAUNCH_QUEUE_ENTITY"
 LAUNCH_TRACE_ID = "WANDB_LAUNCH_TRACE_ID"
 _REQUIRE_LEGACY_SERVICE = "WANDB_X_REQUIRE_LEGACY_SERVICE"
+_DATASTORE_SYNC_MODE = "WANDB_X_DATASTORE_SYNC_MODE"
+_DATASTORE_SYNC_INTERVAL = "WANDB_X_DATASTORE_SYNC_INTERVAL"
+_DATASTORE_SYNC_BYTES = "WANDB_X_DATASTORE_SYNC_BYTES"
+_FILE_STREAM_COMPRESSION = "WANDB_X_FILE_STREAM_COMPRESSION"
+_SAMPLED_HISTORY_MODE = "WANDB_X_SAMPLED_HISTORY_MODE"
+_SAMPLED_HISTORY_SAMPLES = "WANDB_X_SAMPLED_HISTORY_SAMPLES"
+_SAMPLED_HISTORY_KEYS = "WANDB_X_SAMPLED_HISTORY_KEYS"
+_SAMPLED_HISTORY_MAX_BYTES = "WANDB_X_SAMPLED_HISTORY_MAX_BYTES"
+_ARTIFACT_UPLOAD_PART_CONCURRENCY = "WANDB_X_ARTIFACT_UPLOAD_PART_CONCURRENCY"
+_ARTIFACT_LINK_MODE = "WANDB_X_ARTIFACT_LINK_MODE"
+_DIGEST_CACHE = "WANDB_X_DIGEST_CACHE"
+_SWEEP_CACHE_TTL = "WANDB_X_SWEEP_CACHE_TTL"
+_PUBLIC_API_CACHE = "WANDB_X_PUBLIC_API_CACHE"
+_PUBLIC_API_CACHE_MAX_BYTES = "WANDB_X_PUBLIC_API_CACHE_MAX_BYTES"
+_INTROSPECTION_CACHE_TTL = "WANDB_X_INTROSPECTION_CACHE_TTL"
+_MEDIA_ENCODING_WORKERS = "WANDB_X_MEDIA_ENCODING_WORKERS"
+_MEDIA_ENCODING_QUEUE_SIZE = "WANDB_X_MEDIA_ENCODING_QUEUE_SIZE"
+_MEDIA_DEDUP = "WANDB_X_MEDIA_DEDUP"
+_STATS_SAMPLES_TO_AGGREGATE = "WANDB_X_STATS_SAMPLES_TO_AGGREGATE"
+_STATS_PERCENTILES = "WANDB_X_STATS_PERCENTILES"
+_STATS_OPEN_METRICS_TIMEOUT = "WANDB_X_STATS_OPEN_METRICS_TIMEOUT"
 
 # For testing, to be removed in future version
 USE_V1_ARTIFACTS = "_WANDB_USE_V1_ARTIFACTS"
@@ -150,6 +177,28 @@ def _env_as_bool(
         return False
 
 
+def _env_as_valid(
+    var: str,
+    default: _T,
+    parse: Callable[[str], _T],
+    is_valid: Callable[[_T], bool],
+    env: MutableMapping,
+) -> _T:
+    """Parse a variable, logging and returning the default if it's invalid."""
+    val = env.get(var)
+    if val is None:
+        return default
+    try:
+        parsed = parse(val)
+    except ValueError:
+        pass
+    else:
+        if is_valid(parsed):
+            return parsed
+    logger.warning("%s: ignoring invalid value %r, using %r", var, val, default)
+    return default
+
+
 def is_require_legacy_service(env: MutableMapping | None = None) -> bool:
     """Return whether wandb.require("legacy-service") was used."""
     return _env_as_bool(_REQUIRE_LEGACY_SERVICE, default="False", env=env)
@@ -219,6 +268,215 @@ def get_docker(
     return env.get(DOCKER, default)
 
 
+def get_datastore_sync_mode(
+    default: str = "block", env: MutableMapping | None = None
+) -> str:
+    if env is None:
+        env = os.environ
+
+    return _env_as_valid(
+        _DATASTORE_SYNC_MODE,
+        default,
+        str.lower,
+        lambda mode: mode in ("always", "block", "group", "none"),
+        env,
+    )
+
+
+def get_datastore_sync_interval(
+    default: float = 1.0, env: MutableMapping | None = None
+) -> float:
+    if env is None:
+        env = os.environ
+
+    return _env_as_valid(
+        _DATASTORE_SYNC_INTERVAL, default, float, lambda s: s >= 0, env
+    )
+
+
+def get_datastore_sync_bytes(
+    default: int = 4 * 1024 * 1024, env: MutableMapping | None = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return _env_as_valid(_DATASTORE_SYNC_BYTES, default, int, lambda n: n >= 0, env)
+
+
+def get_file_stream_compression(
+    default: str | None = None, env: MutableMapping | None = None
+) -> str | None:
+    if env is None:
+        env = os.environ
+
+    return env.get(_FILE_STREAM_COMPRESSION, default)
+
+
+def get_sampled_history_mode(
+    default: str = "uniform", env: MutableMapping | None = None
+) -> str:
+    if env is None:
+        env = os.environ
+
+    return env.get(_SAMPLED_HISTORY_MODE, default).lower()
+
+
+def get_sampled_history_samples(
+    default: int = 64, env: MutableMapping | None = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return int(env.get(_SAMPLED_HISTORY_SAMPLES, default))
+
+
+def get_sampled_history_keys(env: MutableMapping | None = None) -> dict[str, int]:
+    """Parse per-key sample counts, e.g. "loss=256,layer_*=0"."""
+    if env is None:
+        env = os.environ
+
+    key_samples = {}
+    for entry in env.get(_SAMPLED_HISTORY_KEYS, "").split(","):
+        pattern, sep, samples = entry.strip().rpartition("=")
+        if sep and pattern:
+            key_samples[pattern] = int(samples)
+    return key_samples
+
+
+def get_sampled_history_max_bytes(
+    default: int = 64 * 1024 * 1024, env: MutableMapping | None = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return int(env.get(_SAMPLED_HISTORY_MAX_BYTES, default))
+
+
+def get_artifact_upload_part_concurrency(
+    default: int = 4, env: MutableMapping | None = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return max(1, int(env.get(_ARTIFACT_UPLOAD_PART_CONCURRENCY, default)))
+
+
+def get_artifact_link_mode(
+    default: str = "copy", env: MutableMapping | None = None
+) -> str:
+    if env is None:
+        env = os.environ
+
+    return env.get(_ARTIFACT_LINK_MODE, default).lower()
+
+
+def get_digest_cache_enabled(env: MutableMapping | None = None) -> bool:
+    return _env_as_bool(_DIGEST_CACHE, default="False", env=env)
+
+
+def get_sweep_cache_ttl(
+    default: float = 300.0, env: MutableMapping | None = None
+) -> float:
+    if env is None:
+        env = os.environ
+
+    return float(env.get(_SWEEP_CACHE_TTL, default))
+
+
+def get_public_api_cache_enabled(env: MutableMapping | None = None) -> bool:
+    return _env_as_bool(_PUBLIC_API_CACHE, default="False", env=env)
+
+
+def get_public_api_cache_max_bytes(
+    default: int = 1024 * 1024 * 1024, env: MutableMapping | None = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return int(env.get(_PUBLIC_API_CACHE_MAX_BYTES, default))
+
+
+def get_introspection_cache_ttl(
+    default: float = 3600.0, env: MutableMapping | None = None
+) -> float:
+    if env is None:
+        env = os.environ
+
+    return float(env.get(_INTROSPECTION_CACHE_TTL, default))
+
+
+def get_media_encoding_workers(
+    default: int = 0, env: MutableMapping | None = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return int(env.get(_MEDIA_ENCODING_WORKERS, default))
+
+
+def get_media_dedup_enabled(env: MutableMapping | None = None) -> bool:
+    return _env_as_bool(_MEDIA_DEDUP, default="False", env=env)
+
+
+def get_media_encoding_queue_size(
+    default: int = 256, env: MutableMapping | None = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return max(1, int(env.get(_MEDIA_ENCODING_QUEUE_SIZE, default)))
+
+
+def get_stats_samples_to_aggregate(
+    default: int = 1, env: MutableMapping | None = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return max(
+        1, _env_as_valid(_STATS_SAMPLES_TO_AGGREGATE, default, int, lambda n: True, env)
+    )
+
+
+def get_stats_percentiles(env: MutableMapping | None = None) -> tuple[float, ...]:
+    """Percentiles of system metrics to publish in addition to their mean.
+
+    For example, "50,95" publishes `<metric>.p50` and `<metric>.p95`.
+    Entries that are not numbers in [0, 100] are logged and ignored.
+    """
+    if env is None:
+        env = os.environ
+
+    percentiles = []
+    for entry in env.get(_STATS_PERCENTILES, "").split(","):
+        if not entry.strip():
+            continue
+        try:
+            q = float(entry)
+        except ValueError:
+            q = math.nan
+        if not 0 <= q <= 100:
+            logger.warning(
+                "%s: ignoring %r, which is not a number in [0, 100]",
+                _STATS_PERCENTILES,
+                entry.strip(),
+            )
+            continue
+        percentiles.append(q)
+    return tuple(percentiles)
+
+
+def get_stats_open_metrics_timeout(
+    default: float = 3.0, env: MutableMapping | None = None
+) -> float:
+    if env is None:
+        env = os.environ
+
+    return _env_as_valid(
+        _STATS_OPEN_METRICS_TIMEOUT, default, float, lambda t: 0 < t < math.inf, env
+    )
+
+
 def get_http_timeout(default: int = 20, env: MutableMapping | None = None) -> int:
     if env is None:
         env = os.environ
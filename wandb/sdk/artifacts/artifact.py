@@ -71,6 +71,7 @@ from wandb.sdk.internal.internal_api import Api as InternalApi
 from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
 from wandb.sdk.lib import filesystem, retry, runid, telemetry
 from wandb.sdk.lib.deprecate import Deprecated, deprecate
+from wandb.sdk.lib.digest_cache import get_digest_cache
 from wandb.sdk.lib.hashutil import B64MD5, b64_to_hex_id, md5_file_b64
 from wandb.sdk.lib.paths import FilePathStr, LogicalPath, StrPath, URIStr
 from wandb.sdk.lib.runid import generate_id
@@ -1322,7 +1323,7 @@ class Artifact:
             raise ValueError(f"Path is not a file: {local_path!r}")
 
         name = LogicalPath(name or os.path.basename(local_path))
-        digest = md5_file_b64(local_path)
+        digest = get_digest_cache().md5_file_b64(local_path)
 
         if is_tmp:
             file_path, file_name = os.path.split(name)
@@ -1591,18 +1592,27 @@ class Artifact:
             raise ValueError(
                 f"Invalid policy {policy!r}. Policy may only be `mutable` or `immutable`."
             )
+        digest_cache = get_digest_cache()
         upload_path = path
         if policy == "mutable":
+            source_key = digest_cache.key(path)
             with tempfile.NamedTemporaryFile(dir=get_staging_dir(), delete=False) as f:
                 staging_path = f.name
                 shutil.copyfile(path, staging_path)
                 # Set as read-only to prevent changes to the file during upload process
                 os.chmod(staging_path, stat.S_IRUSR)
                 upload_path = staging_path
+            if digest is None and source_key and source_key == digest_cache.key(path):
+                # The source didn't change while it was copied, so its digest is
+                # the digest of the copy.
+                digest = digest_cache.get(path, source_key)
+                if digest is None:
+                    digest = md5_file_b64(upload_path)
+                    digest_cache.put(path, digest, source_key)
 
         entry = ArtifactManifestEntry(
             path=name,
-            digest=digest or md5_file_b64(upload_path),
+            digest=digest or digest_cache.md5_file_b64(upload_path),
             size=os.path.getsize(upload_path),
             local_path=upload_path,
             skip_cache=skip_cache,
@@ -9,15 +9,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+from wandb import env
 from wandb.sdk.lib import filesystem
 from wandb.sdk.lib.deprecate import Deprecated, deprecate
-from wandb.sdk.lib.hashutil import (
-    B64MD5,
-    ETag,
-    b64_to_hex_id,
-    hex_to_b64_id,
-    md5_file_b64,
-)
+from wandb.sdk.lib.digest_cache import get_digest_cache
+from wandb.sdk.lib.hashutil import B64MD5, ETag, b64_to_hex_id, hex_to_b64_id
 from wandb.sdk.lib.paths import FilePathStr, LogicalPath, StrPath, URIStr
 
 logger = logging.getLogger(__name__)
@@ -153,15 +149,23 @@ class ArtifactManifestEntry:
         else:
             override_cache_path = None
 
+        # A file linked from the cache is compared with the cache entry below
+        # instead of being hashed again.
+        link_mode = env.get_artifact_link_mode()
+        linked = (
+            link_mode != "copy" and not skip_cache and filesystem.is_link(dest_path)
+        )
+
         # Skip checking the cache (and possibly downloading) if the file already exists
         # and has the digest we're expecting.
-        try:
-            md5_hash = md5_file_b64(dest_path)
-        except (FileNotFoundError, IsADirectoryError):
-            logger.debug(f"unable to find {dest_path}, skip searching for file")
-        else:
-            if self.digest == md5_hash:
-                return FilePathStr(dest_path)
+        if not linked:
+            try:
+                md5_hash = get_digest_cache().md5_file_b64(dest_path)
+            except (FileNotFoundError, IsADirectoryError):
+                logger.debug(f"unable to find {dest_path}, skip searching for file")
+            else:
+                if self.digest == md5_hash:
+                    return FilePathStr(dest_path)
 
         if self.ref is not None:
             cache_path = self._parent_artifact.manifest.storage_policy.load_reference(
@@ -176,7 +180,7 @@ class ArtifactManifestEntry:
             return FilePathStr(dest_path)
         else:
             return FilePathStr(
-                str(filesystem.copy_or_overwrite_changed(cache_path, dest_path))
+                str(filesystem.link_or_copy(cache_path, dest_path, mode=link_mode))
             )
 
     def ref_target(self) -> FilePathStr | URIStr:
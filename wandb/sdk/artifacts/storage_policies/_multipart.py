@@ -0,0 +1,154 @@
+"""Resumable state of multipart artifact uploads."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from wandb import env
+from wandb.sdk.lib.filesystem import mkdir_exists_ok
+
+logger = logging.getLogger(__name__)
+
+_STATE_VERSION = 1
+
+
+def get_upload_state_dir() -> str:
+    return os.path.join(env.get_data_dir(), "artifacts", "uploads")
+
+
+class MultipartUploadState:
+    """Part digests and completed parts of a multipart upload, saved on disk.
+
+    The state is keyed by the file's MD5 digest, size and chunk size, so it
+    survives re-staging of the same content. Part digests are always reused;
+    completed parts are only reused if the server resumes the same upload id.
+    """
+
+    def __init__(
+        self,
+        digest: str,
+        size: int,
+        chunk_size: int,
+        state_dir: str | None = None,
+    ) -> None:
+        self._identity = {"digest": digest, "size": size, "chunk_size": chunk_size}
+        key = hashlib.sha256(
+            json.dumps(self._identity, sort_keys=True).encode()
+        ).hexdigest()
+        self._path = os.path.join(state_dir or get_upload_state_dir(), f"{key}.json")
+        self._lock = threading.Lock()
+
+        self.hex_digests: dict[int, str] = {}
+        self.upload_id: str | None = None
+        self.etags: dict[int, str] = {}
+        self._load()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _load(self) -> None:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+            if data["version"] != _STATE_VERSION or data["identity"] != self._identity:
+                return
+            hex_digests = {int(k): v for k, v in data["hex_digests"].items()}
+            etags = {int(k): v for k, v in data["etags"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+        self.hex_digests = hex_digests
+        self.upload_id = data.get("upload_id")
+        self.etags = etags
+
+    def _save(self) -> None:
+        data = {
+            "version": _STATE_VERSION,
+            "identity": self._identity,
+            "hex_digests": self.hex_digests,
+            "upload_id": self.upload_id,
+            "etags": self.etags,
+        }
+        tmp_path = f"{self._path}.tmp"
+        try:
+            mkdir_exists_ok(os.path.dirname(self._path))
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            # Losing the state only means a restarted upload starts over.
+            logger.warning(f"Failed to save multipart upload state: {e}")
+
+    def set_hex_digests(self, hex_digests: dict[int, str]) -> None:
+        with self._lock:
+            self.hex_digests = dict(hex_digests)
+            self._save()
+
+    def start(self, upload_id: str | None) -> None:
+        """Begin uploading parts, forgetting parts of a different upload."""
+        with self._lock:
+            if upload_id is None or upload_id != self.upload_id:
+                self.etags = {}
+            self.upload_id = upload_id
+            self._save()
+
+    def part_done(self, part_number: int, etag: str) -> None:
+        with self._lock:
+            self.etags[part_number] = etag
+            if self.upload_id is not None:
+                self._save()
+
+    def remove(self) -> None:
+        with self._lock:
+            try:
+                os.remove(self._path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove multipart upload state: {e}")
+
+
+class FilePart:
+    """A part of a file that is read from disk as it is uploaded.
+
+    Reads stop at the end of the part. `seek` and `tell` are relative to the
+    start of the part, so that a failed request can be retried.
+    """
+
+    def __init__(self, path: str, offset: int, size: int) -> None:
+        self._file = open(path, "rb")
+        self._offset = offset
+        self._pos = 0
+        self.len = size
+        self._file.seek(offset)
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self.len - self._pos
+        if size < 0 or size > remaining:
+            size = remaining
+        data = self._file.read(size)
+        self._pos += len(data)
+        return data
+
+    def seek(self, pos: int, whence: int = os.SEEK_SET) -> int:
+        if whence != os.SEEK_SET:
+            raise ValueError("FilePart only supports absolute positions")
+        self._pos = pos
+        self._file.seek(self._offset + pos)
+        return pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> FilePart:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
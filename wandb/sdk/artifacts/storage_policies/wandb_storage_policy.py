@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import hashlib
 import math
 import os
@@ -12,6 +13,7 @@ from urllib.parse import quote
 import requests
 import urllib3
 
+from wandb import env
 from wandb.errors.term import termwarn
 from wandb.sdk.artifacts.artifact_file_cache import (
     ArtifactFileCache,
@@ -30,6 +32,10 @@ from wandb.sdk.artifacts.storage_handlers.wb_local_artifact_handler import (
     WBLocalArtifactHandler,
 )
 from wandb.sdk.artifacts.storage_layout import StorageLayout
+from wandb.sdk.artifacts.storage_policies._multipart import (
+    FilePart,
+    MultipartUploadState,
+)
 from wandb.sdk.artifacts.storage_policies.register import WANDB_STORAGE_POLICY
 from wandb.sdk.artifacts.storage_policy import StoragePolicy
 from wandb.sdk.internal.internal_api import Api as InternalApi
@@ -38,7 +44,7 @@ from wandb.sdk.lib.hashutil import B64MD5, b64_to_hex_id, hex_to_b64_id
 from wandb.sdk.lib.paths import FilePathStr, URIStr
 
 if TYPE_CHECKING:
-    from wandb.filesync.step_prepare import StepPrepare
+    from wandb.filesync.step_prepare import ResponsePrepare, StepPrepare
     from wandb.sdk.artifacts.artifact import Artifact
     from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
     from wandb.sdk.internal import progress
@@ -58,6 +64,9 @@ S3_MAX_PART_NUMBERS = 1000
 S3_MIN_MULTI_UPLOAD_SIZE = 2 * 1024**3
 S3_MAX_MULTI_UPLOAD_SIZE = 5 * 1024**4
 
+# Size of the reads used to hash a multipart upload part
+_HASH_READ_SIZE = 16 * 1024**2
+
 
 class WandbStoragePolicy(StoragePolicy):
     @classmethod
@@ -78,6 +87,7 @@ class WandbStoragePolicy(StoragePolicy):
     ) -> None:
         self._cache = cache or get_artifact_file_cache()
         self._config = config or {}
+        self._part_concurrency = env.get_artifact_upload_part_concurrency()
         self._session = requests.Session()
         adapter = requests.adapters.HTTPAdapter(
             max_retries=_REQUEST_RETRY_STRATEGY,
@@ -219,31 +229,82 @@ class WandbStoragePolicy(StoragePolicy):
         hex_digests: dict[int, str],
         multipart_urls: dict[int, str],
         extra_headers: dict[str, str],
+        upload_state: MultipartUploadState | None = None,
     ) -> list[dict[str, Any]]:
-        etags = []
-        part_number = 1
-
-        with open(file_path, "rb") as f:
-            while True:
-                data = f.read(chunk_size)
-                if not data:
-                    break
-                md5_b64_str = str(hex_to_b64_id(hex_digests[part_number]))
+        """Upload the parts of a file concurrently.
+
+        Up to `_part_concurrency` parts are uploaded at a time, each streamed
+        from the file as it is sent rather than read into memory. Parts
+        already completed in `upload_state` are skipped.
+        """
+        file_size = os.path.getsize(file_path)
+        etags = dict(upload_state.etags) if upload_state else {}
+
+        def upload_part(part_number: int) -> tuple[int, str]:
+            offset = (part_number - 1) * chunk_size
+            size = min(chunk_size, file_size - offset)
+            md5_b64_str = str(hex_to_b64_id(hex_digests[part_number]))
+            with FilePart(file_path, offset, size) as part:
                 upload_resp = self._api.upload_multipart_file_chunk_retry(
                     multipart_urls[part_number],
-                    data,
+                    part,
                     extra_headers={
                         "content-md5": md5_b64_str,
-                        "content-length": str(len(data)),
+                        "content-length": str(size),
                         "content-type": extra_headers.get("Content-Type", ""),
                     },
                 )
-                assert upload_resp is not None
-                etags.append(
-                    {"partNumber": part_number, "hexMD5": upload_resp.headers["ETag"]}
-                )
-                part_number += 1
-        return etags
+            assert upload_resp is not None
+            etag = upload_resp.headers["ETag"]
+            if upload_state is not None:
+                upload_state.part_done(part_number, etag)
+            return part_number, etag
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._part_concurrency
+        ) as executor:
+            futures = [
+                executor.submit(upload_part, part_number)
+                for part_number in sorted(hex_digests)
+                if part_number not in etags
+            ]
+            try:
+                for future in futures:
+                    part_number, etag = future.result()
+                    etags[part_number] = etag
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return [
+            {"partNumber": part_number, "hexMD5": etags[part_number]}
+            for part_number in sorted(etags)
+        ]
+
+    def _hash_parts(
+        self, file_path: str, file_size: int, chunk_size: int
+    ) -> dict[int, str]:
+        """Compute the MD5 of each upload part, hashing parts concurrently."""
+
+        def hash_part(part_number: int) -> str:
+            hasher = hashlib.md5()
+            with open(file_path, "rb") as f:
+                f.seek((part_number - 1) * chunk_size)
+                remaining = chunk_size
+                while remaining > 0:
+                    data = f.read(min(remaining, _HASH_READ_SIZE))
+                    if not data:
+                        break
+                    hasher.update(data)
+                    remaining -= len(data)
+            return hasher.hexdigest()
+
+        part_numbers = range(1, math.ceil(file_size / chunk_size) + 1)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._part_concurrency
+        ) as executor:
+            return dict(zip(part_numbers, executor.map(hash_part, part_numbers)))
 
     def default_file_upload(
         self,
@@ -288,6 +349,7 @@ class WandbStoragePolicy(StoragePolicy):
         chunk_size = self.calc_chunk_size(file_size)
         upload_parts = []
         hex_digests = {}
+        upload_state = None
         file_path = entry.local_path if entry.local_path is not None else ""
         # Logic for AWS s3 multipart upload.
         # Only chunk files if larger than 2 GiB. Currently can only support up to 5TiB.
@@ -295,18 +357,17 @@ class WandbStoragePolicy(StoragePolicy):
             file_size >= S3_MIN_MULTI_UPLOAD_SIZE
             and file_size <= S3_MAX_MULTI_UPLOAD_SIZE
         ):
-            part_number = 1
-            with open(file_path, "rb") as f:
-                while True:
-                    data = f.read(chunk_size)
-                    if not data:
-                        break
-                    hex_digest = hashlib.md5(data).hexdigest()
-                    upload_parts.append(
-                        {"hexMD5": hex_digest, "partNumber": part_number}
-                    )
-                    hex_digests[part_number] = hex_digest
-                    part_number += 1
+            # Part digests of an interrupted upload of the same content are reused.
+            upload_state = MultipartUploadState(entry.digest, file_size, chunk_size)
+            if not upload_state.hex_digests:
+                upload_state.set_hex_digests(
+                    self._hash_parts(file_path, file_size, chunk_size)
+                )
+            hex_digests = upload_state.hex_digests
+            upload_parts = [
+                {"hexMD5": hex_digests[part_number], "partNumber": part_number}
+                for part_number in sorted(hex_digests)
+            ]
 
         resp = preparer.prepare(
             {
@@ -320,6 +381,37 @@ class WandbStoragePolicy(StoragePolicy):
 
         entry.birth_artifact_id = resp.birth_artifact_id
 
+        deduped = self._upload_prepared_file(
+            artifact_id,
+            entry,
+            resp,
+            chunk_size,
+            hex_digests,
+            upload_state,
+            progress_callback,
+        )
+        # A failed upload keeps its state, so that retrying it resumes it.
+        if upload_state is not None:
+            upload_state.remove()
+        return deduped
+
+    def _upload_prepared_file(
+        self,
+        artifact_id: str,
+        entry: ArtifactManifestEntry,
+        resp: ResponsePrepare,
+        chunk_size: int,
+        hex_digests: dict[int, str],
+        upload_state: MultipartUploadState | None,
+        progress_callback: progress.ProgressFn | None,
+    ) -> bool:
+        """Upload a file to the URLs returned by `StepPrepare`.
+
+        Returns:
+            True if the file was a duplicate (did not need to be uploaded),
+            False if it needed to be uploaded or was a reference (nothing to dedupe).
+        """
+        file_path = entry.local_path if entry.local_path is not None else ""
         multipart_urls = resp.multipart_upload_urls
         if resp.upload_url is None:
             return True
@@ -339,12 +431,15 @@ class WandbStoragePolicy(StoragePolicy):
             if multipart_urls is None:
                 raise ValueError(f"No multipart urls to upload for file: {file_path}")
             # Upload files using s3 multipart upload urls
+            if upload_state is not None:
+                upload_state.start(resp.upload_id)
             etags = self.s3_multipart_file_upload(
                 file_path,
                 chunk_size,
                 hex_digests,
                 multipart_urls,
                 extra_headers,
+                upload_state=upload_state,
             )
             assert resp.storage_path is not None
             self._api.complete_multipart_upload_artifact(
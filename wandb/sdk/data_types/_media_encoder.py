@@ -0,0 +1,199 @@
+"""Background encoding of media files.
+
+Encoding media such as `wandb.Image` into a file and hashing it can take long
+enough to stall a training loop that logs many of them. When enabled with
+`WANDB_X_MEDIA_ENCODING_WORKERS`, media objects are encoded on a pool of
+background threads instead, and their file is resolved on first use.
+"""
+
+import concurrent.futures
+import logging
+import os
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+import wandb
+from wandb import env
+
+logger = logging.getLogger(__name__)
+
+
+class MediaEncoder:
+    """Encodes media files on a pool of background threads.
+
+    At most `max_pending` encodings may be queued or running at a time.
+    Submitting more blocks until one of them finishes, so that media created
+    faster than it can be encoded doesn't accumulate in memory.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="MediaEncoder",
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def submit(self, fn: Callable[..., None], *args: Any) -> concurrent.futures.Future:
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+_media_encoder: Optional[MediaEncoder] = None
+_media_encoder_lock = threading.Lock()
+
+
+def get_media_encoder() -> Optional[MediaEncoder]:
+    """Returns the media encoder, or None if media is encoded synchronously."""
+    global _media_encoder
+    max_workers = env.get_media_encoding_workers()
+    if max_workers <= 0:
+        return None
+    max_pending = env.get_media_encoding_queue_size()
+    with _media_encoder_lock:
+        encoder = _media_encoder
+        if (
+            encoder is None
+            or encoder.max_workers != max_workers
+            or encoder.max_pending != max_pending
+        ):
+            # Media already submitted to a previous encoder still finishes.
+            if encoder is not None:
+                encoder._executor.shutdown(wait=False)
+            encoder = _media_encoder = MediaEncoder(max_workers, max_pending)
+        return encoder
+
+
+def _reset_after_fork() -> None:
+    # The threads of the encoder don't exist in a forked child.
+    global _media_encoder, _media_encoder_lock
+    _media_encoder = None
+    _media_encoder_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def pending_encodings(value: Any) -> List[concurrent.futures.Future]:
+    """Returns the unfinished encodings of the media in a logged value.
+
+    Looks inside dicts, lists, tuples and the rows of tables.
+    """
+    from .base_types.media import Media
+    from .table import Table
+
+    pending = []
+    stack: List[Any] = [value]
+    seen: set = set()
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, list, tuple, Table)):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, Table):
+                stack.extend(value.data)
+            else:
+                stack.extend(value)
+        elif isinstance(value, Media):
+            encoding = value._encoding
+            if encoding is not None and not encoding.done():
+                pending.append(encoding)
+    return pending
+
+
+class PendingHistory:
+    """Publishes history rows once the media in them is encoded.
+
+    A row with media that is still being encoded is queued and published by a
+    background thread as soon as the media is ready. Rows logged after it are
+    queued too, so rows are always published in the order they were logged. At
+    most `max_rows` rows may be waiting; logging more blocks until one is
+    published.
+
+    Rows are passed through `serialize`, if given, before they are queued, so
+    that values the caller changes in place later are published as logged.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[..., None],
+        max_rows: int,
+        serialize: Optional[Callable[..., dict]] = None,
+    ) -> None:
+        self._publish = publish
+        self._serialize = serialize
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(max_rows)
+        self._cond = threading.Condition()
+        self._num_waiting = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, data: dict, **kwargs: Any) -> None:
+        """Publish a history row now, or after any media in it is encoded."""
+        encodings = pending_encodings(data)
+        with self._cond:
+            if not encodings and self._num_waiting == 0:
+                queued = False
+            else:
+                queued = True
+                self._num_waiting += 1
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="PendingHistory", daemon=True
+                    )
+                    self._thread.start()
+        if not queued:
+            self._publish(data, **kwargs)
+            return
+        try:
+            if self._serialize is not None:
+                data = self._serialize(data, **kwargs)
+        except BaseException:
+            self._row_done()
+            raise
+        self._queue.put((encodings, data, kwargs))
+
+    def _row_done(self) -> None:
+        with self._cond:
+            self._num_waiting -= 1
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            encodings, data, kwargs = item
+            try:
+                concurrent.futures.wait(encodings)
+                self._publish(data, **kwargs)
+            except Exception as e:
+                logger.exception("Failed to publish history row with media")
+                wandb.termerror(f"Dropping logged row, failed to encode media: {e}")
+            finally:
+                self._row_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued rows are published."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._num_waiting == 0, timeout)
+
+    def close(self) -> None:
+        """Publish all queued rows and stop the background thread."""
+        self.flush()
+        with self._cond:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
@@ -49,10 +49,13 @@ class Audio(BatchableMedia):
             )
 
             tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + ".wav")
-            soundfile.write(tmp_path, data_or_path, sample_rate)
             self._duration = len(data_or_path) / float(sample_rate)
 
-            self._set_file(tmp_path, is_tmp=True)
+            def write(data):
+                soundfile.write(tmp_path, data, sample_rate)
+                self._set_file(tmp_path, is_tmp=True)
+
+            self._encode(write, data_or_path)
 
     @classmethod
     def get_media_subdir(cls):
@@ -68,6 +71,7 @@ class Audio(BatchableMedia):
     def bind_to_run(
         self, run, key, step, id_=None, ignore_copy_err: Optional[bool] = None
     ):
+        self._wait_encoded()
         if self.path_is_reference(self._path):
             raise ValueError(
                 "Audio media created by a reference to external storage cannot currently be added to a run"
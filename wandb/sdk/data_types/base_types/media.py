@@ -1,9 +1,22 @@
+import copy
 import hashlib
 import os
 import platform
 import re
 import shutil
-from typing import TYPE_CHECKING, Optional, Sequence, Type, Union, cast
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import wandb
 from wandb import util
@@ -11,9 +24,12 @@ from wandb._globals import _datatypes_callback
 from wandb.sdk.lib import filesystem
 from wandb.sdk.lib.paths import LogicalPath
 
+from .._media_encoder import get_media_encoder
 from .wb_value import WBValue
 
 if TYPE_CHECKING:  # pragma: no cover
+    import concurrent.futures
+
     import numpy as np
 
     from wandb.sdk.artifacts.artifact import Artifact
@@ -96,6 +112,33 @@ def _wb_filename(
     return f"{str(key)}_{str(step)}_{str(id)}{extension}"
 
 
+class MediaIndex:
+    """The media files of a run, by content.
+
+    Lets media with the same content as a file that was already saved to the run
+    refer to that file instead of saving and uploading another copy.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._paths: Dict[Tuple[str, str, str], str] = {}
+        self.bytes_saved = 0
+
+    def claim(self, subdir: str, extension: str, sha256: str, path: str) -> str:
+        """Return the path of the file with this content, registering `path` if new."""
+        key = (subdir, extension, sha256)
+        with self._lock:
+            existing = self._paths.get(key)
+            if existing is not None and existing != path and os.path.exists(existing):
+                return existing
+            self._paths[key] = path
+            return path
+
+    def add_saved(self, num_bytes: int) -> None:
+        with self._lock:
+            self.bytes_saved += num_bytes
+
+
 class Media(WBValue):
     """A WBValue stored as a file outside JSON that can be rendered in a media panel.
 
@@ -110,6 +153,8 @@ class Media(WBValue):
     _extension: Optional[str]
     _sha256: Optional[str]
     _size: Optional[int]
+    # The background encoding of the file, if it hasn't been waited for.
+    _encoding: Optional["concurrent.futures.Future"] = None
 
     def __init__(self, caption: Optional[str] = None) -> None:
         super().__init__()
@@ -132,6 +177,25 @@ class Media(WBValue):
             self._sha256 = hashlib.sha256(f.read()).hexdigest()
         self._size = os.path.getsize(self._path)
 
+    def _encode(self, encode: Callable[..., None], *data: Any) -> None:
+        """Call `encode(*data)` to create the file, in the background if enabled.
+
+        When encoding in the background, `data` is copied first so that the caller
+        may reuse its buffers, and the file is resolved the first time it's needed.
+        """
+        encoder = get_media_encoder()
+        if encoder is None:
+            encode(*data)
+        else:
+            self._encoding = encoder.submit(encode, *map(copy.copy, data))
+
+    def _wait_encoded(self) -> None:
+        """Wait for the file to be encoded, raising any error encoding it."""
+        encoding = self._encoding
+        if encoding is not None:
+            encoding.result()
+            self._encoding = None
+
     @classmethod
     def get_media_subdir(cls: Type["Media"]) -> str:
         raise NotImplementedError
@@ -149,6 +213,7 @@ class Media(WBValue):
         return self._run is not None
 
     def file_is_set(self) -> bool:
+        self._wait_encoded()
         return self._path is not None and self._sha256 is not None
 
     def bind_to_run(
@@ -186,6 +251,26 @@ class Media(WBValue):
         file_path = _wb_filename(key, step, id_, extension)
         media_path = os.path.join(self.get_media_subdir(), file_path)
         new_path = os.path.join(self._run.dir, media_path)
+
+        # Refer to the file of any media with the same content that was already
+        # saved to the run, e.g. the same image logged at every step.
+        media_index = self._media_index()
+        existing_path = (
+            media_index.claim(
+                self.get_media_subdir(), extension, self._sha256, new_path
+            )
+            if media_index is not None
+            else new_path
+        )
+        if existing_path != new_path:
+            assert media_index is not None
+            media_index.add_saved(self._size or 0)
+            if self._is_tmp:
+                os.remove(self._path)
+                self._is_tmp = False
+            self._path = existing_path
+            return
+
         filesystem.mkdir_exists_ok(os.path.dirname(new_path))
 
         if self._is_tmp:
@@ -202,6 +287,18 @@ class Media(WBValue):
             self._path = new_path
             _datatypes_callback(media_path)
 
+    def _media_index(self) -> Optional[MediaIndex]:
+        media_index: Optional[MediaIndex] = getattr(self._run, "_media_index", None)
+        if media_index is None:
+            return None
+        # Older servers find the files of image sequences by their key and step,
+        # so a step can't refer to the file of another step.
+        from wandb.sdk.data_types.image import _server_accepts_image_filenames
+
+        if not _server_accepts_image_filenames():
+            return None
+        return media_index
+
     def to_json(self, run: Union["LocalRun", "Artifact"]) -> dict:
         """Serialize the object into a JSON blob.
 
@@ -222,6 +319,7 @@ class Media(WBValue):
         from wandb.data_types import Audio
         from wandb.sdk.wandb_run import Run
 
+        self._wait_encoded()
         json_obj = {}
 
         if isinstance(run, Run):
@@ -318,6 +416,9 @@ class Media(WBValue):
 
     def __eq__(self, other: object) -> bool:
         """Likely will need to override for any more complicated media objects."""
+        self._wait_encoded()
+        if isinstance(other, Media):
+            other._wait_encoded()
         return (
             isinstance(other, self.__class__)
             and hasattr(self, "_sha256")
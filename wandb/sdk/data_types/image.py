@@ -2,7 +2,18 @@ import hashlib
 import logging
 import os
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from urllib import parse
 
 import wandb
@@ -242,11 +253,11 @@ class Image(BatchableMedia):
                     for key in total_classes.keys()
                 ]
             )
-        if self.image is not None:
-            self._width, self._height = self.image.size
+        self._load_dimensions()
         self._free_ram()
 
     def _initialize_from_wbimage(self, wbimage: "Image") -> None:
+        wbimage._wait_encoded()
         self._grouping = wbimage._grouping
         self._caption = wbimage._caption
         self._width = wbimage._width
@@ -338,9 +349,18 @@ class Image(BatchableMedia):
                 mode=mode,
             )
 
+        def save(image: "PILImage") -> None:
+            image.save(tmp_path, transparency=None)
+            self._set_file(tmp_path, is_tmp=True)
+            if image is not self._image:
+                # Saved from a copy in the background; the image is reloaded
+                # from the file if it's needed again.
+                self._free_ram()
+
         assert self._image is not None
-        self._image.save(tmp_path, transparency=None)
-        self._set_file(tmp_path, is_tmp=True)
+        # The background encode may free the image, so record its size now.
+        self._width, self._height = self._image.size
+        self._encode(save, self._image)
 
     @classmethod
     def from_json(
@@ -399,6 +419,7 @@ class Image(BatchableMedia):
         # space, but there are also custom charts, and maybe others. Let's
         # commit to getting all that fixed up before moving this to  the top
         # level Media class.
+        self._wait_encoded()
         if self.path_is_reference(self._path):
             raise ValueError(
                 "Image media created by a reference to external storage cannot currently be added to a run"
@@ -561,12 +582,11 @@ class Image(BatchableMedia):
                 )
 
         num_images_to_log = len(seq)
-        width, height = seq[0].image.size  # type: ignore
+        width, height = seq[0]._dimensions()
         format = jsons[0]["format"]
 
         def size_equals_image(image: "Image") -> bool:
-            img_width, img_height = image.image.size  # type: ignore
-            return img_width == width and img_height == height
+            return image._dimensions() == (width, height)
 
         sizes_match = all(size_equals_image(img) for img in seq)
         if not sizes_match:
@@ -701,17 +721,34 @@ class Image(BatchableMedia):
         if self._path is not None:
             self._image = None
 
+    def _load_dimensions(self) -> None:
+        """Records the width and height of the image, unless already known."""
+        if self._width is not None:
+            return
+        image = self.image
+        if image is not None:
+            self._width, self._height = image.size
+
+    def _dimensions(self) -> Tuple[int, int]:
+        """Returns the width and height of the image, loading it only if needed."""
+        if self._width is not None and self._height is not None:
+            return self._width, self._height
+        return self.image.size  # type: ignore
+
     @property
     def image(self) -> Optional["PILImage"]:
-        if self._image is None:
+        # Read once: a background encode may free the image at any time.
+        image = self._image
+        if image is None:
             if self._path is not None and not self.path_is_reference(self._path):
                 pil_image = util.get_module(
                     "PIL.Image",
                     required='wandb.Image needs the PIL package. To get it, run "pip install pillow".',
                 )
-                self._image = pil_image.open(self._path)
-                self._image.load()
-        return self._image
+                image = pil_image.open(self._path)
+                image.load()
+                self._image = image
+        return image
 
 
 # Custom dtypes for typing system
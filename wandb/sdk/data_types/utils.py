@@ -31,6 +31,10 @@ if TYPE_CHECKING:  # pragma: no cover
     ]
 
 
+class SerializedValue(str):
+    """A history value that is already serialized to JSON."""
+
+
 def history_dict_to_json(
     run: Optional["LocalRun"],
     payload: dict,
@@ -79,6 +83,10 @@ def val_to_json(
         # no need to do the expensive checks below.
         return converted  # type: ignore[return-value]
 
+    if util.is_history_scalar(val):
+        # numpy scalars and 0-d torch tensors are handled by the JSON encoder.
+        return converted  # type: ignore[return-value]
+
     typename = util.get_full_typename(val)
 
     if util.is_pandas_data_frame(val):
@@ -135,16 +135,19 @@ class Video(BatchableMedia):
                     "wandb.Video accepts a file path or numpy like data as input"
                 )
             fps = fps or 4
-            self.encode(fps=fps)
+            self._encode(self._encode_video, self.data, fps)
 
     def encode(self, fps: int = 4) -> None:
+        self._encode_video(self.data, fps)
+
+    def _encode_video(self, data: "np.ndarray", fps: int) -> None:
         # import ImageSequenceClip from the appropriate MoviePy module
         mpy = util.get_module(
             "moviepy.video.io.ImageSequenceClip",
             required='wandb.Video requires moviepy when passing raw data. Install with "pip install wandb[media]"',
         )
 
-        tensor = self._prepare_video(self.data)
+        tensor = self._prepare_video(data)
         _, self._height, self._width, self._channels = tensor.shape  # type: ignore
 
         # encode sequence of images into gif string
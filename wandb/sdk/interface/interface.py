@@ -44,7 +44,7 @@ from wandb.util import (
     maybe_compress_summary,
 )
 
-from ..data_types.utils import history_dict_to_json, val_to_json
+from ..data_types.utils import SerializedValue, history_dict_to_json, val_to_json
 from . import summary_record as sr
 
 MANIFEST_FILE_SIZE_THRESHOLD = 100_000
@@ -681,7 +681,10 @@ class InterfaceBase:
         for k, v in data.items():
             item = partial_history.item.add()
             item.key = k
-            item.value_json = json_dumps_safer_history(v)
+            if isinstance(v, SerializedValue):
+                item.value_json = v
+            else:
+                item.value_json = json_dumps_safer_history(v)
 
         if publish_step and step is not None:
             partial_history.step.num = step
@@ -14,15 +14,24 @@ header :=
   ident: char[4]
   magic: uint16
   version: uint8
+
+Durability is controlled by the sync mode:
+  always: fsync after every record
+  block:  fsync when a record ends on a block boundary (default)
+  group:  fsync at most once per time window or byte window (group commit)
+  none:   never fsync, flush to the OS page cache on block boundaries
 """
 
 # TODO: possibly restructure code by porting the C++ or go implementation
 
+import json
 import logging
+import mmap
 import os
 import struct
+import time
 import zlib
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 import wandb
 
@@ -48,6 +57,25 @@ LEVELDBLOG_HEADER_MAGIC = (
 )
 LEVELDBLOG_HEADER_VERSION = 0
 
+DATASTORE_SYNC_ALWAYS = "always"
+DATASTORE_SYNC_BLOCK = "block"
+DATASTORE_SYNC_GROUP = "group"
+DATASTORE_SYNC_NONE = "none"
+DATASTORE_SYNC_MODES = (
+    DATASTORE_SYNC_ALWAYS,
+    DATASTORE_SYNC_BLOCK,
+    DATASTORE_SYNC_GROUP,
+    DATASTORE_SYNC_NONE,
+)
+
+DEFAULT_SYNC_INTERVAL = 1.0  # seconds
+DEFAULT_SYNC_BYTES = 4 * 1024 * 1024
+
+DATASTORE_INDEX_SUFFIX = ".idx"
+DATASTORE_INDEX_VERSION = 2
+
+_HEADER_STRUCT = struct.Struct("<IHB")
+
 try:
     bytes("", "ascii")
 
@@ -66,13 +94,31 @@ except Exception:
 class DataStore:
     _index: int
     _flush_offset: int
-
-    def __init__(self) -> None:
+    _sync_mode: str
+    _sync_interval: float
+    _sync_bytes: int
+    _last_sync_time: float
+
+    def __init__(
+        self,
+        sync_mode: str = DATASTORE_SYNC_BLOCK,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        sync_bytes: int = DEFAULT_SYNC_BYTES,
+    ) -> None:
+        if sync_mode not in DATASTORE_SYNC_MODES:
+            raise ValueError(
+                f"Invalid sync mode {sync_mode!r}, "
+                f"expected one of {DATASTORE_SYNC_MODES}"
+            )
         self._opened_for_scan = False
         self._fp: Optional[IO[Any]] = None
         self._index = 0
         self._flush_offset = 0
         self._size_bytes = 0
+        self._sync_mode = sync_mode
+        self._sync_interval = sync_interval
+        self._sync_bytes = sync_bytes
+        self._last_sync_time = time.monotonic()
 
         self._crc = [0] * (LEVELDBLOG_LAST + 1)
         for x in range(1, LEVELDBLOG_LAST + 1):
@@ -263,14 +309,54 @@ class DataStore:
                 data_used += LEVELDBLOG_DATA_LEN
                 data_left -= LEVELDBLOG_DATA_LEN
 
-            # write last and flush the entire block to disk
+            # write last, this record ends on a block boundary
             self._write_record(s[data_used:], LEVELDBLOG_LAST)
-            self._fp.flush()
-            os.fsync(self._fp.fileno())
-            self._flush_offset = self._index
+            if self._sync_mode in (DATASTORE_SYNC_BLOCK, DATASTORE_SYNC_NONE):
+                self._sync()
+
+        if self._sync_mode == DATASTORE_SYNC_ALWAYS:
+            self._sync()
+        elif self._sync_mode == DATASTORE_SYNC_GROUP:
+            self.commit(force=False)
 
         return start_offset, self._index, self._flush_offset
 
+    def _sync(self) -> None:
+        """Flush buffered writes and, unless syncing is disabled, fsync them."""
+        assert self._fp
+        self._fp.flush()
+        if self._sync_mode != DATASTORE_SYNC_NONE:
+            os.fsync(self._fp.fileno())
+        self._flush_offset = self._index
+        self._last_sync_time = time.monotonic()
+
+    @property
+    def flush_offset(self) -> int:
+        """Offset up to which data is durable for the configured sync mode."""
+        return self._flush_offset
+
+    def commit(self, force: bool = True) -> int:
+        """Sync pending writes in group commit mode.
+
+        Without `force`, pending writes are only synced once the byte window
+        or the time window since the last sync has been exceeded.
+
+        Returns:
+            The current flush offset.
+        """
+        if self._fp is None or self._opened_for_scan:
+            return self._flush_offset
+        pending = self._index - self._flush_offset
+        if pending <= 0:
+            return self._flush_offset
+        if (
+            force
+            or pending >= self._sync_bytes
+            or time.monotonic() - self._last_sync_time >= self._sync_interval
+        ):
+            self._sync()
+        return self._flush_offset
+
     def ensure_flushed(self, off: int) -> None:
         self._fp.flush()  # type: ignore
 
@@ -294,4 +380,314 @@ class DataStore:
     def close(self) -> None:
         if self._fp is not None:
             logger.info("close: %s", self._fname)
+            if self._sync_mode == DATASTORE_SYNC_GROUP and not self._fp.closed:
+                self.commit()
             self._fp.close()
+
+
+class MmapDataStoreScanner:
+    """Memory-mapped reader for transaction logs written by DataStore.
+
+    Records that fit into a single block are returned as zero-copy
+    `memoryview` slices of the mapping; only records that span blocks are
+    joined into a new buffer. Payloads stay valid until `close()` and
+    should be released (or dropped) before closing.
+
+    A sidecar index (`<fname>.idx`) of record offsets by record type can
+    be built with `build_index()`, so that callers can seek straight to,
+    for example, the last summary or the exit record.
+    """
+
+    _fname: str
+    _mm: Optional[mmap.mmap]
+    _view: Optional[memoryview]
+    _size: int
+    _inode: int
+    _verify: bool
+    _index: Optional["DataStoreIndex"]
+    truncated: bool
+
+    def __init__(self, fname: str, verify: bool = True) -> None:
+        self._fname = fname
+        self._verify = verify
+        self._mm = None
+        self._view = None
+        self._index = None
+        self.truncated = False
+
+        self._crc = [0] * (LEVELDBLOG_LAST + 1)
+        for x in range(1, LEVELDBLOG_LAST + 1):
+            self._crc[x] = zlib.crc32(strtobytes(chr(x))) & 0xFFFFFFFF
+
+        logger.info("open for mmap scan: %s", fname)
+        with open(fname, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._size = stat.st_size
+            self._inode = stat.st_ino
+            assert (
+                self._size >= LEVELDBLOG_HEADER_LEN
+            ), "header is {} bytes instead of the expected {}".format(
+                self._size, LEVELDBLOG_HEADER_LEN
+            )
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        self._check_header()
+
+    def __enter__(self) -> "MmapDataStoreScanner":
+        return self
+
+    def __exit__(self, *args: "Any") -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # payloads handed out by scan() are still referenced,
+                # the mapping is released once they are collected
+                logger.debug("mmap still referenced on close: %s", self._fname)
+            self._mm = None
+
+    def _check_header(self) -> None:
+        assert self._view is not None
+        ident, magic, version = struct.unpack_from("<4sHB", self._view, 0)
+        if ident != strtobytes(LEVELDBLOG_HEADER_IDENT):
+            raise Exception("Invalid header")
+        if magic != LEVELDBLOG_HEADER_MAGIC:
+            raise Exception("Invalid header")
+        if version != LEVELDBLOG_HEADER_VERSION:
+            raise Exception("Invalid header")
+
+    def _skip_trailer(self, offset: int) -> int:
+        """Return the offset past the block trailer at offset, if any."""
+        space_left = LEVELDBLOG_BLOCK_LEN - offset % LEVELDBLOG_BLOCK_LEN
+        if space_left >= LEVELDBLOG_HEADER_LEN:
+            return offset
+        if self._verify:
+            assert self._view is not None
+            pad = self._view[offset : min(offset + space_left, self._size)]
+            # verify they are zero
+            assert not any(pad), "invalid padding"
+        return offset + space_left
+
+    def _read_chunk(self, offset: int) -> Optional[Tuple[int, memoryview, int]]:
+        """Read the chunk at offset, skipping block trailers.
+
+        Returns:
+            (dtype, data, next_offset), or None if the log ends at offset
+            or the chunk is incomplete.
+        """
+        view = self._view
+        assert view is not None
+        offset = self._skip_trailer(offset)
+        if offset + LEVELDBLOG_HEADER_LEN > self._size:
+            self.truncated = offset < self._size
+            return None
+        checksum, dlength, dtype = _HEADER_STRUCT.unpack_from(view, offset)
+        start = offset + LEVELDBLOG_HEADER_LEN
+        end = start + dlength
+        if end > self._size:
+            self.truncated = True
+            return None
+        data = view[start:end]
+        if self._verify:
+            assert (
+                checksum == zlib.crc32(data, self._crc[dtype]) & 0xFFFFFFFF
+            ), "record checksum is invalid, data may be corrupt"
+        return dtype, data, end
+
+    def _read_record(self, offset: int) -> Optional[Tuple[int, memoryview, int]]:
+        """Read the record whose first chunk is at or after offset.
+
+        Returns:
+            (record_offset, payload, next_offset) or None at the end of the log.
+        """
+        offset = self._skip_trailer(offset)
+        chunk = self._read_chunk(offset)
+        if chunk is None:
+            return None
+        dtype, data, next_offset = chunk
+        if dtype == LEVELDBLOG_FULL:
+            return offset, data, next_offset
+
+        assert (
+            dtype == LEVELDBLOG_FIRST
+        ), f"expected record to be type {LEVELDBLOG_FIRST} but found {dtype}"
+        buf = bytearray(data)
+        while True:
+            chunk = self._read_chunk(next_offset)
+            if chunk is None:
+                return None
+            dtype, data, next_offset = chunk
+            buf += data
+            if dtype == LEVELDBLOG_LAST:
+                break
+            assert (
+                dtype == LEVELDBLOG_MIDDLE
+            ), f"expected record to be type {LEVELDBLOG_MIDDLE} but found {dtype}"
+        return offset, memoryview(buf), next_offset
+
+    def scan(self, start: int = LEVELDBLOG_HEADER_LEN) -> Iterator[memoryview]:
+        """Yield record payloads starting at the given offset."""
+        for _, data in self.scan_with_offsets(start):
+            yield data
+
+    def scan_with_offsets(
+        self, start: int = LEVELDBLOG_HEADER_LEN
+    ) -> Iterator[Tuple[int, memoryview]]:
+        """Yield (record_offset, payload) pairs starting at the given offset."""
+        offset = start
+        while True:
+            record = self._read_record(offset)
+            if record is None:
+                return
+            record_offset, data, offset = record
+            yield record_offset, data
+
+    def read_at(self, offset: int) -> memoryview:
+        """Return the payload of the record starting at offset."""
+        record = self._read_record(offset)
+        assert record is not None, f"no record at offset {offset}"
+        return record[1]
+
+    @property
+    def index_fname(self) -> str:
+        return self._fname + DATASTORE_INDEX_SUFFIX
+
+    def load_index(self) -> Optional["DataStoreIndex"]:
+        """Load the sidecar index if it exists and matches this log."""
+        try:
+            with open(self.index_fname) as f:
+                index = DataStoreIndex.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not self._index_matches(index):
+            logger.info("ignoring stale index: %s", self.index_fname)
+            return None
+        return index
+
+    def _index_matches(self, index: "DataStoreIndex") -> bool:
+        """Check that the log was only appended to since the index was built."""
+        if index.inode != self._inode or index.end_offset > self._size:
+            return False
+        if not index.end_offset:
+            return True
+        try:
+            record = self._read_record(index.last_offset)
+        except AssertionError:
+            return False
+        if record is None:
+            return False
+        _, data, next_offset = record
+        return (
+            next_offset == index.end_offset
+            and zlib.crc32(data) & 0xFFFFFFFF == index.last_crc
+        )
+
+    def build_index(self, save: bool = True) -> "DataStoreIndex":
+        """Build (or extend) the index of record offsets by record type."""
+        from wandb.proto import wandb_internal_pb2
+
+        index = self.load_index() or DataStoreIndex(inode=self._inode)
+        if index.end_offset < self._size:
+            record = wandb_internal_pb2.Record()
+            offset = index.end_offset or LEVELDBLOG_HEADER_LEN
+            last_data = None
+            while True:
+                scanned = self._read_record(offset)
+                if scanned is None:
+                    break
+                record_offset, last_data, offset = scanned
+                record.ParseFromString(last_data)
+                record_type = record.WhichOneof("record_type") or ""
+                index.offsets.setdefault(record_type, []).append(record_offset)
+                index.last_offset = record_offset
+                index.end_offset = offset
+            if last_data is not None:
+                index.last_crc = zlib.crc32(last_data) & 0xFFFFFFFF
+            if save:
+                self._save_index(index)
+        self._index = index
+        return index
+
+    def _save_index(self, index: "DataStoreIndex") -> None:
+        # write to a temporary file first so readers never see a partial index
+        tmp_fname = f"{self.index_fname}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_fname, "w") as f:
+                json.dump(index.to_dict(), f)
+            os.replace(tmp_fname, self.index_fname)
+        except OSError as e:
+            logger.warning("Unable to save index %s: %s", self.index_fname, e)
+            try:
+                os.remove(tmp_fname)
+            except OSError:
+                pass
+
+    def last(self, record_type: str) -> Optional[memoryview]:
+        """Return the payload of the last record of the given type.
+
+        The index is built in memory if needed; the sidecar is only written
+        by `build_index()`.
+        """
+        index = self._index or self.build_index(save=False)
+        offsets = index.offsets.get(record_type)
+        if not offsets:
+            return None
+        return self.read_at(offsets[-1])
+
+
+class DataStoreIndex:
+    """Offsets of records in a transaction log grouped by record type."""
+
+    offsets: Dict[str, List[int]]
+    end_offset: int
+    inode: int
+    last_offset: int
+    last_crc: int
+
+    def __init__(
+        self,
+        offsets: Optional[Dict[str, List[int]]] = None,
+        end_offset: int = 0,
+        inode: int = 0,
+        last_offset: int = 0,
+        last_crc: int = 0,
+    ) -> None:
+        self.offsets = offsets or {}
+        self.end_offset = end_offset
+        # identify the log the index was built from, so that a log that was
+        # replaced or rewritten since is not matched by size alone
+        self.inode = inode
+        self.last_offset = last_offset
+        self.last_crc = last_crc
+
+    def to_dict(self) -> Dict[str, "Any"]:
+        return {
+            "version": DATASTORE_INDEX_VERSION,
+            "end_offset": self.end_offset,
+            "inode": self.inode,
+            "last_offset": self.last_offset,
+            "last_crc": self.last_crc,
+            "offsets": self.offsets,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, "Any"]) -> "DataStoreIndex":
+        if data["version"] != DATASTORE_INDEX_VERSION:
+            raise ValueError(f"Unsupported index version {data['version']}")
+        return cls(
+            offsets=data["offsets"],
+            end_offset=data["end_offset"],
+            inode=data["inode"],
+            last_offset=data["last_offset"],
+            last_crc=data["last_crc"],
+        )
@@ -1,4 +1,5 @@
 import functools
+import gzip
 import itertools
 import json
 import logging
@@ -46,6 +47,9 @@ from ..lib import file_stream_utils
 
 logger = logging.getLogger(__name__)
 
+# Request bodies smaller than this are not worth compressing.
+COMPRESSION_MIN_BYTES = 1024
+
 
 class Chunk(NamedTuple):
     filename: str
@@ -320,6 +324,9 @@ class FileStreamApi:
 
     MAX_ITEMS_PER_PUSH = 10000
 
+    COMPRESSION_GZIP = "gzip"
+    COMPRESSION_ZSTD = "zstd"
+
     def __init__(
         self,
         api: "internal_api.Api",
@@ -327,6 +334,7 @@ class FileStreamApi:
         start_time: float,
         timeout: float = 0,
         settings: Optional[dict] = None,
+        compression: Optional[str] = None,
     ) -> None:
         settings = settings or dict()
         # NOTE: exc_info is set in thread_except_body context and readable by calling threads
@@ -349,6 +357,7 @@ class FileStreamApi:
         self._client.cookies.update(api.client.transport.cookies or {})  # type: ignore[no-untyped-call]
         self._client.proxies.update(api.client.transport.session.proxies or {})
         self._file_policies: Dict[str, DefaultFilePolicy] = {}
+        self._compression = self._init_compression(compression)
         self._dropped_chunks: int = 0
         self._queue: queue.Queue = queue.Queue()
         self._thread = threading.Thread(target=self._thread_except_body)
@@ -368,6 +377,77 @@ class FileStreamApi:
             run=self._run_id,
         )
 
+    def _init_compression(self, compression: Optional[str]) -> Optional[str]:
+        if not compression or compression == "none":
+            return None
+        if compression == self.COMPRESSION_ZSTD:
+            self._zstd = util.get_module("zstandard")
+            if self._zstd is None:
+                logger.warning("zstandard is not installed, using gzip instead")
+                return self.COMPRESSION_GZIP
+            return compression
+        if compression != self.COMPRESSION_GZIP:
+            logger.warning("Unknown file stream compression %r, ignoring", compression)
+            return None
+        return compression
+
+    def _compress(self, body: bytes) -> bytes:
+        if self._compression == self.COMPRESSION_ZSTD:
+            return self._zstd.ZstdCompressor().compress(body)  # type: ignore[no-any-return]
+        return gzip.compress(body, compresslevel=6)
+
+    def _post(
+        self, payload: Dict[str, Any], **kwargs: Any
+    ) -> Union["requests.Response", "requests.RequestException"]:
+        """Post a JSON payload, compressing the request body if enabled.
+
+        If the server rejects a compressed body but accepts the same payload
+        uncompressed, compression is turned off for the rest of the run.
+        """
+        compression = self._compression
+        if compression is None:
+            return request_with_retry(
+                self._client.post, self._endpoint, json=payload, **kwargs
+            )
+
+        body = json.dumps(payload).encode("utf-8")
+        if len(body) < COMPRESSION_MIN_BYTES:
+            return request_with_retry(
+                self._client.post,
+                self._endpoint,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                **kwargs,
+            )
+
+        response = request_with_retry(
+            self._client.post,
+            self._endpoint,
+            data=self._compress(body),
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": compression,
+            },
+            **kwargs,
+        )
+        if not _is_rejected(response, compression):
+            return response
+
+        response = request_with_retry(
+            self._client.post,
+            self._endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            **kwargs,
+        )
+        if not isinstance(response, Exception):
+            logger.info(
+                "file stream server rejected %s request bodies, disabling compression",
+                compression,
+            )
+            self._compression = None
+        return response
+
     def start(self) -> None:
         self._init_endpoint()
         self._thread.start()
@@ -425,10 +505,8 @@ class FileStreamApi:
                 if isinstance(item, self.Finish):
                     finished = item
                 elif isinstance(item, self.Preempting):
-                    request_with_retry(
-                        self._client.post,
-                        self._endpoint,
-                        json={
+                    self._post(
+                        {
                             "complete": False,
                             "preempting": True,
                             "dropped": self._dropped_chunks,
@@ -464,10 +542,8 @@ class FileStreamApi:
                 # list of uploaded files, don't reset the `uploaded`
                 # list. Retry publishing the list on the next attempt.
                 if not isinstance(
-                    request_with_retry(
-                        self._client.post,
-                        self._endpoint,
-                        json={
+                    self._post(
+                        {
                             "complete": False,
                             "failed": False,
                             "dropped": self._dropped_chunks,
@@ -479,10 +555,8 @@ class FileStreamApi:
                     uploaded = set()
 
         # post the final close message. (item is self.Finish instance now)
-        request_with_retry(
-            self._client.post,
-            self._endpoint,
-            json={
+        self._post(
+            {
                 "complete": True,
                 "exitcode": int(finished.exitcode),
                 "dropped": self._dropped_chunks,
@@ -539,20 +613,16 @@ class FileStreamApi:
 
         for fs in file_stream_utils.split_files(files, max_bytes=util.MAX_LINE_BYTES):
             self._handle_response(
-                request_with_retry(
-                    self._client.post,
-                    self._endpoint,
-                    json={"files": fs, "dropped": self._dropped_chunks},
+                self._post(
+                    {"files": fs, "dropped": self._dropped_chunks},
                     retry_callback=self._api.retry_callback,
                 )
             )
 
         if uploaded_list:
             if isinstance(
-                request_with_retry(
-                    self._client.post,
-                    self._endpoint,
-                    json={
+                self._post(
+                    {
                         "complete": False,
                         "failed": False,
                         "dropped": self._dropped_chunks,
@@ -613,6 +683,28 @@ class FileStreamApi:
 MAX_SLEEP_SECONDS = 60 * 5
 
 
+def _is_rejected(
+    response: Union["requests.Response", Exception], compression: str
+) -> bool:
+    """Whether the server refused the content encoding of the request body.
+
+    That is a 415, or a 400 whose body or Accept-Encoding header names the
+    encoding. Other 400s are about the payload, and sending it again
+    uncompressed wouldn't help.
+    """
+    if not isinstance(response, requests.exceptions.HTTPError):
+        return False
+    rejection = response.response
+    if rejection is None:
+        return False
+    if rejection.status_code == 415:
+        return True
+    if rejection.status_code != 400:
+        return False
+    reason = f"{rejection.text} {rejection.headers.get('Accept-Encoding', '')}".lower()
+    return "encoding" in reason or compression in reason
+
+
 def request_with_retry(
     func: Callable,
     *args: Any,
@@ -653,6 +745,7 @@ def request_with_retry(
                     403,
                     404,
                     409,
+                    415,
                 }:
                     return e
 
@@ -18,9 +18,11 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    Union,
     cast,
 )
 
+from wandb import env
 from wandb.errors.links import url_registry
 from wandb.proto.wandb_internal_pb2 import (
     HistoryRecord,
@@ -80,7 +82,9 @@ def _dict_nested_set(target: Dict[str, Any], key_list: Sequence[str], v: Any) ->
 
 class HandleManager:
     _consolidated_summary: SummaryDict
-    _sampled_history: Dict[str, sample.UniformSampleAccumulator]
+    _sampled_history: Union[
+        Dict[str, sample.UniformSampleAccumulator], sample.ReservoirSampleStore
+    ]
     _partial_history: Dict[str, Any]
     _run_proto: Optional[RunRecord]
     _settings: SettingsStatic
@@ -129,7 +133,7 @@ class HandleManager:
 
         # keep track of summary from key/val updates
         self._consolidated_summary = dict()
-        self._sampled_history = defaultdict(sample.UniformSampleAccumulator)
+        self._sampled_history = self._new_sampled_history()
         self._run_proto = None
         self._partial_history = dict()
         self._metric_defines = defaultdict(MetricRecord)
@@ -260,14 +264,24 @@ class HandleManager:
             )
             self._dispatch_record(request_record)
 
+    def _new_sampled_history(
+        self,
+    ) -> Union[Dict[str, sample.UniformSampleAccumulator], sample.ReservoirSampleStore]:
+        if env.get_sampled_history_mode() == "reservoir":
+            return sample.ReservoirSampleStore(
+                samples=env.get_sampled_history_samples(),
+                key_samples=env.get_sampled_history_keys(),
+                max_bytes=env.get_sampled_history_max_bytes(),
+            )
+        return defaultdict(sample.UniformSampleAccumulator)
+
     def _save_history(
         self,
-        history: HistoryRecord,
+        history_dict: Dict[str, Any],
     ) -> None:
-        for item in history.item:
+        # values were already decoded by handle_history, don't decode them again
+        for k, v in history_dict.items():
             # TODO(jhr) save nested keys?
-            k = item.key
-            v = json.loads(item.value_json)
             if isinstance(v, numbers.Real):
                 self._sampled_history[k].add(v)
 
@@ -532,7 +546,7 @@ class HandleManager:
 
         self._history_update(record.history, history_dict)
         self._dispatch_record(record)
-        self._save_history(record.history)
+        self._save_history(history_dict)
         # update summary from history
         updated_keys = self._update_summary(history_dict)
         if updated_keys:
@@ -602,6 +616,8 @@ class HandleManager:
 
     def handle_summary(self, record: Record) -> None:
         summary = record.summary
+        # top-level keys whose value changed, only these are sent on
+        updated_keys = set()
         for item in summary.update:
             if len(item.nested_key) > 0:
                 # we use either key or nested_key -- not both
@@ -620,6 +636,7 @@ class HandleManager:
 
             # use the last element of the key to write the leaf:
             target[key[-1]] = json.loads(item.value_json)
+            updated_keys.add(key[0])
 
         for item in summary.remove:
             if len(item.nested_key) > 0:
@@ -639,8 +656,14 @@ class HandleManager:
 
             # use the last element of the key to erase the leaf:
             del target[key[-1]]
+            if len(key) > 1:
+                updated_keys.add(key[0])
+            else:
+                updated_keys.discard(key[0])
 
-        self._save_summary(self._consolidated_summary)
+        if updated_keys:
+            updated_items = {k: self._consolidated_summary[k] for k in updated_keys}
+            self._save_summary(updated_items)
 
     def handle_exit(self, record: Record) -> None:
         if self._track_time is not None:
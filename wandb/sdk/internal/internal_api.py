@@ -1,5 +1,6 @@
 import ast
 import base64
+import concurrent.futures
 import datetime
 import functools
 import http.client
@@ -45,19 +46,23 @@ from wandb.integration.sagemaker import parse_sm_secrets
 from wandb.old.settings import Settings
 from wandb.sdk.artifacts._validators import is_artifact_registry_project
 from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
+from wandb.sdk.lib.digest_cache import get_digest_cache
 from wandb.sdk.lib.gql_request import GraphQLSession
-from wandb.sdk.lib.hashutil import B64MD5, md5_file_b64
+from wandb.sdk.lib.hashutil import B64MD5
 
 from ..lib import credentials, retry
 from ..lib.filenames import DIFF_FNAME, METADATA_FNAME
 from ..lib.gitlib import GitRepo
-from . import context
+from . import context, introspection_cache
 from .progress import Progress
 
 logger = logging.getLogger(__name__)
 
 LAUNCH_DEFAULT_PROJECT = "model-registry"
 
+# Number of files `pull` downloads at a time.
+_DOWNLOAD_MAX_WORKERS = 8
+
 if TYPE_CHECKING:
     from typing import Literal, TypedDict
 
@@ -157,6 +162,13 @@ def check_httpclient_logger_handler() -> None:
         httpclient_logger.addHandler(root_logger.handlers[0])
 
 
+def _download_chunk_size(size: int) -> int:
+    """Returns the chunk size for streaming a download of `size` bytes."""
+    if size <= 0:
+        return 256 * 1024
+    return min(max(size // 8, 64 * 1024), 4 * 1024 * 1024)
+
+
 class _ThreadLocalData(threading.local):
     context: Optional[context.Context]
 
@@ -366,6 +378,16 @@ class Api:
         self.server_supports_template_variables: Optional[bool] = None
         self.server_push_to_run_queue_supports_priority: Optional[bool] = None
 
+    def _introspect(self, query_string: str) -> Any:
+        """Run a schema introspection query, reusing results cached on disk."""
+        cache = introspection_cache.get_introspection_cache(self.api_url)
+        res = cache.get(query_string)
+        if res is None:
+            res = self.gql(gql(query_string))
+            if isinstance(res, dict):
+                cache.put(query_string, res)
+        return res
+
     def gql(self, *args: Any, **kwargs: Any) -> Any:
         ret = self._retry_gql(
             *args,
@@ -617,8 +639,7 @@ class Api:
             or self.mutation_types is None
             or self.server_info_types is None
         ):
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
 
             self.query_types = [
                 field.get("name", "")
@@ -650,8 +671,7 @@ class Api:
             }
         """
         if self._server_settings_type is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             self._server_settings_type = (
                 [
                     field.get("name", "")
@@ -674,8 +694,7 @@ class Api:
         """
 
         if self.server_use_artifact_input_info is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             self.server_use_artifact_input_info = [
                 field.get("name", "")
                 for field in res.get("UseArtifactInputInfoType", {}).get(
@@ -686,17 +705,15 @@ class Api:
 
     @normalize_exceptions
     def launch_agent_introspection(self) -> Optional[str]:
-        query = gql(
-            """
+        query_string = """
             query LaunchAgentIntrospection {
                 LaunchAgentType: __type(name: "LaunchAgent") {
                     name
                 }
             }
         """
-        )
 
-        res = self.gql(query)
+        res = self._introspect(query_string)
         return res.get("LaunchAgentType") or None
 
     @normalize_exceptions
@@ -716,8 +733,7 @@ class Api:
             self.server_create_run_queue_supports_drc is None
             or self.server_create_run_queue_supports_priority is None
         ):
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             if res is None:
                 raise CommError("Could not get CreateRunQueue input from GQL.")
             self.server_create_run_queue_supports_drc = "defaultResourceConfigID" in [
@@ -760,8 +776,7 @@ class Api:
             self.server_supports_template_variables is None
             or self.server_push_to_run_queue_supports_priority is None
         ):
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             self.server_supports_template_variables = "templateVariableValues" in [
                 x["name"]
                 for x in (
@@ -804,8 +819,7 @@ class Api:
             }
         """
 
-        query = gql(query_string)
-        res = self.gql(query)
+        res = self._introspect(query_string)
 
         self.fail_run_queue_item_input_info = [
             field.get("name", "")
@@ -1002,7 +1016,12 @@ class Api:
         )
         query = gql(query_string)
         res = self.gql(query)
-        return res.get("viewer") or {}, res.get("serverInfo") or {}
+        server_info = res.get("serverInfo") or {}
+        version = (server_info.get("latestLocalVersionInfo") or {}).get(
+            "versionOnThisInstanceString"
+        )
+        introspection_cache.get_introspection_cache(self.api_url).set_version(version)
+        return res.get("viewer") or {}, server_info
 
     @normalize_exceptions
     def list_projects(self, entity: Optional[str] = None) -> List[Dict[str, str]]:
@@ -2023,8 +2042,7 @@ class Api:
             }
         """
 
-        query = gql(query_string)
-        res = self.gql(query)
+        res = self._introspect(query_string)
 
         self.create_launch_agent_input_info = [
             field.get("name", "")
@@ -2748,6 +2766,7 @@ class Api:
                                 name
                                 url
                                 md5
+                                sizeBytes
                                 updatedAt
                             }
                         }
@@ -2843,8 +2862,15 @@ class Api:
             A tuple of the content length and the streaming response
         """
         check_httpclient_logger_handler()
+        return self._download_file(url, self._download_request_kwargs())
 
-        http_headers = _thread_local_api_settings.headers or {}
+    def _download_request_kwargs(self) -> Dict[str, Any]:
+        """Returns the auth, cookies and headers of download requests.
+
+        These depend on thread-local settings, so they must be read in the
+        thread that requested the download.
+        """
+        http_headers = dict(_thread_local_api_settings.headers or {})
 
         auth = None
         if self.access_token is not None:
@@ -2852,13 +2878,20 @@ class Api:
         elif _thread_local_api_settings.cookies is None:
             auth = ("api", self.api_key or "")
 
-        response = requests.get(
-            url,
-            auth=auth,
-            cookies=_thread_local_api_settings.cookies or {},
-            headers=http_headers,
-            stream=True,
-        )
+        return {
+            "auth": auth,
+            "cookies": _thread_local_api_settings.cookies or {},
+            "headers": http_headers,
+        }
+
+    def _download_file(
+        self,
+        url: str,
+        request_kwargs: Dict[str, Any],
+        session: Optional[requests.Session] = None,
+    ) -> Tuple[int, requests.Response]:
+        get = session.get if session is not None else requests.get
+        response = get(url, stream=True, **request_kwargs)
         response.raise_for_status()
         return int(response.headers.get("content-length", 0)), response
 
@@ -2878,19 +2911,106 @@ class Api:
             A tuple of the file's local path and the streaming response. The streaming response is None if the file
             already existed and was up-to-date.
         """
-        filename = metadata["name"]
-        path = os.path.join(out_dir or self.settings("wandb_dir"), filename)
-        if self.file_current(filename, B64MD5(metadata["md5"])):
+        check_httpclient_logger_handler()
+        return self._download_write_file(
+            metadata,
+            out_dir or self.settings("wandb_dir"),
+            self._download_request_kwargs(),
+        )
+
+    def _download_write_file(
+        self,
+        metadata: Dict[str, str],
+        out_dir: str,
+        request_kwargs: Dict[str, Any],
+        progress: Optional[Callable[[int], None]] = None,
+        session: Optional[requests.Session] = None,
+    ) -> Tuple[str, Optional[requests.Response]]:
+        path = os.path.join(out_dir, metadata["name"])
+        if self.file_current(path, B64MD5(metadata["md5"])):
             return path, None
 
-        size, response = self.download_file(metadata["url"])
+        size, response = self._download_file(metadata["url"], request_kwargs, session)
 
-        with util.fsync_open(path, "wb") as file:
-            for data in response.iter_content(chunk_size=1024):
-                file.write(data)
+        # Write to a temporary file so that an interrupted download never
+        # looks like a complete one.
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as file:
+                for data in response.iter_content(
+                    chunk_size=_download_chunk_size(size)
+                ):
+                    file.write(data)
+                    if progress is not None:
+                        progress(len(data))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
         return path, response
 
+    @normalize_exceptions
+    def download_write_files(
+        self,
+        files: Iterable[Dict[str, str]],
+        out_dir: Optional[str] = None,
+        max_workers: int = _DOWNLOAD_MAX_WORKERS,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Tuple[str, Optional[requests.Response]]]:
+        """Download several files of a run concurrently.
+
+        Args:
+            files (list): The metadata of the files to download. Comes from Api.download_urls().
+            out_dir (str, optional): The directory to write the files to. Defaults to wandb/
+            max_workers (int, optional): The number of files to download at a time.
+            progress (callable, optional): Called with the number of bytes just
+                written and the total size of all the files.
+
+        Returns:
+            A list of the `download_write_file` results of each file, in order.
+        """
+        check_httpclient_logger_handler()
+        files = list(files)
+        out_dir = out_dir or self.settings("wandb_dir")
+        request_kwargs = self._download_request_kwargs()
+        total = sum(int(file.get("sizeBytes") or 0) for file in files)
+        progress_lock = threading.Lock()
+
+        def report(num_bytes: int) -> None:
+            if progress is not None:
+                with progress_lock:
+                    progress(num_bytes, total)
+
+        # The session pools connections to the hosts of these files only, and
+        # doesn't keep their cookies beyond this call.
+        with requests.Session() as session, concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="DownloadFiles"
+        ) as executor:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=max(1, max_workers),
+                pool_maxsize=max(1, max_workers),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            futures = [
+                executor.submit(
+                    self._download_write_file,
+                    file,
+                    out_dir,
+                    request_kwargs,
+                    report,
+                    session,
+                )
+                for file in files
+            ]
+            try:
+                return [future.result() for future in futures]
+            finally:
+                for future in futures:
+                    future.cancel()
+
     def upload_file_azure(
         self, url: str, file: Any, extra_headers: Dict[str, str]
     ) -> None:
@@ -2929,14 +3049,14 @@ class Api:
     def upload_multipart_file_chunk(
         self,
         url: str,
-        upload_chunk: bytes,
+        upload_chunk: Union[bytes, IO[bytes]],
         extra_headers: Optional[Dict[str, str]] = None,
     ) -> Optional[requests.Response]:
         """Upload a file chunk to S3 with failure resumption.
 
         Args:
             url: The url to download
-            upload_chunk: The path to the file you want to upload
+            upload_chunk: The chunk, or a file object positioned at its start
             extra_headers: A dictionary of extra headers to send with the request
 
         Returns:
@@ -2956,6 +3076,9 @@ class Api:
             logger.error(f"upload_file exception {url}: {e}")
             request_headers = e.request.headers if e.request is not None else ""
             logger.error(f"upload_file request headers: {request_headers!r}")
+            if not isinstance(upload_chunk, bytes):
+                # Rewind the chunk for the next retry.
+                upload_chunk.seek(0)
             response_content = e.response.content if e.response is not None else ""
             logger.error(f"upload_file response body: {response_content!r}")
             status_code = e.response.status_code if e.response is not None else 0
@@ -3391,11 +3514,16 @@ class Api:
     @staticmethod
     def file_current(fname: str, md5: B64MD5) -> bool:
         """Checksum a file and compare the md5 with the known md5."""
-        return os.path.isfile(fname) and md5_file_b64(fname) == md5
+        return os.path.isfile(fname) and get_digest_cache().md5_file_b64(fname) == md5
 
     @normalize_exceptions
     def pull(
-        self, project: str, run: Optional[str] = None, entity: Optional[str] = None
+        self,
+        project: str,
+        run: Optional[str] = None,
+        entity: Optional[str] = None,
+        max_workers: int = _DOWNLOAD_MAX_WORKERS,
+        progress: Optional[Callable[[int, int], None]] = None,
     ) -> "List[requests.Response]":
         """Download files from W&B.
 
@@ -3403,19 +3531,19 @@ class Api:
             project (str): The project to download
             run (str, optional): The run to upload to
             entity (str, optional): The entity to scope this project to.  Defaults to wandb models
+            max_workers (int, optional): The number of files to download at a time
+            progress (callable, optional): Called with the number of bytes just
+                written and the total size of all the files
 
         Returns:
             The `requests` library response object
         """
         project, run = self.parse_slug(project, run=run)
         urls = self.download_urls(project, run, entity)
-        responses = []
-        for filename in urls:
-            _, response = self.download_write_file(urls[filename])
-            if response:
-                responses.append(response)
-
-        return responses
+        results = self.download_write_files(
+            urls.values(), max_workers=max_workers, progress=progress
+        )
+        return [response for _, response in results if response]
 
     def get_project(self) -> str:
         project: str = self.default_settings.get("project") or self.settings("project")
@@ -3783,8 +3911,7 @@ class Api:
         """
 
         if self.server_organization_type_fields_info is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             input_fields = res.get("OrganizationInfoType", {}).get("fields", [{}])
             self.server_organization_type_fields_info = [
                 field["name"] for field in input_fields if "name" in field
@@ -3810,8 +3937,7 @@ class Api:
             }
         """
 
-        query = gql(query_string)
-        res = self.gql(query)
+        res = self._introspect(query_string)
         input_fields = res.get("ProjectInfoType", {}).get("fields", [{}])
         artifact_args: List[Dict[str, str]] = next(
             (
@@ -3881,8 +4007,7 @@ class Api:
         """
 
         if self.server_artifact_fields_info is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             input_fields = res.get("ArtifactInfoType", {}).get("fields", [{}])
             self.server_artifact_fields_info = [
                 field["name"] for field in input_fields if "name" in field
@@ -3902,8 +4027,7 @@ class Api:
         """
 
         if self.server_create_artifact_input_info is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             input_fields = res.get("CreateArtifactInputInfoType", {}).get(
                 "inputFields", [{}]
             )
@@ -4332,8 +4456,7 @@ class Api:
             }
         """
 
-        query = gql(query_string)
-        res = self.gql(query)
+        res = self._introspect(query_string)
         create_artifact_file_spec_input_info = [
             field.get("name", "")
             for field in res.get("CreateArtifactFileSpecInputInfoType", {}).get(
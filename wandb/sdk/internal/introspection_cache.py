@@ -0,0 +1,118 @@
+"""Cache of server schema introspection results shared across processes."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from wandb import env
+from wandb.sdk.lib.paths import StrPath
+
+logger = logging.getLogger(__name__)
+
+
+class IntrospectionCache:
+    """Caches the results of schema introspection queries to one server.
+
+    Results are saved to a JSON file so that other processes talking to the
+    same server can skip the queries. The file expires `ttl` seconds after it
+    was created. It also records the version of the server, if known, and is
+    discarded as soon as a different version is seen.
+    """
+
+    def __init__(self, path: StrPath, ttl: float) -> None:
+        self._path = Path(path)
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def _key(query_string: str) -> str:
+        return hashlib.sha256(" ".join(query_string.split()).encode()).hexdigest()
+
+    def _new_data(self, version: Optional[str] = None) -> Dict[str, Any]:
+        return {"created": time.time(), "version": version, "results": {}}
+
+    def _expired(self, data: Dict[str, Any]) -> bool:
+        return time.time() - data["created"] >= self._ttl
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+            if not isinstance(data["results"], dict) or self._expired(data):
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return data
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None or self._expired(self._data):
+            self._data = self._read() or self._new_data()
+        return self._data
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.debug(f"Failed to save introspection cache: {e}")
+
+    def get(self, query_string: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached result of an introspection query."""
+        if self._ttl <= 0:
+            return None
+        with self._lock:
+            return self._load()["results"].get(self._key(query_string))
+
+    def put(self, query_string: str, result: Dict[str, Any]) -> None:
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            data = self._load()
+            # Keep results saved by other processes in the meantime.
+            on_disk = self._read()
+            if on_disk is not None and on_disk.get("version") == data["version"]:
+                on_disk["results"].update(data["results"])
+                data = self._data = on_disk
+            data["results"][self._key(query_string)] = result
+            self._save(data)
+
+    def set_version(self, version: Optional[str]) -> None:
+        """Records the server version, dropping results of any other version."""
+        if self._ttl <= 0 or version is None:
+            return
+        with self._lock:
+            data = self._load()
+            if data["version"] == version:
+                return
+            if data["version"] is not None:
+                logger.info(f"Server version changed to {version}, re-probing schema")
+                data = self._data = self._new_data(version)
+            else:
+                data["version"] = version
+            self._save(data)
+
+
+_caches: Dict[str, IntrospectionCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_introspection_cache(base_url: str) -> IntrospectionCache:
+    """Returns the introspection cache of the server at `base_url`."""
+    url_hash = hashlib.sha256(base_url.rstrip("/").encode()).hexdigest()
+    path = env.get_cache_dir() / "introspection" / f"{url_hash}.json"
+    ttl = env.get_introspection_cache_ttl()
+    with _caches_lock:
+        cache = _caches.get(str(path))
+        if cache is None:
+            cache = _caches[str(path)] = IntrospectionCache(path, ttl)
+        cache._ttl = ttl
+        return cache
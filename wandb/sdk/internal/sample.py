@@ -1,6 +1,18 @@
 """sample."""
 
+import array
+import fnmatch
+import logging
 import math
+import numbers
+import random
+
+from wandb.util import get_module
+
+logger = logging.getLogger(__name__)
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
 
 
 class UniformSampleAccumulator:
@@ -68,3 +80,152 @@ class UniformSampleAccumulator:
         if len(sampled) < self._samples:
             return tuple(full)
         return tuple(sampled)
+
+
+class ReservoirSampleAccumulator:
+    """Uniform reservoir sample of a single history key.
+
+    Values and their arrival index are kept in fixed-size typed arrays, so
+    each key uses at most `samples * 16` bytes no matter how many values are
+    added. `get()` returns the sampled values in arrival order.
+
+    Values are stored as 64-bit integers until a value that isn't one is
+    added, and as doubles from then on. Values beyond the range of a double
+    are skipped.
+    """
+
+    ITEM_BYTES = 16
+
+    def __init__(self, samples=None, rng=None):
+        self._samples = samples or 64
+        self._rng = rng or random.Random()
+        # arrays grow up to the reservoir size, keys with few values stay small
+        self._values = array.array("q")
+        self._index = array.array("q")
+        self._count = 0
+        self._integral = True
+
+    def _convert(self, val):
+        """Returns val as stored in the values array, or None to skip it."""
+        if self._integral:
+            if isinstance(val, numbers.Integral) and _INT64_MIN <= val <= _INT64_MAX:
+                return int(val)
+            self._integral = False
+            self._values = array.array("d", self._values)
+        try:
+            return float(val)
+        except OverflowError:
+            logger.debug("not sampling %s, it is out of range", val)
+            return None
+
+    def add(self, val):
+        val = self._convert(val)
+        if val is None:
+            return
+        count = self._count
+        self._count += 1
+        if count < self._samples:
+            self._values.append(val)
+            self._index.append(count)
+            return
+        slot = self._rng.randrange(count + 1)
+        if slot < self._samples:
+            self._values[slot] = val
+            self._index[slot] = count
+
+    def get(self):
+        if not self._values:
+            return ()
+        np = get_module("numpy")
+        if np is not None:
+            dtype = np.int64 if self._integral else np.float64
+            values = np.frombuffer(self._values, dtype=dtype)
+            order = np.argsort(np.frombuffer(self._index, dtype=np.int64))
+            return tuple(values[order].tolist())
+        order = sorted(range(len(self._index)), key=self._index.__getitem__)
+        return tuple(self._values[i] for i in order)
+
+
+class ReservoirSampleStore:
+    """Lazily registered reservoir samplers for all history keys.
+
+    Behaves like a `defaultdict` of accumulators: a key gets a sampler the
+    first time it is looked up. Sample counts can be set per key with glob
+    patterns in `key_samples`, where a count of 0 turns sampling off for the
+    matching keys. Once the reserved memory of all samplers reaches
+    `max_bytes`, new keys are no longer sampled.
+    """
+
+    def __init__(self, samples=None, key_samples=None, max_bytes=None, seed=None):
+        self._samples = samples or 64
+        self._key_samples = dict(key_samples or {})
+        self._max_bytes = max_bytes
+        self._reserved_bytes = 0
+        self._rng = random.Random(seed)
+        self._accumulators = {}
+        self._skipped = set()
+        self._full = False
+
+    @property
+    def reserved_bytes(self):
+        return self._reserved_bytes
+
+    @property
+    def num_skipped(self):
+        return len(self._skipped)
+
+    def _samples_for(self, key):
+        for pattern, samples in self._key_samples.items():
+            if fnmatch.fnmatchcase(key, pattern):
+                return samples
+        return self._samples
+
+    def __getitem__(self, key):
+        accumulator = self._accumulators.get(key)
+        if accumulator is not None:
+            return accumulator
+        if key in self._skipped:
+            return _NULL_ACCUMULATOR
+
+        samples = self._samples_for(key)
+        reserve = samples * ReservoirSampleAccumulator.ITEM_BYTES
+        if samples <= 0:
+            self._skipped.add(key)
+            return _NULL_ACCUMULATOR
+        if (
+            self._max_bytes is not None
+            and self._reserved_bytes + reserve > self._max_bytes
+        ):
+            if not self._full:
+                logger.warning(
+                    "sampled history reached %d bytes, not sampling new keys",
+                    self._reserved_bytes,
+                )
+                self._full = True
+            self._skipped.add(key)
+            return _NULL_ACCUMULATOR
+
+        accumulator = ReservoirSampleAccumulator(samples=samples, rng=self._rng)
+        self._accumulators[key] = accumulator
+        self._reserved_bytes += reserve
+        return accumulator
+
+    def __contains__(self, key):
+        return key in self._accumulators
+
+    def __len__(self):
+        return len(self._accumulators)
+
+    def items(self):
+        return self._accumulators.items()
+
+
+class _NullAccumulator:
+    def add(self, val):
+        pass
+
+    def get(self):
+        return ()
+
+
+_NULL_ACCUMULATOR = _NullAccumulator()
@@ -21,6 +21,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -202,6 +203,7 @@ class _OutputRawStream:
 class SendManager:
     UPDATE_CONFIG_TIME: int = 30
     UPDATE_STATUS_TIME: int = 5
+    UPDATE_SUMMARY_TIME: int = 2
 
     _settings: SettingsStatic
     _record_q: "Queue[Record]"
@@ -232,6 +234,9 @@ class SendManager:
     _send_end_offset: int
     _debounce_config_time: float
     _debounce_status_time: float
+    _debounce_summary_time: float
+    _summary_json: Dict[str, str]
+    _summary_dirty_keys: Set[str]
 
     def __init__(
         self,
@@ -274,6 +279,10 @@ class SendManager:
         self._config_metric_index_dict: Dict[str, int] = {}
         self._config_metric_dict: Dict[str, wandb_internal_pb2.MetricRecord] = {}
         self._consolidated_summary: Dict[str, Any] = dict()
+        # encoded `"key": value` fragments of the consolidated summary, only
+        # dirty keys are re-encoded when the summary is saved
+        self._summary_json = dict()
+        self._summary_dirty_keys = set()
 
         self._cached_server_info = dict()
         self._cached_viewer = dict()
@@ -313,6 +322,8 @@ class SendManager:
         time_now = time.monotonic()
         self._debounce_config_time = time_now
         self._debounce_status_time = time_now
+        # allow the first summary update to be saved right away
+        self._debounce_summary_time = 0.0
 
     @classmethod
     def setup(
@@ -520,6 +531,7 @@ class SendManager:
     def debounce(self, final: bool = False) -> None:
         self._maybe_report_status(always=final)
         self._maybe_update_config(always=final)
+        self._maybe_save_summary(always=final)
 
     def _debounce_config(self) -> None:
         config_value_dict = self._config_backend_dict()
@@ -556,6 +568,7 @@ class SendManager:
         logger.info("handling runtime: %s", run_exit.runtime)
         self._metadata_summary["runtime"] = runtime
         self._update_summary()
+        self._maybe_save_summary(always=True)
 
         # We need to give the request queue a chance to empty between states
         # so use handle_request_defer as a state machine.
@@ -1105,6 +1118,7 @@ class SendManager:
             self._run.start_time.ToMicroseconds() / 1e6,
             timeout=self._settings.x_file_stream_timeout_seconds or 0,
             settings=self._api_settings,
+            compression=wandb.env.get_file_stream_compression(),
         )
         # Ensure the streaming polices have the proper offsets
         self._fs.set_file_policy("wandb-summary.json", file_stream.SummaryFilePolicy())
@@ -1137,14 +1151,17 @@ class SendManager:
             self._run.start_time.ToMicroseconds() / 1e6,
         )
 
-    def _save_history(self, history_dict: Dict[str, Any]) -> None:
+    def _save_history(self, history_json: str) -> None:
         if self._fs:
-            self._fs.push(filenames.HISTORY_FNAME, json.dumps(history_dict))
+            self._fs.push(filenames.HISTORY_FNAME, history_json)
 
     def send_history(self, record: "Record") -> None:
         history = record.history
-        history_dict = proto_util.dict_from_proto_list(history.item)
-        self._save_history(history_dict)
+        # values are already JSON encoded, so avoid a decode/encode round trip
+        history_json = proto_util.json_from_proto_list(history.item)
+        if history_json is None:
+            history_json = json.dumps(proto_util.dict_from_proto_list(history.item))
+        self._save_history(history_json)
 
     def _update_summary_record(self, summary: "SummaryRecord") -> None:
         summary_dict = proto_util.dict_from_proto_list(summary.update)
@@ -1158,19 +1175,50 @@ class SendManager:
         self._update_summary_record(record.request.summary_record.summary)
 
     def _update_summary(self) -> None:
-        summary_dict = self._cached_summary.copy()
-        summary_dict.pop("_wandb", None)
+        # merge with consolidated summary, tracking which keys changed
+        for key, value in self._cached_summary.items():
+            if key == "_wandb":
+                continue
+            if (
+                key in self._consolidated_summary
+                and self._consolidated_summary[key] == value
+            ):
+                continue
+            self._consolidated_summary[key] = value
+            self._summary_dirty_keys.add(key)
         if self._metadata_summary:
-            summary_dict["_wandb"] = self._metadata_summary
-        # merge with consolidated summary
-        self._consolidated_summary.update(summary_dict)
-        json_summary = json.dumps(self._consolidated_summary)
+            # metadata is updated in place, so always consider it changed
+            self._consolidated_summary["_wandb"] = self._metadata_summary
+            self._summary_dirty_keys.add("_wandb")
+        self._maybe_save_summary()
+
+    def _maybe_save_summary(self, always: bool = False) -> None:
+        if not self._summary_dirty_keys:
+            return
+        time_now = time.monotonic()
+        if (
+            not always
+            and time_now < self._debounce_summary_time + self.UPDATE_SUMMARY_TIME
+        ):
+            return
+        self._debounce_summary_time = time_now
+        self._save_summary()
+
+    def _save_summary(self) -> None:
+        for key in self._summary_dirty_keys:
+            encoded_value = json.dumps(self._consolidated_summary[key])
+            self._summary_json[key] = f"{json.dumps(key)}: {encoded_value}"
+        self._summary_dirty_keys.clear()
+        json_summary = "{" + ", ".join(self._summary_json.values()) + "}"
+
         if self._fs:
             self._fs.push(filenames.SUMMARY_FNAME, json_summary)
-        # TODO(jhr): we should only write this at the end of the script
+        # write to a temporary file first so readers never see a partial summary
         summary_path = os.path.join(self._settings.files_dir, filenames.SUMMARY_FNAME)
-        with open(summary_path, "w") as f:
+        tmp_path = summary_path + ".tmp"
+        with open(tmp_path, "w") as f:
             f.write(json_summary)
+        os.replace(tmp_path, summary_path)
         self._save_file(interface.GlobStr(filenames.SUMMARY_FNAME))
 
     def send_stats(self, record: "Record") -> None:
@@ -1200,6 +1248,7 @@ class SendManager:
     def _output_raw_finish(self) -> None:
         for stream, output_raw in self._output_raw_streams.items():
             output_raw._stopped.set()
+            output_raw._queue.put(None)
 
             # shut down threads
             output_raw._writer_thr.join(timeout=5)
@@ -1216,17 +1265,12 @@ class SendManager:
             self._output_raw_file = None
 
     def _output_raw_writer_thread(self, stream: "StreamLiterals") -> None:
-        while True:
-            output_raw = self._output_raw_streams[stream]
-            if output_raw._queue.empty():
-                if output_raw._stopped.is_set():
-                    return
-                time.sleep(0.5)
-                continue
-            data = []
-            while not output_raw._queue.empty():
-                data.append(output_raw._queue.get())
-            if output_raw._stopped.is_set() and sum(map(len, data)) > 100000:
+        output_raw = self._output_raw_streams[stream]
+        for data in redirect._queued_writes(output_raw._queue):
+            if (
+                output_raw._stopped.is_set()
+                and sum(map(len, data)) > redirect._MAX_UNPROCESSED_OUTPUT
+            ):
                 logger.warning("Terminal output too large. Logging without processing.")
                 self._output_raw_flush(stream)
                 for line in data:
@@ -1240,9 +1284,10 @@ class SendManager:
 
     def _output_raw_reader_thread(self, stream: "StreamLiterals") -> None:
         output_raw = self._output_raw_streams[stream]
-        while not (output_raw._stopped.is_set() and output_raw._queue.empty()):
+        while True:
             self._output_raw_flush(stream)
-            time.sleep(_OUTPUT_MIN_CALLBACK_INTERVAL)
+            if output_raw._stopped.wait(_OUTPUT_MIN_CALLBACK_INTERVAL):
+                return
 
     def _output_raw_flush(
         self, stream: "StreamLiterals", data: Optional[str] = None
@@ -1580,6 +1625,7 @@ class SendManager:
 
     def finish(self) -> None:
         logger.info("shutting down sender")
+        self._maybe_save_summary(always=True)
         # if self._tb_watcher:
         #     self._tb_watcher.finish()
         self._output_raw_finish()
@@ -1650,7 +1696,7 @@ class SendManager:
         if self._job_builder.disable or self._settings._offline:
             return
         self._job_builder.set_config(self._consolidated_config.non_internal_config())
-        summary_dict = self._cached_summary.copy()
+        summary_dict = self._consolidated_summary.copy()
         summary_dict.pop("_wandb", None)
         self._job_builder.set_summary(summary_dict)
 
@@ -1,5 +1,9 @@
+import array
+import math
 import sys
-from typing import Union
+from typing import Any, Dict, List, Optional, Union
+
+from wandb import env
 
 if sys.version_info >= (3, 9):
     from collections.abc import Sequence
@@ -8,6 +12,25 @@ else:
 
 Number = Union[int, float]
 
+# Below this many stored values, numpy's per-call overhead outweighs its speed.
+_NUMPY_MIN_SIZE = 256
+
+
+def _round(value: Any, precision: Optional[int]) -> Any:
+    if precision is None:
+        return value
+    if isinstance(value, (int, float)):
+        return round(value, precision)
+    return value.round(precision)
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
 
 def aggregate_mean(samples: Sequence[Number], precision: int = 2) -> float:
     return round(sum(samples) / len(samples), precision)
@@ -35,3 +58,151 @@ def aggregate_sum(samples: Sequence[Number], precision: int = 2) -> Union[float,
     if isinstance(samples[-1], int):
         return sum(samples)
     return round(sum(samples), precision)
+
+
+class RingBuffer:
+    """Preallocated buffer of the most recent `capacity` samples of a metric.
+
+    A sample is a number, or a sequence of numbers with one value per device
+    (CPU core, GPU, disk...) that is stored as a row. Samples are kept in a
+    flat `array.array` of `typecode` values, so appending one doesn't allocate
+    Python objects, and once the buffer is full each sample overwrites the
+    oldest one. The statistics of each column are computed with numpy when it
+    is installed.
+
+    Appending a sample of a different width than the previous ones clears the
+    buffer, since the columns of earlier samples no longer line up.
+
+    `percentiles` are the percentiles that `aggregate_columns` publishes in
+    addition to the mean of each column.
+    """
+
+    def __init__(
+        self, capacity: int, typecode: str = "d", percentiles: Sequence[float] = ()
+    ) -> None:
+        self.capacity = max(1, capacity)
+        self.typecode = typecode
+        self.percentiles = tuple(percentiles)
+        self.width = 0
+        self._data = array.array(typecode)
+        self._start = 0
+        self._len = 0
+
+    def append(self, sample: Union[Number, Sequence[Number]]) -> None:
+        row = (sample,) if isinstance(sample, (int, float)) else sample
+        width = len(row)
+        if width != self.width:
+            self.width = width
+            self._data = array.array(self.typecode, [0]) * (self.capacity * width)
+            self._start = self._len = 0
+
+        end = (self._start + self._len) % self.capacity
+        self._data[end * width : (end + 1) * width] = array.array(self.typecode, row)
+        if self._len < self.capacity:
+            self._len += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def clear(self) -> None:
+        self._start = self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __getitem__(self, index: int) -> Union[Number, List[Number]]:
+        """Returns the index-th oldest sample."""
+        if not -self._len <= index < self._len:
+            raise IndexError("RingBuffer index out of range")
+        i = (self._start + index % self._len) % self.capacity
+        if self.width == 1:
+            return self._data[i]
+        return self._data[i * self.width : (i + 1) * self.width].tolist()
+
+    def _columns(self) -> List[array.array]:
+        # Only the first `_len` rows are filled, and which of them is the
+        # oldest doesn't matter to the statistics.
+        size = self._len * self.width
+        return [self._data[i : size : self.width] for i in range(self.width)]
+
+    def _array(self) -> Any:
+        np = _numpy()
+        if np is None or self._len * self.width < _NUMPY_MIN_SIZE:
+            return None
+        values = np.frombuffer(self._data, dtype=self.typecode)
+        return values[: self._len * self.width].reshape(self._len, self.width)
+
+    def mean(self, precision: Optional[int] = None) -> List[float]:
+        values = self._array()
+        if values is not None:
+            return _round(values.mean(axis=0), precision).tolist()
+        return [
+            _round(sum(column) / len(column), precision) for column in self._columns()
+        ]
+
+    def min(self) -> List[Number]:
+        values = self._array()
+        if values is not None:
+            return values.min(axis=0).tolist()
+        return [min(column) for column in self._columns()]
+
+    def max(self) -> List[Number]:
+        values = self._array()
+        if values is not None:
+            return values.max(axis=0).tolist()
+        return [max(column) for column in self._columns()]
+
+    def percentile(self, q: float, precision: Optional[int] = None) -> List[float]:
+        """Returns the q-th percentile of each column, interpolating linearly."""
+        values = self._array()
+        if values is not None:
+            return _round(_numpy().percentile(values, q, axis=0), precision).tolist()
+        percentiles = []
+        for column in self._columns():
+            ordered = sorted(column)
+            rank = (len(ordered) - 1) * q / 100
+            lower = math.floor(rank)
+            upper = min(lower + 1, len(ordered) - 1)
+            fraction = rank - lower
+            value = ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+            percentiles.append(_round(value, precision))
+        return percentiles
+
+    def last(self) -> List[Number]:
+        i = (self._start + self._len - 1) % self.capacity
+        return self._data[i * self.width : (i + 1) * self.width].tolist()
+
+
+def new_buffer(typecode: str = "d") -> RingBuffer:
+    """Returns a buffer that holds the samples of one publishing interval.
+
+    The buffer aggregates the percentiles set with `WANDB_X_STATS_PERCENTILES`.
+    """
+    return RingBuffer(
+        env.get_stats_samples_to_aggregate(),
+        typecode,
+        percentiles=env.get_stats_percentiles(),
+    )
+
+
+def aggregate_columns(
+    samples: RingBuffer, precision: int = 2
+) -> List[Dict[str, float]]:
+    """Aggregate each column of samples.
+
+    Returns the mean of each column keyed by "", and the percentiles of the
+    buffer keyed by ".p<q>", ready to be appended to the name of the column's
+    metric.
+    """
+    columns: List[Dict[str, float]] = [{"": mean} for mean in samples.mean(precision)]
+    for q in samples.percentiles:
+        for column, value in zip(columns, samples.percentile(q, precision)):
+            column[f".p{q:g}"] = value
+    return columns
+
+
+def aggregate_named(name: str, column: Dict[str, float]) -> Dict[str, float]:
+    """Name the statistics of a column returned by `aggregate_columns`."""
+    return {name + suffix: value for suffix, value in column.items()}
@@ -1,18 +1,15 @@
 import threading
-from collections import deque
 from typing import TYPE_CHECKING, List, Optional
 
 try:
     import psutil
 except ImportError:
     psutil = None
-from .aggregators import aggregate_last, aggregate_mean
+from .aggregators import aggregate_columns, aggregate_named, new_buffer
 from .asset_registry import asset_registry
 from .interfaces import Interface, Metric, MetricsMonitor
 
 if TYPE_CHECKING:
-    from typing import Deque
-
     from wandb.sdk.internal.settings_static import SettingsStatic
 
 
@@ -27,7 +24,7 @@ class ProcessCpuPercent:
 
     def __init__(self, pid: int) -> None:
         self.pid = pid
-        self.samples: Deque[float] = deque([])
+        self.samples = new_buffer()
         self.process: Optional[psutil.Process] = None
 
     def sample(self) -> None:
@@ -51,8 +48,8 @@ class ProcessCpuPercent:
         #      mean, median, min, max, etc.
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
-        return {self.name: aggregate}
+        (column,) = aggregate_columns(self.samples)
+        return aggregate_named(self.name, column)
 
 
 class CpuPercent:
@@ -61,7 +58,7 @@ class CpuPercent:
     name = "cpu.{i}.cpu_percent"
 
     def __init__(self, interval: Optional[float] = None) -> None:
-        self.samples: Deque[List[float]] = deque([])
+        self.samples = new_buffer()
         self.interval = interval
 
     def sample(self) -> None:
@@ -73,11 +70,9 @@ class CpuPercent:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        num_cpu = len(self.samples[0])
         cpu_metrics = {}
-        for i in range(num_cpu):
-            aggregate_i = aggregate_mean([sample[i] for sample in self.samples])
-            cpu_metrics[self.name.format(i=i)] = aggregate_i
+        for i, column in enumerate(aggregate_columns(self.samples)):
+            cpu_metrics.update(aggregate_named(self.name.format(i=i), column))
 
         return cpu_metrics
 
@@ -88,7 +83,7 @@ class ProcessCpuThreads:
     name = "proc.cpu.threads"
 
     def __init__(self, pid: int) -> None:
-        self.samples: Deque[int] = deque([])
+        self.samples = new_buffer("q")
         self.pid = pid
         self.process: Optional[psutil.Process] = None
 
@@ -104,7 +99,7 @@ class ProcessCpuThreads:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        return {self.name: aggregate_last(self.samples)}
+        return {self.name: self.samples.last()[0]}
 
 
 @asset_registry.register
@@ -1,5 +1,4 @@
 import threading
-from collections import deque
 from typing import TYPE_CHECKING, List, Optional
 
 try:
@@ -9,13 +8,11 @@ except ImportError:
 
 from wandb.errors.term import termwarn
 
-from .aggregators import aggregate_mean
+from .aggregators import RingBuffer, aggregate_columns, aggregate_named, new_buffer
 from .asset_registry import asset_registry
 from .interfaces import Interface, Metric, MetricsMonitor
 
 if TYPE_CHECKING:
-    from typing import Deque
-
     from wandb.sdk.internal.settings_static import SettingsStatic
 
 
@@ -23,10 +20,10 @@ class DiskUsagePercent:
     """Total system disk usage in percent."""
 
     name = "disk.{path}.usagePercent"
-    samples: "Deque[List[float]]"
+    samples: RingBuffer
 
     def __init__(self, paths: List[str]) -> None:
-        self.samples = deque([])
+        self.samples = new_buffer()
         # check if we have access to the disk paths:
         self.paths: List[str] = []
         for path in paths:
@@ -51,11 +48,11 @@ class DiskUsagePercent:
         if not self.samples:
             return {}
         disk_metrics = {}
-        for i, _path in enumerate(self.paths):
-            aggregate_i = aggregate_mean([sample[i] for sample in self.samples])
+        columns = aggregate_columns(self.samples)
+        for _path, column in zip(self.paths, columns):
             # ugly hack to please the frontend:
             _path = _path.replace("/", "\\")
-            disk_metrics[self.name.format(path=_path)] = aggregate_i
+            disk_metrics.update(aggregate_named(self.name.format(path=_path), column))
 
         return disk_metrics
 
@@ -64,10 +61,10 @@ class DiskUsage:
     """Total system disk usage in GB."""
 
     name = "disk.{path}.usageGB"
-    samples: "Deque[List[float]]"
+    samples: RingBuffer
 
     def __init__(self, paths: List[str]) -> None:
-        self.samples = deque([])
+        self.samples = new_buffer()
         # check if we have access to the disk paths:
         self.paths: List[str] = []
         for path in paths:
@@ -91,11 +88,11 @@ class DiskUsage:
         if not self.samples:
             return {}
         disk_metrics = {}
-        for i, _path in enumerate(self.paths):
-            aggregate_i = aggregate_mean([sample[i] for sample in self.samples])
+        columns = aggregate_columns(self.samples)
+        for _path, column in zip(self.paths, columns):
             # ugly hack to please the frontend:
             _path = _path.replace("/", "\\")
-            disk_metrics[self.name.format(path=_path)] = aggregate_i
+            disk_metrics.update(aggregate_named(self.name.format(path=_path), column))
 
         return disk_metrics
 
@@ -104,10 +101,10 @@ class DiskIn:
     """Total system disk read in MB."""
 
     name = "disk.in"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
     def __init__(self) -> None:
-        self.samples = deque([])
+        self.samples = new_buffer()
         self.read_init: Optional[int] = None
 
     def sample(self) -> None:
@@ -124,18 +121,18 @@ class DiskIn:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
-        return {self.name: aggregate}
+        (column,) = aggregate_columns(self.samples)
+        return aggregate_named(self.name, column)
 
 
 class DiskOut:
     """Total system disk write in MB."""
 
     name = "disk.out"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
     def __init__(self) -> None:
-        self.samples = deque([])
+        self.samples = new_buffer()
         self.write_init: Optional[int] = None
 
     def sample(self) -> None:
@@ -152,8 +149,8 @@ class DiskOut:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
-        return {self.name: aggregate}
+        (column,) = aggregate_columns(self.samples)
+        return aggregate_named(self.name, column)
 
 
 @asset_registry.register
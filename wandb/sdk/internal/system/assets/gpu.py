@@ -1,7 +1,6 @@
 import logging
 import threading
-from collections import deque
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, List, Optional
 
 try:
     import psutil
@@ -10,13 +9,11 @@ except ImportError:
 
 from wandb.vendor.pynvml import pynvml
 
-from .aggregators import aggregate_mean
+from .aggregators import RingBuffer, aggregate_columns, aggregate_named, new_buffer
 from .asset_registry import asset_registry
-from .interfaces import Interface, Metric, MetricsMonitor
+from .interfaces import Interface, Metric, MetricsMonitor, Snapshot
 
 if TYPE_CHECKING:
-    from typing import Deque
-
     from wandb.sdk.internal.settings_static import SettingsStatic
 
     GPUHandle = object
@@ -54,68 +51,56 @@ def gpu_in_use_by_this_process(gpu_handle: "GPUHandle", pid: int) -> bool:
     return len(pids_using_device & our_pids) > 0
 
 
-class GPUMemoryUtilization:
-    """GPU memory utilization in percent for each GPU."""
+def _device_count(snapshot: Snapshot) -> int:
+    return snapshot.get(
+        "device_count",
+        lambda: pynvml.nvmlDeviceGetCount(),  # type: ignore
+    )
 
-    # name = "memory_utilization"
-    name = "gpu.{}.memory"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
 
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
+def _handle(snapshot: Snapshot, i: int) -> "GPUHandle":
+    return snapshot.get(
+        ("handle", i),
+        lambda: pynvml.nvmlDeviceGetHandleByIndex(i),  # type: ignore
+    )
 
-    def sample(self) -> None:
-        memory_utilization_rate = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            memory_utilization_rate.append(
-                pynvml.nvmlDeviceGetUtilizationRates(handle).memory  # type: ignore
-            )
-        self.samples.append(memory_utilization_rate)
 
-    def clear(self) -> None:
-        self.samples.clear()
+def _read(snapshot: Snapshot, name: str, i: int, *args: Any) -> Any:
+    """Call the NVML device query `name` on the i-th GPU, once per tick."""
+    return snapshot.get(
+        (name, i, *args),
+        lambda: getattr(pynvml, name)(_handle(snapshot, i), *args),
+    )
 
-    def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
 
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
+class GPUMetric:
+    """Base class of metrics with one value per GPU.
 
-        return stats
+    The NVML queries behind the metrics of all GPUs go through `snapshot`, so
+    metrics sharing a snapshot query each device once per tick.
+    """
 
+    name: str
+    samples: RingBuffer
 
-class GPUMemoryAllocated:
-    """GPU memory allocated in percent for each GPU."""
+    def __init__(self, pid: int, snapshot: Optional[Snapshot] = None) -> None:
+        self.pid = pid
+        self.samples = new_buffer()
+        self.snapshot = snapshot or Snapshot(cache=False)
 
-    # name = "memory_allocated"
-    name = "gpu.{}.memoryAllocated"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
+    def read(self, i: int) -> float:
+        """Read the metric of the i-th GPU."""
+        raise NotImplementedError
 
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
+    def _in_use(self, i: int) -> bool:
+        return self.snapshot.get(
+            ("in_use", i, self.pid),
+            lambda: gpu_in_use_by_this_process(_handle(self.snapshot, i), self.pid),
+        )
 
     def sample(self) -> None:
-        memory_allocated = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)  # type: ignore
-            memory_allocated.append(memory_info.used / memory_info.total * 100)
-        self.samples.append(memory_allocated)
+        device_count = _device_count(self.snapshot)
+        self.samples.append([self.read(i) for i in range(device_count)])
 
     def clear(self) -> None:
         self.samples.clear()
@@ -124,224 +109,91 @@ class GPUMemoryAllocated:
         if not self.samples:
             return {}
         stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
+        for i, column in enumerate(aggregate_columns(self.samples)):
+            stats.update(aggregate_named(self.name.format(i), column))
 
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
+            if self._in_use(i):
+                stats.update(aggregate_named(self.name.format(f"process.{i}"), column))
 
         return stats
 
 
-class GPUMemoryAllocatedBytes:
-    """GPU memory allocated in bytes for each GPU."""
-
-    # name = "memory_allocated"
-    name = "gpu.{}.memoryAllocatedBytes"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
-
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
+class GPUMemoryUtilization(GPUMetric):
+    """GPU memory utilization in percent for each GPU."""
 
-    def sample(self) -> None:
-        memory_allocated = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)  # type: ignore
-            memory_allocated.append(memory_info.used)
-        self.samples.append(memory_allocated)
+    # name = "memory_utilization"
+    name = "gpu.{}.memory"
 
-    def clear(self) -> None:
-        self.samples.clear()
+    def read(self, i: int) -> float:
+        return _read(self.snapshot, "nvmlDeviceGetUtilizationRates", i).memory
 
-    def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
 
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
+class GPUMemoryAllocated(GPUMetric):
+    """GPU memory allocated in percent for each GPU."""
 
-        return stats
+    # name = "memory_allocated"
+    name = "gpu.{}.memoryAllocated"
 
+    def read(self, i: int) -> float:
+        memory_info = _read(self.snapshot, "nvmlDeviceGetMemoryInfo", i)
+        return memory_info.used / memory_info.total * 100
 
-class GPUUtilization:
-    """GPU utilization in percent for each GPU."""
 
-    # name = "gpu_utilization"
-    name = "gpu.{}.gpu"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
+class GPUMemoryAllocatedBytes(GPUMetric):
+    """GPU memory allocated in bytes for each GPU."""
 
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
+    # name = "memory_allocated"
+    name = "gpu.{}.memoryAllocatedBytes"
 
-    def sample(self) -> None:
-        gpu_utilization_rate = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            gpu_utilization_rate.append(
-                pynvml.nvmlDeviceGetUtilizationRates(handle).gpu  # type: ignore
-            )
-        self.samples.append(gpu_utilization_rate)
+    def read(self, i: int) -> float:
+        return _read(self.snapshot, "nvmlDeviceGetMemoryInfo", i).used
 
-    def clear(self) -> None:
-        self.samples.clear()
 
-    def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
+class GPUUtilization(GPUMetric):
+    """GPU utilization in percent for each GPU."""
 
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
+    # name = "gpu_utilization"
+    name = "gpu.{}.gpu"
 
-        return stats
+    def read(self, i: int) -> float:
+        return _read(self.snapshot, "nvmlDeviceGetUtilizationRates", i).gpu
 
 
-class GPUTemperature:
+class GPUTemperature(GPUMetric):
     """GPU temperature in Celsius for each GPU."""
 
     # name = "gpu_temperature"
     name = "gpu.{}.temp"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
 
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
-
-    def sample(self) -> None:
-        temperature = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            temperature.append(
-                pynvml.nvmlDeviceGetTemperature(  # type: ignore
-                    handle,
-                    pynvml.NVML_TEMPERATURE_GPU,
-                )
-            )
-        self.samples.append(temperature)
-
-    def clear(self) -> None:
-        self.samples.clear()
-
-    def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
-
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
-
-        return stats
+    def read(self, i: int) -> float:
+        return _read(
+            self.snapshot,
+            "nvmlDeviceGetTemperature",
+            i,
+            pynvml.NVML_TEMPERATURE_GPU,
+        )
 
 
-class GPUPowerUsageWatts:
+class GPUPowerUsageWatts(GPUMetric):
     """GPU power usage in Watts for each GPU."""
 
     name = "gpu.{}.powerWatts"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
-
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
 
-    def sample(self) -> None:
-        power_usage = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            power_watts = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000  # type: ignore
-            power_usage.append(power_watts)
-        self.samples.append(power_usage)
-
-    def clear(self) -> None:
-        self.samples.clear()
-
-    def aggregate(self) -> dict:
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
+    def read(self, i: int) -> float:
+        return _read(self.snapshot, "nvmlDeviceGetPowerUsage", i) / 1000
 
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
 
-        return stats
-
-
-class GPUPowerUsagePercent:
+class GPUPowerUsagePercent(GPUMetric):
     """GPU power usage in percent for each GPU."""
 
     name = "gpu.{}.powerPercent"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
 
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
-
-    def sample(self) -> None:
-        power_usage = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            power_watts = pynvml.nvmlDeviceGetPowerUsage(handle)  # type: ignore
-            power_capacity_watts = pynvml.nvmlDeviceGetEnforcedPowerLimit(handle)  # type: ignore
-            power_usage.append((power_watts / power_capacity_watts) * 100)
-        self.samples.append(power_usage)
-
-    def clear(self) -> None:
-        self.samples.clear()
-
-    def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
-
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
-
-        return stats
+    def read(self, i: int) -> float:
+        power_watts = _read(self.snapshot, "nvmlDeviceGetPowerUsage", i)
+        power_capacity_watts = _read(
+            self.snapshot, "nvmlDeviceGetEnforcedPowerLimit", i
+        )
+        return (power_watts / power_capacity_watts) * 100
 
 
 @asset_registry.register
@@ -353,14 +205,15 @@ class GPU:
         shutdown_event: threading.Event,
     ) -> None:
         self.name = self.__class__.__name__.lower()
+        snapshot = Snapshot()
         self.metrics: List[Metric] = [
-            GPUMemoryAllocated(settings.x_stats_pid),
-            GPUMemoryAllocatedBytes(settings.x_stats_pid),
-            GPUMemoryUtilization(settings.x_stats_pid),
-            GPUUtilization(settings.x_stats_pid),
-            GPUTemperature(settings.x_stats_pid),
-            GPUPowerUsageWatts(settings.x_stats_pid),
-            GPUPowerUsagePercent(settings.x_stats_pid),
+            GPUMemoryAllocated(settings.x_stats_pid, snapshot),
+            GPUMemoryAllocatedBytes(settings.x_stats_pid, snapshot),
+            GPUMemoryUtilization(settings.x_stats_pid, snapshot),
+            GPUUtilization(settings.x_stats_pid, snapshot),
+            GPUTemperature(settings.x_stats_pid, snapshot),
+            GPUPowerUsageWatts(settings.x_stats_pid, snapshot),
+            GPUPowerUsagePercent(settings.x_stats_pid, snapshot),
         ]
         self.metrics_monitor = MetricsMonitor(
             self.name,
@@ -368,6 +221,7 @@ class GPU:
             interface,
             settings,
             shutdown_event,
+            snapshot,
         )
 
     @classmethod
@@ -1,13 +1,19 @@
 import datetime
 import logging
+import math
 import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
+    Hashable,
     List,
     Optional,
     Protocol,
     TypeVar,
+    Union,
     runtime_checkable,
 )
 
@@ -20,7 +26,12 @@ if TYPE_CHECKING:
 
 import psutil
 
+from wandb import env
+
+from .aggregators import RingBuffer
+
 TimeStamp = TypeVar("TimeStamp", bound=datetime.datetime)
+T = TypeVar("T")
 
 
 logger = logging.getLogger(__name__)
@@ -31,7 +42,7 @@ class Metric(Protocol):
 
     name: str
     # samples: Sequence[Tuple[TimeStamp, Sample]]
-    samples: "Deque[Any]"
+    samples: "Union[Deque[Any], RingBuffer]"
 
     def sample(self) -> None:
         """Sample the metric."""
@@ -59,6 +70,15 @@ class SetupTeardown(Protocol):
         ...  # pragma: no cover
 
 
+@runtime_checkable
+class Prefetch(Protocol):
+    """Protocol for metrics that can start reading a sample ahead of time."""
+
+    def prefetch(self) -> None:
+        """Start reading the next sample in the background."""
+        ...  # pragma: no cover
+
+
 @runtime_checkable
 class Asset(Protocol):
     """Base protocol encapsulate everything relating to an "Asset".
@@ -100,8 +120,41 @@ class Interface(Protocol):
     def publish_files(self, files_dict: "FilesDict") -> None: ...  # pragma: no cover
 
 
+class Snapshot:
+    """Readings of the sources of an asset's metrics, shared for one tick.
+
+    Metrics derived from the same source, such as the utilization and memory
+    of each GPU, get its readings through the snapshot so that the source is
+    queried once per tick rather than once per metric. The `MetricsMonitor`
+    that samples the metrics clears the snapshot at the start of each tick.
+
+    A snapshot created with `cache=False` reads the source on every call.
+    """
+
+    def __init__(self, cache: bool = True) -> None:
+        self._cache = cache
+        self._readings: Dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable, read: Callable[[], T]) -> T:
+        """Return the reading stored under `key`, calling `read` if there is none."""
+        if not self._cache:
+            return read()
+        try:
+            return self._readings[key]
+        except KeyError:
+            value = self._readings[key] = read()
+            return value
+
+    def clear(self) -> None:
+        self._readings.clear()
+
+
 class MetricsMonitor:
-    """Takes care of collecting, sampling, serializing, and publishing a set of metrics."""
+    """Takes care of collecting, sampling, serializing, and publishing a set of metrics.
+
+    The metrics are sampled by `scheduler` if it is set before the monitor is
+    started, and by a thread of the monitor's own otherwise.
+    """
 
     def __init__(
         self,
@@ -110,11 +163,15 @@ class MetricsMonitor:
         interface: Interface,
         settings: "SettingsStatic",
         shutdown_event: threading.Event,
+        snapshot: Optional[Snapshot] = None,
     ) -> None:
         self.metrics = metrics
         self.asset_name = asset_name
+        self.snapshot = snapshot
+        self.scheduler: Optional[MetricsScheduler] = None
         self._interface = interface
         self._process: Optional[threading.Thread] = None
+        self._scheduled = False
         self._shutdown_event: threading.Event = shutdown_event
 
         self.sampling_interval: float = float(
@@ -123,21 +180,49 @@ class MetricsMonitor:
                 settings.x_stats_sampling_interval,
             )
         )  # seconds
-        self.samples_to_aggregate = 1
+        self.samples_to_aggregate = env.get_stats_samples_to_aggregate()
+        self._num_samples = 0
+
+    def sample(self) -> bool:
+        """Take one sample of each metric.
+
+        Returns False if the monitored process has exited.
+        """
+        if self.snapshot is not None:
+            self.snapshot.clear()
+        for metric in self.metrics:
+            try:
+                metric.sample()
+            except psutil.NoSuchProcess:
+                logger.info(f"Process {metric.name} has exited.")
+                self._shutdown_event.set()
+                return False
+            except Exception as e:
+                logger.error(f"Failed to sample metric: {e}")
+        return True
+
+    def prefetch(self) -> None:
+        """Let the metrics that support it start reading their next sample."""
+        for metric in self.metrics:
+            if isinstance(metric, Prefetch):
+                try:
+                    metric.prefetch()
+                except Exception as e:
+                    logger.error(f"Failed to prefetch metric: {e}")
+
+    def tick(self) -> None:
+        """Sample the metrics, publishing them every `samples_to_aggregate` ticks."""
+        if not self.sample():
+            return
+        self._num_samples += 1
+        if self._num_samples >= self.samples_to_aggregate:
+            self.publish()
 
     def monitor(self) -> None:
         """Poll the Asset metrics."""
         while not self._shutdown_event.is_set():
             for _ in range(self.samples_to_aggregate):
-                for metric in self.metrics:
-                    try:
-                        metric.sample()
-                    except psutil.NoSuchProcess:
-                        logger.info(f"Process {metric.name} has exited.")
-                        self._shutdown_event.set()
-                        break
-                    except Exception as e:
-                        logger.error(f"Failed to sample metric: {e}")
+                self.sample()
                 self._shutdown_event.wait(self.sampling_interval)
                 if self._shutdown_event.is_set():
                     break
@@ -165,11 +250,16 @@ class MetricsMonitor:
                 self._interface.publish_stats(aggregated_metrics)
             for metric in self.metrics:
                 metric.clear()
+            self._num_samples = 0
         except Exception as e:
             logger.error(f"Failed to publish metrics: {e}")
 
     def start(self) -> None:
-        if (self._process is not None) or self._shutdown_event.is_set():
+        if (
+            self._process is not None
+            or self._scheduled
+            or self._shutdown_event.is_set()
+        ):
             return None
 
         thread_name = f"{self.asset_name[:15]}"  # thread names are limited to 15 chars
@@ -177,6 +267,11 @@ class MetricsMonitor:
             for metric in self.metrics:
                 if isinstance(metric, SetupTeardown):
                     metric.setup()
+            if self.scheduler is not None:
+                self.scheduler.add(self)
+                self._scheduled = True
+                logger.info(f"Scheduled {thread_name} monitoring")
+                return None
             self._process = threading.Thread(
                 target=self.monitor,
                 daemon=True,
@@ -189,13 +284,14 @@ class MetricsMonitor:
             self._process = None
 
     def finish(self) -> None:
-        if self._process is None:
+        if self._process is None and not self._scheduled:
             return None
 
         thread_name = f"{self.asset_name[:15]}"
         try:
-            self._process.join()
-            logger.info(f"Joined {thread_name} monitor")
+            if self._process is not None:
+                self._process.join()
+                logger.info(f"Joined {thread_name} monitor")
             for metric in self.metrics:
                 if isinstance(metric, SetupTeardown):
                     metric.teardown()
@@ -203,3 +299,71 @@ class MetricsMonitor:
             logger.warning(f"Failed to finish {thread_name} monitoring: {e}")
         finally:
             self._process = None
+            self._scheduled = False
+
+
+class MetricsScheduler:
+    """Samples the metrics of several assets from a single thread.
+
+    Every `sampling_interval` seconds, each registered monitor samples all of
+    its metrics in the same tick. Ticks follow a fixed schedule, so the time
+    spent sampling doesn't add up to drift, and ticks that are missed because
+    sampling took too long are skipped rather than run back to back.
+    """
+
+    def __init__(
+        self, sampling_interval: float, shutdown_event: threading.Event
+    ) -> None:
+        self.sampling_interval = sampling_interval
+        self._shutdown_event = shutdown_event
+        self._monitors: List[MetricsMonitor] = []
+        self._lock = threading.Lock()
+        self._process: Optional[threading.Thread] = None
+
+    def add(self, monitor: MetricsMonitor) -> None:
+        with self._lock:
+            self._monitors.append(monitor)
+
+    def tick(self) -> None:
+        """Sample the metrics of every monitor once."""
+        with self._lock:
+            monitors = list(self._monitors)
+        # slow sources, such as OpenMetrics endpoints, are read concurrently
+        for monitor in monitors:
+            monitor.prefetch()
+        for monitor in monitors:
+            monitor.tick()
+
+    def run(self) -> None:
+        next_tick = time.monotonic()
+        while not self._shutdown_event.is_set():
+            self.tick()
+            next_tick += self.sampling_interval
+            now = time.monotonic()
+            if next_tick < now:
+                missed = math.ceil((now - next_tick) / self.sampling_interval)
+                next_tick += missed * self.sampling_interval
+            self._shutdown_event.wait(next_tick - now)
+
+        # Publish samples that haven't reached `samples_to_aggregate`.
+        with self._lock:
+            monitors = list(self._monitors)
+        for monitor in monitors:
+            monitor.publish()
+
+    def start(self) -> None:
+        if self._process is not None:
+            return None
+        self._process = threading.Thread(
+            target=self.run, daemon=True, name="MetricsSampler"
+        )
+        self._process.start()
+
+    def join(self) -> None:
+        if self._process is None:
+            return None
+        self._process.join()
+        self._process = None
+        # The monitors add themselves again if they are restarted.
+        with self._lock:
+            self._monitors.clear()
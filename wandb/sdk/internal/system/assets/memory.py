@@ -1,5 +1,4 @@
 import threading
-from collections import deque
 from typing import TYPE_CHECKING, List, Optional
 
 try:
@@ -7,13 +6,11 @@ try:
 except ImportError:
     psutil = None
 
-from .aggregators import aggregate_mean
+from .aggregators import RingBuffer, aggregate_columns, aggregate_named, new_buffer
 from .asset_registry import asset_registry
-from .interfaces import Interface, Metric, MetricsMonitor
+from .interfaces import Interface, Metric, MetricsMonitor, Snapshot
 
 if TYPE_CHECKING:
-    from typing import Deque
-
     from wandb.sdk.internal.settings_static import SettingsStatic
 
 
@@ -25,12 +22,12 @@ class ProcessMemoryRSS:
 
     # name = "memory_rss"
     name = "proc.memory.rssMB"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
     def __init__(self, pid: int) -> None:
         self.pid = pid
         self.process: Optional[psutil.Process] = None
-        self.samples = deque([])
+        self.samples = new_buffer()
 
     def sample(self) -> None:
         if self.process is None:
@@ -44,8 +41,8 @@ class ProcessMemoryRSS:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
-        return {self.name: aggregate}
+        (column,) = aggregate_columns(self.samples)
+        return aggregate_named(self.name, column)
 
 
 class ProcessMemoryPercent:
@@ -53,12 +50,12 @@ class ProcessMemoryPercent:
 
     # name = "process_memory_percent"
     name = "proc.memory.percent"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
     def __init__(self, pid: int) -> None:
         self.pid = pid
         self.process: Optional[psutil.Process] = None
-        self.samples = deque([])
+        self.samples = new_buffer()
 
     def sample(self) -> None:
         if self.process is None:
@@ -72,8 +69,8 @@ class ProcessMemoryPercent:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
-        return {self.name: aggregate}
+        (column,) = aggregate_columns(self.samples)
+        return aggregate_named(self.name, column)
 
 
 class MemoryPercent:
@@ -81,13 +78,16 @@ class MemoryPercent:
 
     # name = "memory_percent"
     name = "memory"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
-    def __init__(self) -> None:
-        self.samples = deque([])
+    def __init__(self, snapshot: Optional[Snapshot] = None) -> None:
+        self.samples = new_buffer()
+        self.snapshot = snapshot or Snapshot(cache=False)
 
     def sample(self) -> None:
-        self.samples.append(psutil.virtual_memory().percent)
+        self.samples.append(
+            self.snapshot.get("virtual_memory", psutil.virtual_memory).percent
+        )
 
     def clear(self) -> None:
         self.samples.clear()
@@ -95,8 +95,8 @@ class MemoryPercent:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
-        return {self.name: aggregate}
+        (column,) = aggregate_columns(self.samples)
+        return aggregate_named(self.name, column)
 
 
 class MemoryAvailable:
@@ -104,13 +104,15 @@ class MemoryAvailable:
 
     # name = "memory_available"
     name = "proc.memory.availableMB"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
-    def __init__(self) -> None:
-        self.samples = deque([])
+    def __init__(self, snapshot: Optional[Snapshot] = None) -> None:
+        self.samples = new_buffer()
+        self.snapshot = snapshot or Snapshot(cache=False)
 
     def sample(self) -> None:
-        self.samples.append(psutil.virtual_memory().available / 1024 / 1024)
+        virtual_memory = self.snapshot.get("virtual_memory", psutil.virtual_memory)
+        self.samples.append(virtual_memory.available / 1024 / 1024)
 
     def clear(self) -> None:
         self.samples.clear()
@@ -118,8 +120,8 @@ class MemoryAvailable:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
-        return {self.name: aggregate}
+        (column,) = aggregate_columns(self.samples)
+        return aggregate_named(self.name, column)
 
 
 @asset_registry.register
@@ -131,9 +133,10 @@ class Memory:
         shutdown_event: threading.Event,
     ) -> None:
         self.name = self.__class__.__name__.lower()
+        snapshot = Snapshot()
         self.metrics: List[Metric] = [
-            MemoryAvailable(),
-            MemoryPercent(),
+            MemoryAvailable(snapshot),
+            MemoryPercent(snapshot),
             ProcessMemoryRSS(settings.x_stats_pid),
             ProcessMemoryPercent(settings.x_stats_pid),
         ]
@@ -143,6 +146,7 @@ class Memory:
             interface,
             settings,
             shutdown_event,
+            snapshot,
         )
 
     def start(self) -> None:
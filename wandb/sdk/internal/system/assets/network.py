@@ -1,19 +1,16 @@
 import threading
-from collections import deque
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 try:
     import psutil
 except ImportError:
     psutil = None
 
-from .aggregators import aggregate_mean
+from .aggregators import RingBuffer, aggregate_columns, aggregate_named, new_buffer
 from .asset_registry import asset_registry
-from .interfaces import Interface, Metric, MetricsMonitor
+from .interfaces import Interface, Metric, MetricsMonitor, Snapshot
 
 if TYPE_CHECKING:
-    from typing import Deque
-
     from wandb.sdk.internal.settings_static import SettingsStatic
 
 
@@ -21,14 +18,16 @@ class NetworkSent:
     """Network bytes sent."""
 
     name = "network.sent"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
-    def __init__(self) -> None:
-        self.samples = deque([])
+    def __init__(self, snapshot: Optional[Snapshot] = None) -> None:
+        self.samples = new_buffer()
+        self.snapshot = snapshot or Snapshot(cache=False)
         self.sent_init = psutil.net_io_counters().bytes_sent
 
     def sample(self) -> None:
-        self.samples.append(psutil.net_io_counters().bytes_sent - self.sent_init)
+        net_io_counters = self.snapshot.get("net_io_counters", psutil.net_io_counters)
+        self.samples.append(net_io_counters.bytes_sent - self.sent_init)
 
     def clear(self) -> None:
         self.samples.clear()
@@ -36,24 +35,26 @@ class NetworkSent:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
+        (column,) = aggregate_columns(self.samples)
         # todo: this is an adapter for the legacy metrics system
         # return {"network": {self.name: aggregate}}
-        return {self.name: aggregate}
+        return aggregate_named(self.name, column)
 
 
 class NetworkRecv:
     """Network bytes received."""
 
     name = "network.recv"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
-    def __init__(self) -> None:
-        self.samples = deque([])
+    def __init__(self, snapshot: Optional[Snapshot] = None) -> None:
+        self.samples = new_buffer()
+        self.snapshot = snapshot or Snapshot(cache=False)
         self.recv_init = psutil.net_io_counters().bytes_recv
 
     def sample(self) -> None:
-        self.samples.append(psutil.net_io_counters().bytes_recv - self.recv_init)
+        net_io_counters = self.snapshot.get("net_io_counters", psutil.net_io_counters)
+        self.samples.append(net_io_counters.bytes_recv - self.recv_init)
 
     def clear(self) -> None:
         self.samples.clear()
@@ -61,11 +62,11 @@ class NetworkRecv:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
+        (column,) = aggregate_columns(self.samples)
         # todo: this is an adapter for the legacy metrics system
         # return {"network": {self.name: aggregate}}
 
-        return {self.name: aggregate}
+        return aggregate_named(self.name, column)
 
 
 @asset_registry.register
@@ -77,9 +78,10 @@ class Network:
         shutdown_event: threading.Event,
     ) -> None:
         self.name = self.__class__.__name__.lower()
+        snapshot = Snapshot()
         self.metrics: List[Metric] = [
-            NetworkSent(),
-            NetworkRecv(),
+            NetworkSent(snapshot),
+            NetworkRecv(snapshot),
         ]
         self.metrics_monitor = MetricsMonitor(
             self.name,
@@ -87,6 +89,7 @@ class Network:
             interface,
             settings,
             shutdown_event,
+            snapshot,
         )
 
     def start(self) -> None:
@@ -1,23 +1,36 @@
+import concurrent.futures
 import logging
 import re
 import threading
+import time
 from collections import defaultdict, deque
 from functools import lru_cache
 from types import ModuleType
-from typing import TYPE_CHECKING, Dict, Final, List, Mapping, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Final,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import requests
 import requests.adapters
 import urllib3
 
 import wandb
-from wandb.sdk.lib import hashutil, telemetry
+from wandb import env
+from wandb.sdk.lib import telemetry
 
 from .aggregators import aggregate_last, aggregate_mean
 from .interfaces import Interface, Metric, MetricsMonitor
 
 if TYPE_CHECKING:
-    from typing import Deque, Optional
+    from typing import Deque
 
     from wandb.sdk.internal.settings_static import SettingsStatic
 
@@ -33,6 +46,11 @@ _REQUEST_POOL_CONNECTIONS = 4
 _REQUEST_POOL_MAXSIZE = 4
 _REQUEST_TIMEOUT = 3
 
+_Labels = Tuple[Tuple[str, str], ...]
+_CompiledFilters = Tuple[
+    Tuple["re.Pattern[str]", Tuple[Tuple[str, "re.Pattern[str]"], ...]], ...
+]
+
 
 logger = logging.getLogger(__name__)
 
@@ -70,39 +88,38 @@ def _tuple_to_nested_dict(
     return {k: dict(v) for k, *v in nested_tuple}
 
 
-@lru_cache(maxsize=128)
-def _should_capture_metric(
-    endpoint_name: str,
-    metric_name: str,
-    metric_labels: Tuple[str, ...],
+@lru_cache(maxsize=16)
+def _compile_filters(
     filters: Tuple[Tuple[str, Tuple[str, str]], ...],
-) -> bool:
-    # we use tuples to make the function arguments hashable => usable with lru_cache
-    should_capture = False
+) -> _CompiledFilters:
+    return tuple(
+        (
+            re.compile(metric_name_regex),
+            tuple(
+                (label, re.compile(label_filter))
+                for label, label_filter in label_filters.items()
+            ),
+        )
+        for metric_name_regex, label_filters in _tuple_to_nested_dict(filters).items()
+    )
 
-    if not filters:
-        return should_capture
 
-    # self.filters keys are regexes, check the name against them
+def _matches_filters(
+    filters: _CompiledFilters, full_name: str, labels: Mapping[str, str]
+) -> bool:
+    # the filter keys are regexes, check the name against them
     # and for the first match, check the labels against the label filters.
     # assume that if at least one label filter doesn't match, the metric
     # should not be captured.
     # it's up to the user to make sure that the filters are not conflicting etc.
-    metric_labels_dict = {t[0]: t[1] for t in metric_labels}
-    filters_dict = _tuple_to_nested_dict(filters)
-    for metric_name_regex, label_filters in filters_dict.items():
-        if not re.match(metric_name_regex, f"{endpoint_name}.{metric_name}"):
+    for metric_name_regex, label_filters in filters:
+        if not metric_name_regex.match(full_name):
             continue
-
-        should_capture = True
-
-        for label, label_filter in label_filters.items():
-            if not re.match(label_filter, metric_labels_dict.get(label, "")):
-                should_capture = False
-                break
-        break
-
-    return should_capture
+        return all(
+            label_filter.match(labels.get(label, ""))
+            for label, label_filter in label_filters
+        )
+    return False
 
 
 class OpenMetricsMetric:
@@ -129,61 +146,103 @@ class OpenMetricsMetric:
             else {k: {} for k in filters or [".*"]}
         )
         self.filters_tuple = _nested_dict_to_tuple(self.filters) if self.filters else ()
+        self._filters = _compile_filters(self.filters_tuple)
+        # seconds to wait for each scrape of the endpoint
+        self.timeout = env.get_stats_open_metrics_timeout(_REQUEST_TIMEOUT)
 
         self._session: Optional[requests.Session] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._scrape: Optional[concurrent.futures.Future] = None
+        self._scrape_deadline = 0.0
         self.samples: Deque[dict] = deque([])
-        # {"<metric name>": {"<labels hash>": <index>}}
-        self.label_map: Dict[str, Dict[str, int]] = defaultdict(dict)
-        # {"<labels hash>": <labels>}
-        self.label_hashes: Dict[str, dict] = {}
+        # {"<metric name>": {<labels>: <index>}}
+        self.label_map: Dict[str, Dict[_Labels, int]] = defaultdict(dict)
+        # {("<metric name>", <labels>): "<metric name>.<index>", or None if filtered out}
+        self._series_keys: Dict[Tuple[str, _Labels], Optional[str]] = {}
 
     def setup(self) -> None:
         if self._session is not None:
             return
 
         self._session = _setup_requests_session()
+        # a thread of its own, so that a slow endpoint doesn't hold up others
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"OpenMetrics-{self.name}"
+        )
 
     def teardown(self) -> None:
         if self._session is None:
             return
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._scrape = None
         self._session.close()
         self._session = None
 
-    def parse_open_metrics_endpoint(self) -> Dict[str, Union[str, int, float]]:
-        assert prometheus_client_parser is not None
+    def _get(self) -> str:
         assert self._session is not None
 
-        response = self._session.get(self.url, timeout=_REQUEST_TIMEOUT)
+        response = self._session.get(self.url, timeout=self.timeout)
         response.raise_for_status()
+        return response.text
+
+    def prefetch(self) -> None:
+        """Start scraping the endpoint in the background."""
+        if self._executor is None or self._scrape is not None:
+            return
+
+        self._scrape_deadline = time.monotonic() + self.timeout
+        self._scrape = self._executor.submit(self._get)
+
+    def _scraped_text(self) -> str:
+        self.prefetch()
+        scrape = self._scrape
+        if scrape is None:
+            return self._get()
+
+        try:
+            return scrape.result(
+                timeout=max(0.0, self._scrape_deadline - time.monotonic())
+            )
+        except concurrent.futures.TimeoutError:
+            # the scrape stays pending, so that a hanging endpoint is scraped
+            # once at a time instead of once per sample.
+            raise TimeoutError(
+                f"Scraping {self.url} took longer than {self.timeout} seconds"
+            ) from None
+        finally:
+            if scrape.done():
+                self._scrape = None
+
+    def _series_key(self, name: str, labels: _Labels) -> Optional[str]:
+        if not _matches_filters(self._filters, f"{self.name}.{name}", dict(labels)):
+            return None
+
+        indices = self.label_map[name]
+        index = indices.setdefault(labels, len(indices))
+        return f"{name}.{index}"
+
+    def parse_open_metrics_endpoint(self) -> Dict[str, Union[str, int, float]]:
+        assert prometheus_client_parser is not None
 
-        text = response.text
+        text = self._scraped_text()
         measurement = {}
+        series_keys = self._series_keys
         for family in prometheus_client_parser.text_string_to_metric_families(text):
             if family.type not in ("counter", "gauge"):
                 # todo: add support for other metric types?
                 # todo: log warning about that?
                 continue
             for sample in family.samples:
-                name, labels, value = sample.name, sample.labels, sample.value
-
-                if not _should_capture_metric(
-                    self.name,
-                    name,
-                    tuple(labels.items()),
-                    self.filters_tuple,
-                ):
-                    continue
-
-                # md5 hash of the labels
-                label_hash = hashutil._md5(str(labels).encode("utf-8")).hexdigest()
-                if label_hash not in self.label_map[name]:
-                    # store the index of the label hash in the label map
-                    self.label_map[name][label_hash] = len(self.label_map[name])
-                    # store the labels themselves
-                    self.label_hashes[label_hash] = labels
-                index = self.label_map[name][label_hash]
-                measurement[f"{name}.{index}"] = value
+                series = (sample.name, tuple(sample.labels.items()))
+                try:
+                    key = series_keys[series]
+                except KeyError:
+                    key = series_keys[series] = self._series_key(*series)
+                if key is not None:
+                    measurement[key] = sample.value
 
         return measurement
 
@@ -289,5 +348,4 @@ class OpenMetrics:
         self.metrics_monitor.finish()
 
     def probe(self) -> dict:
-        # todo: also return self.label_hashes
         return {self.name: self.url}
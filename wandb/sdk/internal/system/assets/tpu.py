@@ -1,16 +1,13 @@
 import logging
 import os
 import threading
-from collections import deque
 from typing import TYPE_CHECKING, List, Optional
 
-from .aggregators import aggregate_mean
+from .aggregators import RingBuffer, aggregate_columns, aggregate_named, new_buffer
 from .asset_registry import asset_registry
 from .interfaces import Interface, Metric, MetricsMonitor
 
 if TYPE_CHECKING:
-    from typing import Deque
-
     from wandb.sdk.internal.settings_static import SettingsStatic
 
 logger = logging.getLogger(__name__)
@@ -20,14 +17,14 @@ class TPUUtilization:
     """Google Cloud TPU utilization in percent."""
 
     name = "tpu"
-    samples: "Deque[float]"
+    samples: RingBuffer
 
     def __init__(
         self,
         service_addr: str,
         duration_ms: int = 100,
     ) -> None:
-        self.samples = deque([])
+        self.samples = new_buffer()
 
         self.duration_ms = duration_ms
         self.service_addr = service_addr
@@ -58,8 +55,8 @@ class TPUUtilization:
     def aggregate(self) -> dict:
         if not self.samples:
             return {}
-        aggregate = aggregate_mean(self.samples)
-        return {self.name: aggregate}
+        (column,) = aggregate_columns(self.samples)
+        return aggregate_named(self.name, column)
 
 
 @asset_registry.register
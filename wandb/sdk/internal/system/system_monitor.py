@@ -5,8 +5,10 @@ import threading
 from collections import defaultdict, deque
 from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
 
+from wandb import env
+
 from .assets.asset_registry import asset_registry
-from .assets.interfaces import Asset, Interface
+from .assets.interfaces import Asset, Interface, MetricsScheduler
 from .assets.open_metrics import OpenMetrics
 from .system_info import SystemInfo
 
@@ -62,7 +64,7 @@ class SystemMonitor:
         sampling_interval: float = float(
             max(0.1, self.settings.x_stats_sampling_interval)
         )  # seconds
-        samples_to_aggregate: int = 1
+        samples_to_aggregate: int = env.get_stats_samples_to_aggregate()
         self.publishing_interval: float = sampling_interval * samples_to_aggregate
         self.join_assets: bool = False
 
@@ -77,6 +79,11 @@ class SystemMonitor:
         # OpenMetrics/Prometheus-compatible endpoints
         self.assets.extend(self._get_open_metrics_assets())
 
+        # sample the metrics of all assets from a single thread
+        self.scheduler = MetricsScheduler(sampling_interval, self._shutdown_event)
+        for asset in self.assets:
+            asset.metrics_monitor.scheduler = self.scheduler
+
         # static system info, both hardware and software
         self.system_info: SystemInfo = SystemInfo(
             settings=self.settings, interface=interface
@@ -148,7 +155,7 @@ class SystemMonitor:
             self.backend_interface._publish_telemetry(telemetry_record)
 
     def _start(self) -> None:
-        logger.info("Starting system asset monitoring threads")
+        logger.info("Starting system asset monitoring")
         for asset in self.assets:
             asset.start()
 
@@ -185,6 +192,7 @@ class SystemMonitor:
         if self._process is not None:
             return None
         logger.info("Starting system monitor")
+        self.scheduler.start()
         self._process = threading.Thread(
             target=self._start, daemon=True, name="SystemMonitor"
         )
@@ -195,6 +203,7 @@ class SystemMonitor:
             return None
         logger.info("Stopping system monitor")
         self._shutdown_event.set()
+        self.scheduler.join()
         for asset in self.assets:
             asset.finish()
         try:
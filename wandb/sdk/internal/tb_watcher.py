@@ -5,10 +5,11 @@ import logging
 import os
 import queue
 import socket
+import struct
 import sys
 import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
 
 import wandb
 from wandb import util
@@ -17,13 +18,17 @@ from wandb.sdk.interface.interface import GlobStr
 from wandb.sdk.lib import filesystem
 
 from . import run as internal_run
+from . import tfrecord
 
 if TYPE_CHECKING:
     from queue import PriorityQueue
 
     from tensorboard.backend.event_processing.event_file_loader import EventFileLoader
     from tensorboard.compat.proto.event_pb2 import ProtoEvent
+    from tensorboard.compat.proto.summary_pb2 import Summary
 
+    import wandb.vendor.watchdog_0_9_0.observers as wd_observers
+    import wandb.vendor.watchdog_0_9_0.watchdog.events as wd_events
     from wandb.proto.wandb_internal_pb2 import RunRecord
     from wandb.sdk.interface.interface import FilesDict
 
@@ -31,11 +36,20 @@ if TYPE_CHECKING:
     from .settings_static import SettingsStatic
 
     HistoryDict = Dict[str, Any]
+else:
+    wd_observers = util.vendor_import("wandb_watchdog.observers")
+    wd_events = util.vendor_import("wandb_watchdog.events")
 
 # Give some time for tensorboard data to be flushed
 SHUTDOWN_DELAY = 5
 ERROR_DELAY = 5
+# How often to check for new events when we aren't notified of file changes,
+# and when we are, in case a notification is missed (e.g. on network drives).
+POLL_INTERVAL = 1
+NOTIFIED_POLL_INTERVAL = 5
 REMOTE_FILE_TOKEN = "://"
+# tensorflow's DataType.DT_FLOAT
+_DT_FLOAT = 1
 logger = logging.getLogger(__name__)
 
 
@@ -58,6 +72,56 @@ def _link_and_save_file(
     interface.publish_files(dict(files=[(GlobStr(glob.escape(file_name)), "live")]))
 
 
+def _save_tfevents_file(
+    path: str,
+    namespace: Optional[str],
+    interface: "InterfaceQueue",
+    settings: "SettingsStatic",
+) -> None:
+    if REMOTE_FILE_TOKEN in path:
+        logger.warning("Not persisting remote tfevent file: %s", path)
+        return
+    # TODO: save plugins?
+    logdir = os.path.dirname(path)
+    parts = list(os.path.split(logdir))
+    if namespace and parts[-1] == namespace:
+        parts.pop()
+        logdir = os.path.join(*parts)
+    _link_and_save_file(
+        path=path, base_path=logdir, interface=interface, settings=settings
+    )
+
+
+def _scalars_to_simple_values(summary: "Summary") -> bool:
+    """Store the scalar tensors of a summary as simple values.
+
+    Returns False and leaves the summary unchanged if it has values other than
+    scalars, which need tensorboard's conversions instead.
+    """
+    scalars = []
+    for value in summary.value:
+        kind = value.WhichOneof("value")
+        if kind == "simple_value":
+            continue
+        if kind != "tensor" or value.metadata.plugin_data.plugin_name not in (
+            "scalars",
+            "",
+        ):
+            return False
+        tensor = value.tensor
+        if tensor.dtype != _DT_FLOAT or tensor.tensor_shape.dim:
+            return False
+        if len(tensor.float_val) == 1:
+            scalars.append((value, tensor.float_val[0]))
+        elif len(tensor.tensor_content) == 4:
+            scalars.append((value, struct.unpack("<f", tensor.tensor_content)[0]))
+        else:
+            return False
+    for value, number in scalars:
+        value.simple_value = number
+    return True
+
+
 def is_tfevents_file_created_by(
     path: str, hostname: Optional[str], start_time: Optional[float]
 ) -> bool:
@@ -183,6 +247,82 @@ class TBWatcher:
             self._consumer.finish()
 
 
+class TFEventsTailer:
+    """Reads the events of the tfevents files in a local directory.
+
+    A stand-in for tensorboard's `DirectoryWatcher` that reads the files
+    itself. Each call to `Load()` yields the events written to any of the files
+    since the previous call. Events with only scalar values are yielded as is,
+    with scalar tensors stored as simple values; other events go through the
+    same compatibility conversions as in tensorboard's `EventFileLoader`.
+    """
+
+    def __init__(
+        self,
+        logdir: str,
+        path_filter: Callable[[str], bool],
+        on_new_file: Callable[[str], None],
+    ) -> None:
+        from tensorboard import data_compat, dataclass_compat
+        from tensorboard.compat.proto import event_pb2
+
+        self._data_compat = data_compat
+        self._dataclass_compat = dataclass_compat
+        self._event_pb2 = event_pb2
+        self._logdir = logdir
+        self._path_filter = path_filter
+        self._on_new_file = on_new_file
+        # None for paths that aren't, or are no longer, read.
+        self._readers: Dict[str, Optional[tfrecord.TFRecordReader]] = {}
+        self._initial_metadata: Dict[str, Dict[str, Any]] = {}
+        self.last_modified = 0.0
+        # Whether the last Load() found files and read all of them to the end,
+        # with no partly written record left.
+        self.caught_up = False
+
+    def Load(self) -> Iterator["ProtoEvent"]:  # noqa: N802
+        caught_up = True
+        num_files = 0
+        for name in sorted(os.listdir(self._logdir)):
+            path = os.path.join(self._logdir, name)
+            if path not in self._readers:
+                if os.path.isfile(path) and self._path_filter(path):
+                    self._readers[path] = tfrecord.TFRecordReader(path)
+                    self._initial_metadata[path] = {}
+                    self._on_new_file(path)
+                else:
+                    self._readers[path] = None
+            reader = self._readers[path]
+            if reader is None:
+                continue
+
+            num_files += 1
+            stat = os.stat(path)
+            self.last_modified = max(self.last_modified, stat.st_mtime)
+            if stat.st_size <= reader.offset:
+                continue
+            try:
+                for record in reader.records():
+                    yield from self._decode(record, self._initial_metadata[path])
+            except tfrecord.CorruptRecordError as e:
+                logger.warning("Not reading the rest of a tfevents file: %s", e)
+                self._readers[path] = None
+                continue
+            if reader.offset < os.path.getsize(path):
+                caught_up = False
+        self.caught_up = caught_up and num_files > 0
+
+    def _decode(
+        self, record: bytes, initial_metadata: Dict[str, Any]
+    ) -> Iterator["ProtoEvent"]:
+        event = self._event_pb2.Event.FromString(record)
+        if event.HasField("summary") and _scalars_to_simple_values(event.summary):
+            yield event
+            return
+        event = self._data_compat.migrate_event(event)
+        yield from self._dataclass_compat.migrate_event(event, initial_metadata)
+
+
 class TBDirWatcher:
     def __init__(
         self,
@@ -205,9 +345,20 @@ class TBDirWatcher:
             "tensorboard.compat", required="Please install tensorboard package"
         )
         self._tbwatcher = tbwatcher
-        self._generator = self.directory_watcher.DirectoryWatcher(
-            logdir, self._loader(save, namespace), self._is_our_tfevents_file
-        )
+        self._generator: Any
+        self._tailer: Optional[TFEventsTailer] = None
+        if REMOTE_FILE_TOKEN in logdir:
+            self._generator = self.directory_watcher.DirectoryWatcher(
+                logdir, self._loader(save, namespace), self._is_our_tfevents_file
+            )
+        else:
+            self._generator = self._tailer = TFEventsTailer(
+                logdir,
+                self._is_our_tfevents_file,
+                self._save_file if save else lambda path: None,
+            )
+        self._observer: Optional[wd_observers.Observer] = None
+        self._files_changed = threading.Event()
         self._thread = threading.Thread(target=self._thread_except_body)
         self._first_event_timestamp = None
         self._shutdown = threading.Event()
@@ -220,8 +371,35 @@ class TBDirWatcher:
         self._process_events_lock = threading.Lock()
 
     def start(self) -> None:
+        if self._tailer:
+            self._observer = self._watch_files()
         self._thread.start()
 
+    def _watch_files(self) -> Optional["wd_observers.Observer"]:
+        """Get notified when the files in the directory change."""
+        handler = wd_events.FileSystemEventHandler()
+        handler.on_any_event = self._on_file_event
+        observer = wd_observers.Observer()
+        try:
+            observer.schedule(handler, self._logdir, recursive=False)
+            observer.start()
+        except Exception as e:
+            # e.g. the directory doesn't exist yet or we ran out of inotify watches
+            logger.debug("Polling %s for tensorboard events: %s", self._logdir, e)
+            return None
+        return observer
+
+    def _on_file_event(self, event: "wd_events.FileSystemEvent") -> None:
+        self._files_changed.set()
+
+    def _save_file(self, file_path: str) -> None:
+        _save_tfevents_file(
+            file_path,
+            self._namespace,
+            self._tbwatcher._interface,
+            self._tbwatcher._settings,
+        )
+
     def _is_our_tfevents_file(self, path: str) -> bool:
         """Check if a path has been modified since launch and contains tfevents."""
         if not path:
@@ -249,23 +427,9 @@ class TBDirWatcher:
             def __init__(self, file_path: str) -> None:
                 super().__init__(file_path)
                 if save:
-                    if REMOTE_FILE_TOKEN in file_path:
-                        logger.warning(
-                            "Not persisting remote tfevent file: %s", file_path
-                        )
-                    else:
-                        # TODO: save plugins?
-                        logdir = os.path.dirname(file_path)
-                        parts = list(os.path.split(logdir))
-                        if namespace and parts[-1] == namespace:
-                            parts.pop()
-                            logdir = os.path.join(*parts)
-                        _link_and_save_file(
-                            path=file_path,
-                            base_path=logdir,
-                            interface=_loader_interface,
-                            settings=_loader_settings,
-                        )
+                    _save_tfevents_file(
+                        file_path, namespace, _loader_interface, _loader_settings
+                    )
 
         return EventFileLoader
 
@@ -282,8 +446,8 @@ class TBDirWatcher:
         ) as e:
             # When listing s3 the directory may not yet exist, or could be empty
             logger.debug("Encountered tensorboard directory watcher error: %s", e)
-            if not self._shutdown.is_set() and not shutdown_call:
-                time.sleep(ERROR_DELAY)
+            if not shutdown_call:
+                self._shutdown.wait(ERROR_DELAY)
 
     def _thread_except_body(self) -> None:
         try:
@@ -293,17 +457,31 @@ class TBDirWatcher:
             raise e
 
     def _thread_body(self) -> None:
-        """Check for new events every second."""
+        """Check for new events when the files change, or every second if not notified."""
+        poll_interval = (
+            POLL_INTERVAL if self._observer is None else NOTIFIED_POLL_INTERVAL
+        )
         shutdown_time: Optional[float] = None
         while True:
+            self._files_changed.clear()
             self._process_events()
+            timeout: float = poll_interval
             if self._shutdown.is_set():
                 now = time.time()
                 if not shutdown_time:
                     shutdown_time = now + SHUTDOWN_DELAY
-                elif now > shutdown_time:
+                # There's no need to wait if the files were read to the end and
+                # haven't been written to in a while, as when syncing a
+                # finished run.
+                deadline = shutdown_time
+                if self._tailer and self._tailer.caught_up:
+                    deadline = min(
+                        deadline, self._tailer.last_modified + SHUTDOWN_DELAY
+                    )
+                if now >= deadline:
                     break
-            time.sleep(1)
+                timeout = min(timeout, deadline - now)
+            self._files_changed.wait(timeout)
 
     def process_event(self, event: "ProtoEvent") -> None:
         # print("\nEVENT:::", self._logdir, self._namespace, event, "\n")
@@ -319,10 +497,14 @@ class TBDirWatcher:
     def shutdown(self) -> None:
         self._process_events(shutdown_call=True)
         self._shutdown.set()
+        self._files_changed.set()
 
     def finish(self) -> None:
         self.shutdown()
         self._thread.join()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
 
 
 class Event:
@@ -381,15 +563,7 @@ class TBEventConsumer:
         self._delay = 0
         self._shutdown.set()
         self._thread.join()
-        while not self._queue.empty():
-            event = self._queue.get(True, 1)
-            if event:
-                self._handle_event(event, history=self.tb_history)
-                items = self.tb_history._get_and_reset()
-                for item in items:
-                    self._save_row(
-                        item,
-                    )
+        self._handle_events(self._get_queued([]))
 
     def _thread_except_body(self) -> None:
         try:
@@ -399,34 +573,36 @@ class TBEventConsumer:
             raise e
 
     def _thread_body(self) -> None:
+        # Wait self._delay seconds from consumer start before logging events
+        self._shutdown.wait(self._start_time + self._delay - time.time())
         while True:
             try:
                 event = self._queue.get(True, 1)
-                # Wait self._delay seconds from consumer start before logging events
-                if (
-                    time.time() < self._start_time + self._delay
-                    and not self._shutdown.is_set()
-                ):
-                    self._queue.put(event)
-                    time.sleep(0.1)
-                    continue
             except queue.Empty:
-                event = None
                 if self._shutdown.is_set():
                     break
-            if event:
-                self._handle_event(event, history=self.tb_history)
-                items = self.tb_history._get_and_reset()
-                for item in items:
-                    self._save_row(
-                        item,
-                    )
+                continue
+            self._handle_events(self._get_queued([event]))
         # flush uncommitted data
         self.tb_history._flush()
         items = self.tb_history._get_and_reset()
         for item in items:
             self._save_row(item)
 
+    def _get_queued(self, events: List["Event"]) -> List["Event"]:
+        """Add all events in the queue to `events`, in the order of their time."""
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _handle_events(self, events: List["Event"]) -> None:
+        for event in events:
+            self._handle_event(event, history=self.tb_history)
+        for item in self.tb_history._get_and_reset():
+            self._save_row(item)
+
     def _handle_event(
         self, event: "ProtoEvent", history: Optional["TBHistory"] = None
     ) -> None:
@@ -0,0 +1,106 @@
+"""TFRecord file reader.
+
+Tensorboard event files are TFRecord files, a sequence of records framed as:
+
+record :=
+  length: uint64        // little-endian
+  length_crc: uint32    // masked crc32c of length ; little-endian
+  data: uint8[length]
+  data_crc: uint32      // masked crc32c of data ; little-endian
+
+A masked crc is ((crc >> 15) | (crc << 17)) + 0xa282ead8, truncated to 32 bits.
+"""
+
+import struct
+from typing import Iterator, List
+
+from wandb import util
+
+TFRECORD_HEADER_LEN = 12
+TFRECORD_FOOTER_LEN = 4
+
+_CHUNK_SIZE = 1 << 22
+_MASK_DELTA = 0xA282EAD8
+
+_length = struct.Struct("<Q")
+_crc = struct.Struct("<I")
+
+
+def _crc32c_table() -> List[int]:
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _crc32c_table()
+
+
+def _crc32c_python(data: bytes) -> int:
+    table = _CRC32C_TABLE
+    crc = 0xFFFFFFFF
+    for b in data:
+        crc = table[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+# google-crc32c is installed along with the Google Cloud Storage client.
+_google_crc32c = util.get_module("google_crc32c", lazy=False)
+crc32c = _google_crc32c.value if _google_crc32c else _crc32c_python
+
+
+def masked_crc32c(data: bytes) -> int:
+    crc = crc32c(data)
+    return (((crc >> 15) | (crc << 17)) + _MASK_DELTA) & 0xFFFFFFFF
+
+
+class CorruptRecordError(Exception):
+    """A record of a TFRecord file failed its checksum."""
+
+
+class TFRecordReader:
+    """Reads the records of a TFRecord file as it is being written.
+
+    Each call to `records()` yields the records written since the previous
+    call. A record that is only partly written is yielded by a later call, once
+    it is complete.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.offset = 0
+
+    def records(self) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = b""
+            while True:
+                chunk = f.read(_CHUNK_SIZE)
+                if not chunk:
+                    return
+                data += chunk
+                pos = 0
+                while len(data) - pos >= TFRECORD_HEADER_LEN:
+                    (length,) = _length.unpack_from(data, pos)
+                    (length_crc,) = _crc.unpack_from(data, pos + 8)
+                    if masked_crc32c(data[pos : pos + 8]) != length_crc:
+                        raise CorruptRecordError(
+                            f"{self.path}: bad record length at offset {self.offset}"
+                        )
+                    start = pos + TFRECORD_HEADER_LEN
+                    end = start + length
+                    if end + TFRECORD_FOOTER_LEN > len(data):
+                        break
+                    record = data[start:end]
+                    (data_crc,) = _crc.unpack_from(data, end)
+                    if masked_crc32c(record) != data_crc:
+                        raise CorruptRecordError(
+                            f"{self.path}: bad record data at offset {self.offset}"
+                        )
+                    pos = end + TFRECORD_FOOTER_LEN
+                    self.offset += TFRECORD_HEADER_LEN + length + TFRECORD_FOOTER_LEN
+                    yield record
+                data = data[pos:]
@@ -3,6 +3,7 @@
 import logging
 from typing import TYPE_CHECKING, Callable, Optional
 
+from wandb import env
 from wandb.proto import wandb_internal_pb2 as pb
 from wandb.proto import wandb_telemetry_pb2 as tpb
 
@@ -67,7 +68,11 @@ class WriteManager:
         )
 
     def open(self) -> None:
-        self._ds = datastore.DataStore()
+        self._ds = datastore.DataStore(
+            sync_mode=env.get_datastore_sync_mode(),
+            sync_interval=env.get_datastore_sync_interval(),
+            sync_bytes=env.get_datastore_sync_bytes(),
+        )
         self._ds.open_for_write(self._settings.sync_file)
         self._flow_control = flow_control.FlowControl(
             settings=self._settings,
@@ -201,4 +206,6 @@ class WriteManager:
         # self._context_keeper._debug_print_orphans(print_to_stdout=self._settings._debug)
 
     def debounce(self) -> None:
-        pass
+        # enforce the time window of group commit when records stop arriving
+        if self._ds:
+            self._ds.commit(force=False)
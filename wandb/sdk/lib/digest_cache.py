@@ -0,0 +1,193 @@
+"""Persistent cache of local file digests."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Tuple
+
+from wandb import env
+from wandb.sdk.lib.hashutil import B64MD5, md5_file_b64
+from wandb.sdk.lib.paths import StrPath
+
+try:
+    import sqlite3
+except ImportError:  # Python can be built without sqlite3.
+    sqlite3 = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# (st_dev, st_ino, st_size, st_mtime_ns)
+FileKey = Tuple[int, int, int, int]
+
+# Files modified this recently may still change within the same mtime, so
+# their digests are not cached.
+_RACY_WINDOW_NS = 2 * 10**9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS digests (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    added REAL NOT NULL,
+    PRIMARY KEY (dev, ino)
+)
+"""
+
+
+class DigestCache:
+    """Caches the MD5 of local files by file identity and stat.
+
+    An entry is keyed by the device and inode of a file and is only valid
+    while the file's size and modification time are unchanged. Once the cache
+    holds more than `max_entries` digests, the oldest ones are evicted. A
+    corrupt database is deleted and recreated; any other database error only
+    disables the lookup at hand, since the digest can always be recomputed.
+    """
+
+    def __init__(self, db_path: StrPath, max_entries: int = 500_000) -> None:
+        self._db_path = Path(db_path)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._puts = 0
+
+    @staticmethod
+    def key(path: StrPath) -> FileKey | None:
+        """Return the cache key of a file, or None if it can't be cached."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            return None
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self._db_path), timeout=5, check_same_thread=False
+            )
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                # Losing recent digests on a crash only costs rehashing.
+                conn.execute("PRAGMA synchronous=OFF")
+                conn.execute(_SCHEMA)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def _reset(self) -> None:
+        logger.warning(f"Recreating corrupt digest cache {self._db_path}")
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(f"{self._db_path}{suffix}")
+            except FileNotFoundError:
+                pass
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple] | None:
+        if sqlite3 is None:
+            return None
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    conn = self._connect()
+                    with conn:
+                        return conn.execute(sql, params).fetchall()
+                except sqlite3.OperationalError as e:
+                    # Usually a locked database, try again next time.
+                    logger.debug(f"digest cache unavailable: {e}")
+                    return None
+                except sqlite3.DatabaseError:
+                    if attempt:
+                        return None
+                    try:
+                        self._reset()
+                    except OSError:
+                        return None
+        return None
+
+    def get(self, path: StrPath, key: FileKey | None = None) -> B64MD5 | None:
+        key = key or self.key(path)
+        if key is None:
+            return None
+        rows = self._execute(
+            "SELECT digest FROM digests"
+            " WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+            key,
+        )
+        return B64MD5(rows[0][0]) if rows else None
+
+    def put(self, path: StrPath, digest: B64MD5, key: FileKey | None = None) -> None:
+        key = key or self.key(path)
+        if key is None:
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?)",
+            (*key, digest, time.time()),
+        )
+        self._puts += 1
+        if self._puts % 10_000 == 0:
+            self.evict()
+
+    def evict(self) -> None:
+        """Drop the oldest digests beyond `max_entries`."""
+        self._execute(
+            "DELETE FROM digests WHERE rowid IN ("
+            " SELECT rowid FROM digests ORDER BY added DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
+
+    def md5_file_b64(self, path: StrPath) -> B64MD5:
+        """Return the MD5 of a file, hashing it only if it isn't cached."""
+        key = self.key(path)
+        if key is not None:
+            digest = self.get(path, key)
+            if digest is not None:
+                return digest
+        digest = md5_file_b64(path)
+        if key is not None and key == self.key(path):
+            self.put(path, digest, key)
+        return digest
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class _NoDigestCache(DigestCache):
+    def __init__(self) -> None:
+        super().__init__(os.devnull)
+
+    def get(self, path: StrPath, key: FileKey | None = None) -> B64MD5 | None:
+        return None
+
+    def put(self, path: StrPath, digest: B64MD5, key: FileKey | None = None) -> None:
+        pass
+
+
+_no_digest_cache = _NoDigestCache()
+_digest_cache: DigestCache | None = None
+
+
+def get_digest_cache() -> DigestCache:
+    global _digest_cache
+    if not env.get_digest_cache_enabled():
+        return _no_digest_cache
+    db_path = env.get_cache_dir() / "artifacts" / "digests.sqlite"
+    if _digest_cache is None or _digest_cache._db_path != db_path:
+        _digest_cache = DigestCache(db_path)
+    return _digest_cache
@@ -175,6 +175,105 @@ def copy_or_overwrite_changed(source_path: StrPath, target_path: StrPath) -> Str
     return return_type(target_path)  # type: ignore  # 'os.PathLike' is abstract.
 
 
+LINK_MODES = ("copy", "auto", "reflink", "hardlink", "symlink")
+
+# The kinds of links to try, in order, for each mode.
+_LINK_ATTEMPTS = {
+    "copy": (),
+    "auto": ("reflink", "hardlink"),
+    "reflink": ("reflink",),
+    "hardlink": ("hardlink",),
+    "symlink": ("symlink",),
+}
+
+
+def is_link(path: StrPath) -> bool:
+    """Whether `path` is a symlink or a file with more than one hard link."""
+    try:
+        return os.path.islink(path) or os.stat(path).st_nlink > 1
+    except OSError:
+        return False
+
+
+def _same_file(source_path: StrPath, target_path: StrPath) -> bool:
+    try:
+        return os.path.samefile(source_path, target_path)
+    except OSError:
+        return False
+
+
+def _link(source_path: StrPath, target_path: str, kind: str) -> None:
+    dir_name, file_name = os.path.split(target_path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=dir_name, prefix=f".{file_name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    os.unlink(tmp_path)
+    try:
+        if kind == "reflink":
+            reflink(source_path, tmp_path)
+            shutil.copystat(source_path, tmp_path)
+        elif kind == "hardlink":
+            os.link(source_path, tmp_path)
+        else:
+            os.symlink(os.path.abspath(source_path), tmp_path)
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.lexists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def link_or_copy(
+    source_path: StrPath, target_path: StrPath, mode: str = "copy"
+) -> StrPath:
+    """Materialize source_path at target_path, linking to it where possible.
+
+    Modes:
+        copy: always copy, see `copy_or_overwrite_changed`.
+        auto: create a copy-on-write clone of the file, or else a hard link.
+        reflink: create a copy-on-write clone of the file.
+        hardlink: create a hard link to the file.
+        symlink: create a symbolic link to the file.
+
+    Links are only created when both paths are on the same device, and a link
+    that the filesystem refuses falls back to a copy. Hard and symbolic links
+    share their contents with source_path, so the target must not be modified
+    in place. A target that is itself a link is replaced rather than copied
+    through, in every mode.
+
+    Returns:
+        The path to the linked or copied file (which may be different from
+        target_path).
+    """
+    if mode not in LINK_MODES:
+        raise ValueError(f"Unknown link mode {mode!r}, expected one of {LINK_MODES}")
+
+    return_type = type(target_path)
+    target_path = system_preferred_path(target_path, warn=True)
+    dir_name, file_name = os.path.split(target_path)
+    target_path = os.path.join(mkdir_allow_fallback(dir_name), file_name)
+
+    kinds = _LINK_ATTEMPTS[mode]
+    if kinds and _same_file(source_path, target_path):
+        return return_type(target_path)  # type: ignore  # 'os.PathLike' is abstract.
+
+    if (
+        kinds
+        and os.stat(source_path).st_dev == os.stat(os.path.dirname(target_path)).st_dev
+    ):
+        for kind in kinds:
+            try:
+                _link(source_path, target_path, kind)
+                return return_type(target_path)  # type: ignore  # 'os.PathLike' is abstract.
+            except (OSError, ValueError) as e:
+                logger.debug(f"Unable to {kind} {source_path} to {target_path}: {e}")
+
+    # Never copy through a link, that would overwrite the linked file.
+    if is_link(target_path):
+        os.unlink(target_path)
+    return return_type(copy_or_overwrite_changed(source_path, target_path))  # type: ignore
+
+
 @contextlib.contextmanager
 def safe_open(
     path: StrPath, mode: str = "r", *args: Any, **kwargs: Any
@@ -1,6 +1,7 @@
 #
+import functools
 import json
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from wandb.proto import wandb_internal_pb2 as pb
 
@@ -36,6 +37,31 @@ def dict_from_proto_list(obj_list: "RepeatedCompositeFieldContainer") -> Dict[st
     return result
 
 
+@functools.lru_cache(maxsize=65536)
+def _json_key(key: str) -> str:
+    return json.dumps(key)
+
+
+def json_from_proto_list(obj_list: "RepeatedCompositeFieldContainer") -> Optional[str]:
+    """Serialize items as a JSON object, reusing each item's value_json.
+
+    This avoids decoding and re-encoding every value when the items only
+    need to be forwarded as JSON.
+
+    Returns:
+        The JSON object, or None if the items use nested keys or repeat a
+        key, in which case `dict_from_proto_list` should be used instead.
+    """
+    values: Dict[str, str] = {}
+    for item in obj_list:
+        if item.nested_key:
+            return None
+        values[item.key] = item.value_json
+    if len(values) != len(obj_list):
+        return None
+    return "{" + ", ".join([f"{_json_key(k)}: {v}" for k, v in values.items()]) + "}"
+
+
 def _result_from_record(record: "pb.Record") -> "pb.Result":
     result = pb.Result(uuid=record.uuid, control=record.control)
     return result
@@ -8,6 +8,7 @@ try:
 except ImportError:  # windows
     pty = tty = termios = fcntl = None  # type: ignore
 
+import bisect
 import itertools
 import logging
 import os
@@ -18,45 +19,11 @@ import struct
 import sys
 import threading
 import time
-from collections import defaultdict
-from typing import Callable, Iterable, Literal
+from typing import Callable, Iterable, Iterator, Literal
 
 import wandb
 from wandb.sdk.lib import console_capture
 
-
-class _Numpy:  # fallback in case numpy is not available
-    def where(self, x):
-        return ([i for i in range(len(x)) if x[i]],)
-
-    def diff(self, x):
-        return [x[i + 1] - x[i] for i in range(len(x) - 1)]
-
-    def arange(self, x):
-        class Arr(list):
-            def __getitem__(self, s):
-                if isinstance(s, slice):
-                    self._start = s.start
-                    return self
-                return super().__getitem__(s)
-
-            def __getslice__(self, i, j):
-                self._start = i
-                return self
-
-            def __iadd__(self, i):  # type: ignore
-                for j in range(self._start, len(self)):
-                    self[j] += i
-
-        return Arr(range(x))
-
-
-try:
-    import numpy as np  # type: ignore
-except ImportError:
-    np = _Numpy()  # type: ignore
-
-
 logger = logging.getLogger("wandb")
 
 
@@ -106,7 +73,11 @@ def _get_char(code):
 
 
 class Char:
-    """Class encapsulating a single character, its foreground, background and style attributes."""
+    """Class encapsulating a single character, its foreground, background and style attributes.
+
+    The emulator doesn't store a `Char` per character: the cursor's `Char` is the
+    pen whose colors and styles apply to the text written next.
+    """
 
     __slots__ = (
         "data",
@@ -163,6 +134,20 @@ class Char:
                 attrs[k] = self[k]
         return self.__class__(**attrs)
 
+    @property
+    def style(self):
+        """The colors and styles of the character, as a hashable tuple."""
+        return (
+            self.fg,
+            self.bg,
+            self.bold,
+            self.italics,
+            self.underscore,
+            self.blink,
+            self.strikethrough,
+            self.reverse,
+        )
+
     def __eq__(self, other):
         for k in self.__slots__:
             if self[k] != other[k]:
@@ -171,6 +156,104 @@ class Char:
 
 
 _defchar = Char()
+_DEFAULT_STYLE = _defchar.style
+_STYLE_ATTRS = Char.__slots__[3:]
+
+
+def _style_change(prev, style):
+    """Returns the escape codes that switch from the `prev` style to `style`."""
+    codes = []
+    if style[0] != prev[0]:
+        codes.append(_get_char(style[0]))
+    if style[1] != prev[1]:
+        codes.append(_get_char(style[1]))
+    for k, prev_on, on in zip(_STYLE_ATTRS, prev[2:], style[2:]):
+        if on != prev_on:
+            codes.append(_get_char(ANSI_STYLES_REV[k if on else "/" + k]))
+    return "".join(codes)
+
+
+class _Line:
+    """A line of the terminal screen.
+
+    The characters of the line are stored in a list, and their styles as runs
+    of characters that share one: run `i` covers the characters from
+    `starts[i]` up to the start of the next run. Adjacent runs have different
+    styles, so a line without colors has a single run.
+    """
+
+    __slots__ = ("chars", "starts", "styles")
+
+    def __init__(self):
+        self.chars = []
+        self.starts = [0]
+        self.styles = [_DEFAULT_STYLE]
+
+    def _restyle(self, start, end, style):
+        # Sets the style of the characters in [start, end).
+        starts, styles = self.starts, self.styles
+        i = bisect.bisect_right(starts, start) - 1
+        j = bisect.bisect_right(starts, end) - 1
+        new_starts, new_styles = [start], [style]
+        if end < len(self.chars):
+            new_starts.append(end)
+            new_styles.append(styles[j])
+        lo = i + 1 if starts[i] < start else i
+        starts[lo : j + 1] = new_starts
+        styles[lo : j + 1] = new_styles
+
+        # merge the new runs into equal neighbours
+        k = min(lo + len(new_starts), len(starts) - 1)
+        while k > max(lo - 1, 0):
+            if styles[k] == styles[k - 1]:
+                del starts[k], styles[k]
+            k -= 1
+
+    def write(self, x, text, style):
+        chars = self.chars
+        n = len(chars)
+        if x > n:
+            chars.extend(" " * (x - n))
+            self._restyle(n, x, _DEFAULT_STYLE)
+        chars[x : x + len(text)] = text
+        self._restyle(x, x + len(text), style)
+
+    def erase(self, start, end):
+        """Erases the characters in [start, end)."""
+        if end < len(self.chars):
+            self.write(start, " " * (end - start), _DEFAULT_STYLE)
+            return
+        del self.chars[start:]
+        k = max(bisect.bisect_left(self.starts, start), 1)
+        del self.starts[k:], self.styles[k:]
+        if not self.chars:
+            self.styles[0] = _DEFAULT_STYLE
+
+    def __len__(self):
+        # Trailing blanks without colors or styles don't count.
+        n = len(self.chars)
+        if self.styles[-1] == _DEFAULT_STYLE:
+            start = self.starts[-1]
+            while n > start and self.chars[n - 1] == " ":
+                n -= 1
+        return n
+
+    def render(self):
+        """Returns the text of the line with escape codes for its styles."""
+        n = len(self)
+        chars, starts, styles = self.chars, self.starts, self.styles
+        if len(starts) == 1 and styles[0] == _DEFAULT_STYLE:
+            return "".join(chars[:n])
+        out = []
+        prev = _DEFAULT_STYLE
+        for i, start in enumerate(starts):
+            if start >= n:
+                break
+            end = starts[i + 1] if i + 1 < len(starts) else n
+            out.append(_style_change(prev, styles[i]))
+            out.append("".join(chars[start : min(end, n)]))
+            prev = styles[i]
+        return "".join(out)
 
 
 class Cursor:
@@ -195,15 +278,18 @@ class Cursor:
 class TerminalEmulator:
     """An FSM emulating a terminal.
 
-    Characters are stored in a 2D matrix (buffer) indexed by the cursor.
+    The screen is a list of lines indexed by the cursor. Each line stores its
+    text and the runs of colors and styles over it.
     """
 
     _MAX_LINES = 100
 
     def __init__(self):
-        self.buffer = defaultdict(lambda: defaultdict(lambda: _defchar))
+        self.buffer = []
         self.cursor = Cursor()
         self._num_lines = None  # Cache
+        # Writes and reads happen on different threads.
+        self._lock = threading.Lock()
 
         # For diffing:
         self._prev_num_lines = None
@@ -240,78 +326,67 @@ class TerminalEmulator:
         self.cursor_down()
         self.carriage_return()
 
+    def _line(self, n):
+        # Returns the n-th line, adding empty lines up to it.
+        buffer = self.buffer
+        while len(buffer) <= n:
+            buffer.append(_Line())
+        return buffer[n]
+
     def _get_line_len(self, n):
-        if n not in self.buffer:
-            return 0
-        line = self.buffer[n]
-        if not line:
+        if not 0 <= n < len(self.buffer):
             return 0
-        n = max(line.keys())
-        for i in range(n, -1, -1):
-            if line[i] != _defchar:
-                return i + 1
-        return 0
+        return len(self.buffer[n])
 
     @property
     def num_lines(self):
         if self._num_lines is not None:
             return self._num_lines
         ret = 0
-        if self.buffer:
-            n = max(self.buffer.keys())
-            for i in range(n, -1, -1):
-                if self._get_line_len(i):
-                    ret = i + 1
-                    break
+        for i in range(len(self.buffer) - 1, -1, -1):
+            if self._get_line_len(i):
+                ret = i + 1
+                break
         self._num_lines = ret
         return ret
 
     def display(self):
         return [
-            [self.buffer[i][j].data for j in range(self._get_line_len(i))]
-            for i in range(self.num_lines)
+            self.buffer[i].chars[: self._get_line_len(i)] for i in range(self.num_lines)
         ]
 
     def erase_screen(self, mode=0):
         if mode == 0:
-            for i in range(self.cursor.y + 1, self.num_lines):
-                if i in self.buffer:
-                    del self.buffer[i]
+            del self.buffer[self.cursor.y + 1 :]
             self.erase_line(mode)
         if mode == 1:
-            for i in range(self.cursor.y):
-                if i in self.buffer:
-                    del self.buffer[i]
+            for i in range(min(self.cursor.y, len(self.buffer))):
+                self.buffer[i] = _Line()
             self.erase_line(mode)
         elif mode == 2 or mode == 3:
             self.buffer.clear()
 
     def erase_line(self, mode=0):
+        if self.cursor.y >= len(self.buffer):
+            return
         curr_line = self.buffer[self.cursor.y]
         if mode == 0:
-            for i in range(self.cursor.x, self._get_line_len(self.cursor.y)):
-                if i in curr_line:
-                    del curr_line[i]
+            curr_line.erase(self.cursor.x, len(curr_line.chars))
         elif mode == 1:
-            for i in range(self.cursor.x + 1):
-                if i in curr_line:
-                    del curr_line[i]
+            curr_line.erase(0, self.cursor.x + 1)
         else:
-            curr_line.clear()
+            self.buffer[self.cursor.y] = _Line()
 
     def insert_lines(self, n=1):
-        for i in range(self.num_lines - 1, self.cursor.y, -1):
-            self.buffer[i + n] = self.buffer[i]
-        for i in range(self.cursor.y + 1, self.cursor.y + 1 + n):
-            if i in self.buffer:
-                del self.buffer[i]
+        if self.cursor.y + 1 < self.num_lines:
+            at = self.cursor.y + 1
+            self.buffer[at:at] = [_Line() for _ in range(n)]
 
     def _write_plain_text(self, plain_text):
-        self.buffer[self.cursor.y].update(
-            [
-                (self.cursor.x + i, self.cursor.char.copy(data=c))
-                for i, c in enumerate(plain_text)
-            ]
+        if not plain_text:
+            return
+        self._line(self.cursor.y).write(
+            self.cursor.x, plain_text, self.cursor.char.style
         )
         self.cursor.x += len(plain_text)
 
@@ -336,17 +411,19 @@ class TerminalEmulator:
         return re.sub(ANSI_OSC_RE, "", text)
 
     def write(self, data):
-        self._num_lines = None  # invalidate cache
-        data = self._remove_osc(data)
-        prev_end = 0
-        for match in ANSI_CSI_RE.finditer(data):
-            start, end = match.span()
-            text = data[prev_end:start]
-            csi = data[start:end]
-            prev_end = end
-            self._write_text(text)
-            self._handle_csi(csi, *match.groups())
-        self._write_text(data[prev_end:])
+        with self._lock:
+            data = self._remove_osc(data)
+            prev_end = 0
+            for match in ANSI_CSI_RE.finditer(data):
+                start, end = match.span()
+                text = data[prev_end:start]
+                csi = data[start:end]
+                prev_end = end
+                self._write_text(text)
+                self._num_lines = None  # invalidate cache
+                self._handle_csi(csi, *match.groups())
+            self._write_text(data[prev_end:])
+            self._num_lines = None
 
     def _handle_csi(self, csi, params, command):
         try:
@@ -400,55 +477,15 @@ class TerminalEmulator:
             pass
 
     def _get_line(self, n):
-        line = self.buffer[n]
-        line_len = self._get_line_len(n)
-        # We have to loop through each character in the line and check if foreground,
-        # background and other attributes (italics, bold, underline, etc) of the ith
-        # character are different from those of the (i-1)th character. If different, the
-        # appropriate ascii character for switching the color/attribute should be
-        # appended to the output string before appending the actual character. This loop
-        # and subsequent checks can be expensive, especially because 99% of terminal
-        # output use default colors and formatting. Even in outputs that do contain
-        # colors and styles, its unlikely that they will change on a per character
-        # basis.
-
-        # So instead we create a character list without any ascii codes (`out`), and a
-        # list of all the foregrounds in the line (`fgs`) on which we call np.diff() and
-        # np.where() to find the indices where the foreground change, and insert the
-        # ascii characters in the output list (`out`) on those indices. All of this is
-        # the done only if there are more than 1 foreground color in the line in the
-        # first place (`if len(set(fgs)) > 1 else None`). Same logic is repeated for
-        # background colors and other attributes.
-
-        out = [line[i].data for i in range(line_len)]
-
-        # for dynamic insert using original indices
-        idxs = np.arange(line_len)
-        insert = lambda i, c: (out.insert(idxs[i], c), idxs[i:].__iadd__(1))  # noqa
-
-        fgs = [int(_defchar.fg)] + [int(line[i].fg) for i in range(line_len)]
-        [
-            insert(i, _get_char(line[int(i)].fg)) for i in np.where(np.diff(fgs))[0]
-        ] if len(set(fgs)) > 1 else None
-        bgs = [int(_defchar.bg)] + [int(line[i].bg) for i in range(line_len)]
-        [
-            insert(i, _get_char(line[int(i)].bg)) for i in np.where(np.diff(bgs))[0]
-        ] if len(set(bgs)) > 1 else None
-        attrs = {
-            k: [False] + [line[i][k] for i in range(line_len)]
-            for k in Char.__slots__[3:]
-        }
-        [
-            [
-                insert(i, _get_char(ANSI_STYLES_REV[k if line[int(i)][k] else "/" + k]))
-                for i in np.where(np.diff(v))[0]
-            ]
-            for k, v in attrs.items()
-            if any(v)
-        ]
-        return "".join(out)
+        if not 0 <= n < len(self.buffer):
+            return ""
+        return self.buffer[n].render()
 
     def read(self):
+        with self._lock:
+            return self._read()
+
+    def _read(self):
         num_lines = self.num_lines
         if self._prev_num_lines is None:
             ret = os.linesep.join(map(self._get_line, range(num_lines)))
@@ -477,11 +514,7 @@ class TerminalEmulator:
                 )
         if num_lines > self._MAX_LINES:
             shift = num_lines - self._MAX_LINES
-            for i in range(shift, num_lines):
-                self.buffer[i - shift] = self.buffer[i]
-            for i in range(self._MAX_LINES, max(self.buffer.keys())):
-                if i in self.buffer:
-                    del self.buffer[i]
+            del self.buffer[:shift]
             self.cursor.y -= min(self.cursor.y, shift)
             self._num_lines = num_lines = self._MAX_LINES
         self._prev_num_lines = num_lines
@@ -491,6 +524,31 @@ class TerminalEmulator:
 
 _MIN_CALLBACK_INTERVAL = 2  # seconds
 
+# Output still queued when the stream is closed is logged without passing it
+# through the emulator above this many characters.
+_MAX_UNPROCESSED_OUTPUT = 1000000
+
+
+def _queued_writes(q: queue.Queue) -> Iterator[list]:
+    """Yields the data put in `q` in batches, until None is put in it.
+
+    Blocks until there is data, then takes everything queued so far so that
+    bursts of small writes are processed together.
+    """
+    while True:
+        batch = [q.get()]
+        while True:
+            try:
+                batch.append(q.get_nowait())
+            except queue.Empty:
+                break
+        if None in batch:
+            batch = batch[: batch.index(None)]
+            if batch:
+                yield batch
+            return
+        yield batch
+
 
 class RedirectBase:
     def __init__(
@@ -538,22 +596,12 @@ class StreamWrapper(RedirectBase):
         super().__init__(src=src, cbs=cbs)
         self._uninstall: Callable[[], None] | None = None
         self._emulator = TerminalEmulator()
-        self._queue: queue.Queue[str] = queue.Queue()
+        self._queue: queue.Queue[str | None] = queue.Queue()
         self._stopped = threading.Event()
 
     def _emulator_write(self) -> None:
-        while True:
-            if self._queue.empty():
-                if self._stopped.is_set():
-                    return
-                time.sleep(0.5)
-                continue
-
-            data: list[str] = []
-            while not self._queue.empty():
-                data.append(self._queue.get())
-
-            if self._stopped.is_set() and sum(map(len, data)) > 100000:
+        for data in _queued_writes(self._queue):
+            if self._stopped.is_set() and sum(map(len, data)) > _MAX_UNPROCESSED_OUTPUT:
                 wandb.termlog("Terminal output too large. Logging without processing.")
                 self.flush()
 
@@ -568,9 +616,10 @@ class StreamWrapper(RedirectBase):
                 pass
 
     def _callback(self) -> None:
-        while not (self._stopped.is_set() and self._queue.empty()):
+        while True:
             self.flush()
-            time.sleep(_MIN_CALLBACK_INTERVAL)
+            if self._stopped.wait(_MIN_CALLBACK_INTERVAL):
+                return
 
     def _on_write(self, data: str | bytes, written: int, /) -> None:
         if isinstance(data, bytes):
@@ -626,6 +675,7 @@ class StreamWrapper(RedirectBase):
         self._uninstall()
 
         self._stopped.set()
+        self._queue.put(None)
         self._emulator_write_thread.join(timeout=5)
         if self._emulator_write_thread.is_alive():
             wandb.termlog(f"Processing terminal output ({self.src})...")
@@ -783,6 +833,7 @@ class Redirect(RedirectBase):
         os.dup2(self._orig_src_fd, self.src_fd)
         os.write(self._pipe_write_fd, _LAST_WRITE_TOKEN)
         self._pipe_relay_thread.join()
+        self._queue.put(None)
         os.close(self._pipe_read_fd)
         os.close(self._pipe_write_fd)
 
@@ -818,9 +869,10 @@ class Redirect(RedirectBase):
                     pass  # TODO(frz)
 
     def _callback(self):
-        while not self._stopped.is_set():
+        while True:
             self.flush()
-            time.sleep(_MIN_CALLBACK_INTERVAL)
+            if self._stopped.wait(_MIN_CALLBACK_INTERVAL):
+                return
 
     def _pipe_relay(self):
         while True:
@@ -851,16 +903,8 @@ class Redirect(RedirectBase):
                 return
 
     def _emulator_write(self):
-        while True:
-            if self._queue.empty():
-                if self._stopped.is_set():
-                    return
-                time.sleep(0.5)
-                continue
-            data = []
-            while not self._queue.empty():
-                data.append(self._queue.get())
-            if self._stopped.is_set() and sum(map(len, data)) > 100000:
+        for data in _queued_writes(self._queue):
+            if self._stopped.is_set() and sum(map(len, data)) > _MAX_UNPROCESSED_OUTPUT:
                 wandb.termlog("Terminal output too large. Logging without processing.")
                 self.flush()
                 [self.flush(line) for line in data]
@@ -57,6 +57,7 @@ from wandb.util import (
     _is_py_requirements_or_dockerfile,
     _resolve_aliases,
     add_import_hook,
+    json_dumps_safer_history,
     parse_artifact_string,
 )
 
@@ -67,8 +68,11 @@ from .artifacts._validators import (
     validate_tags,
 )
 from .data_types._dtypes import TypeRegistry
+from .data_types._media_encoder import PendingHistory, pending_encodings
+from .data_types.base_types.media import MediaIndex
+from .data_types.utils import SerializedValue, history_dict_to_json
 from .interface.interface import FilesDict, GlobStr, InterfaceBase, PolicyName
-from .interface.summary_record import SummaryRecord
+from .interface.summary_record import SummaryItem, SummaryRecord
 from .lib import (
     config_util,
     deprecate,
@@ -613,6 +617,11 @@ class Run:
 
         self._step = 0
         self._starting_step = 0
+        self._pending_history: PendingHistory | None = None
+        self._media_index: MediaIndex | None = (
+            MediaIndex() if wandb.env.get_media_dedup_enabled() else None
+        )
+        self._media_bytes_saved = 0
         # TODO: eventually would be nice to make this configurable using self._settings._start_time
         #  need to test (jhr): if you set start time to 2 days ago and run a test for 15 minutes,
         #  does the total time get calculated right (not as 2 days and 15 minutes)?
@@ -1414,15 +1423,62 @@ class Run:
         data = self._serialize_custom_charts(data)
 
         not_using_tensorboard = len(wandb.patched["tensorboard"]) == 0
-        self._backend.interface.publish_partial_history(
-            self,
-            data,
+        kwargs = dict(
             user_step=self._step,
             step=step,
             flush=commit,
             publish_step=not_using_tensorboard,
         )
 
+        if self._pending_history is None and wandb.env.get_media_encoding_workers() > 0:
+            self._pending_history = PendingHistory(
+                self._publish_partial_history,
+                max_rows=wandb.env.get_media_encoding_queue_size(),
+                serialize=self._serialize_pending_history,
+            )
+        if self._pending_history is None:
+            self._publish_partial_history(data, **kwargs)
+        else:
+            # The row may wait for its media to be encoded, so record when it
+            # was logged rather than when it's published.
+            data.setdefault("_timestamp", time.time())
+            self._pending_history.publish(data, **kwargs)
+
+    def _serialize_pending_history(
+        self, data: dict[str, Any], user_step: int, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Serialize the values of a queued row that don't wait for media.
+
+        Values that contain media still being encoded are kept as they are.
+        """
+        ready = {k: v for k, v in data.items() if not pending_encodings(v)}
+        ready = history_dict_to_json(self, ready, step=user_step, ignore_copy_err=True)
+        for k, v in ready.items():
+            ready[k] = SerializedValue(json_dumps_safer_history(v))
+        return {**data, **ready}
+
+    def _publish_partial_history(self, data: dict[str, Any], **kwargs: Any) -> None:
+        if self._backend and self._backend.interface:
+            self._backend.interface.publish_partial_history(self, data, **kwargs)
+            self._publish_media_bytes_saved()
+
+    def _publish_media_bytes_saved(self) -> None:
+        """Report the bytes of media that referred to an existing file."""
+        if self._media_index is None:
+            return
+        bytes_saved = self._media_index.bytes_saved
+        if bytes_saved == self._media_bytes_saved:
+            return
+        self._media_bytes_saved = bytes_saved
+
+        record = SummaryRecord()
+        item = SummaryItem()
+        item.key = ("_media_bytes_saved",)
+        item.value = bytes_saved
+        record.update.append(item)
+        assert self._backend and self._backend.interface
+        self._backend.interface.publish_summary(self, record)
+
     def _console_callback(self, name: str, data: str) -> None:
         # logger.info("console callback: %s, %s", name, data)
         if self._backend and self._backend.interface:
@@ -2335,6 +2391,10 @@ class Run:
             return
         self._atexit_cleanup_called = True
 
+        # Publish rows still waiting for their media to be encoded.
+        if self._pending_history is not None:
+            self._pending_history.close()
+
         exit_code = exit_code or (self._hooks and self._hooks.exit_code) or 0
         self._exit_code = exit_code
         logger.info(f"got exitcode: {exit_code}")
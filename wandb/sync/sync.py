@@ -230,18 +230,24 @@ class SyncThread(threading.Thread):
         handle_manager.finish()
         send_manager.finish()
 
-    def _robust_scan(self, ds):
-        """Attempt to scan data, handling incomplete files."""
+    def _robust_scan(self, scanner):
+        """Scan records, handling incomplete files."""
+        last_offset = datastore.LEVELDBLOG_HEADER_LEN
         try:
-            return ds.scan_data()
+            for offset, data in scanner.scan_with_offsets():
+                last_offset = offset
+                yield data
         except AssertionError as e:
-            if ds.in_last_block():
+            if last_offset > scanner.size - datastore.LEVELDBLOG_DATA_LEN:
                 wandb.termwarn(
                     f".wandb file is incomplete ({e}), be sure to sync this run again once it's finished"
                 )
-                return None
-            else:
-                raise e
+                return
+            raise e
+        if scanner.truncated:
+            wandb.termwarn(
+                ".wandb file is incomplete, be sure to sync this run again once it's finished"
+            )
 
     def run(self):
         if self._log_path is not None:
@@ -273,9 +279,8 @@ class SyncThread(threading.Thread):
                 self._send_tensorboard(tb_root, tb_logdirs, sm)
                 continue
 
-            ds = datastore.DataStore()
             try:
-                ds.open_for_scan(sync_item)
+                scanner = datastore.MmapDataStoreScanner(sync_item)
             except AssertionError as e:
                 print(f".wandb file is empty ({e}), skipping: {sync_item}")  # noqa: T201
                 continue
@@ -284,37 +289,37 @@ class SyncThread(threading.Thread):
             exit_pb = None
             finished = False
             shown = False
-            while True:
-                data = self._robust_scan(ds)
-                if data is None:
-                    break
-                pb, exit_pb, cont = self._parse_pb(data, exit_pb)
-                if exit_pb is not None:
-                    finished = True
-                if cont:
-                    continue
-                sm.send(pb)
-                # send any records that were added in previous send
-                while not sm._record_q.empty():
-                    data = sm._record_q.get(block=True)
-                    sm.send(data)
-
-                if pb.control.req_resp:
-                    result = sm._result_q.get(block=True)
-                    result_type = result.WhichOneof("result_type")
-                    if not shown and result_type == "run_result":
-                        r = result.run_result.run
-                        # TODO(jhr): hardcode until we have settings in sync
-                        url = "{}/{}/{}/runs/{}".format(
-                            self._app_url,
-                            url_quote(r.entity),
-                            url_quote(r.project),
-                            url_quote(r.run_id),
-                        )
-                        print("Syncing: {} ... ".format(url), end="")  # noqa: T201
-                        sys.stdout.flush()
-                        shown = True
-            sm.finish()
+            try:
+                for data in self._robust_scan(scanner):
+                    pb, exit_pb, cont = self._parse_pb(data, exit_pb)
+                    if exit_pb is not None:
+                        finished = True
+                    if cont:
+                        continue
+                    sm.send(pb)
+                    # send any records that were added in previous send
+                    while not sm._record_q.empty():
+                        data = sm._record_q.get(block=True)
+                        sm.send(data)
+
+                    if pb.control.req_resp:
+                        result = sm._result_q.get(block=True)
+                        result_type = result.WhichOneof("result_type")
+                        if not shown and result_type == "run_result":
+                            r = result.run_result.run
+                            # TODO(jhr): hardcode until we have settings in sync
+                            url = "{}/{}/{}/runs/{}".format(
+                                self._app_url,
+                                url_quote(r.entity),
+                                url_quote(r.project),
+                                url_quote(r.run_id),
+                            )
+                            print("Syncing: {} ... ".format(url), end="")  # noqa: T201
+                            sys.stdout.flush()
+                            shown = True
+                sm.finish()
+            finally:
+                scanner.close()
             # Only mark synced if the run actually finished
             if self._mark_synced and not self._view and finished:
                 synced_file = f"{sync_item}{SYNCED_SUFFIX}"
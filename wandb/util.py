@@ -813,9 +813,76 @@ def json_dump_uncompressed(obj: Any, fp: IO[str], **kwargs: Any) -> None:
 
 def json_dumps_safer_history(obj: Any, **kwargs: Any) -> str:
     """Convert obj to json, with some extra encodable types, including histograms."""
+    if not kwargs:
+        encoder = history_scalar_encoder(obj)
+        if encoder is not None:
+            encoded = encoder(obj)
+            if encoded is not None:
+                return encoded
     return dumps(obj, cls=WandBHistoryJSONEncoder, **kwargs)
 
 
+def _encode_json_scalar(obj: Any) -> Optional[str]:
+    return dumps(obj)  # type: ignore[no-any-return]
+
+
+def _encode_numpy_scalar(obj: Any) -> Optional[str]:
+    return dumps(_numpy_generic_convert(obj))  # type: ignore[no-any-return]
+
+
+def _encode_pytorch_tensor(obj: Any) -> Optional[str]:
+    # only 0-d tensors are scalars, anything else needs the full encoder
+    if obj.dim() != 0:
+        return None
+    return dumps(obj.item())  # type: ignore[no-any-return]
+
+
+# Scalar encoders by concrete type, None for types without a fast path.
+_history_scalar_encoders: Dict[type, Optional[Callable[[Any], Optional[str]]]] = {
+    int: _encode_json_scalar,
+    float: _encode_json_scalar,
+    str: _encode_json_scalar,
+    bool: _encode_json_scalar,
+    type(None): _encode_json_scalar,
+}
+
+
+def history_scalar_encoder(obj: Any) -> Optional[Callable[[Any], Optional[str]]]:
+    """Return a fast encoder for scalar history values of obj's type.
+
+    The dispatch is cached by concrete type so that the typename checks
+    against numpy, torch, etc. only run the first time a type is seen.
+    Encoders return None when a particular value needs the full
+    WandBHistoryJSONEncoder, e.g. a torch tensor that is not 0-d.
+    """
+    obj_type = type(obj)
+    try:
+        return _history_scalar_encoders[obj_type]
+    except KeyError:
+        pass
+
+    encoder: Optional[Callable[[Any], Optional[str]]] = None
+    if isinstance(obj, (str, int, float)):
+        # subclasses such as numpy.float64 are encoded natively by json
+        encoder = _encode_json_scalar
+    elif np and isinstance(obj, np.generic):
+        # datetimes, strings and other non-numeric scalars need the full encoder
+        if obj.dtype.kind in "biufc":
+            encoder = _encode_numpy_scalar
+    elif is_pytorch_tensor_typename(get_full_typename(obj)):
+        encoder = _encode_pytorch_tensor
+    _history_scalar_encoders[obj_type] = encoder
+    return encoder
+
+
+def is_history_scalar(obj: Any) -> bool:
+    """Return whether obj is a scalar that history_scalar_encoder encodes."""
+    encoder = history_scalar_encoder(obj)
+    if encoder is _encode_pytorch_tensor:
+        return obj.dim() == 0  # type: ignore[no-any-return]
+    return encoder is not None
+
+
 def make_json_if_not_number(
     v: Union[int, float, str, Mapping, Sequence],
 ) -> Union[int, float, str]: